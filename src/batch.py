@@ -0,0 +1,95 @@
+import os
+import copy
+import multiprocessing
+import math
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import List, NamedTuple, Optional, Sequence
+from raster import OffscreenRenderer, save_image
+from shared import shared_geometry
+
+
+class CameraPose(NamedTuple):
+    """Orbit state of the camera around its target (radians), as set by Camera.orbit and Camera.roll."""
+    theta: float
+    phi: float
+    radius: float
+    roll: float = 0.0
+
+    def apply(self, cam) -> None:
+        cam.theta, cam.phi, cam.radius = self.theta, self.phi, self.radius
+        cam.rotation[2] = self.roll
+        cam.update()
+
+
+def turntable_poses(frames: int, theta_start: float = 0.0, theta_end: float = 2 * math.pi,
+                    phi: float = 0.0, radius: float = 5.0, roll: float = 0.0) -> List[CameraPose]:
+    """
+    Evenly spaced poses from theta_start towards theta_end. theta_end itself is left out,
+    so a full turn loops without repeating the first frame.
+    """
+    return [CameraPose(float(theta), phi, radius, roll)
+            for theta in np.linspace(theta_start, theta_end, frames, endpoint=False)]
+
+
+# ------------------------------- #
+
+# Worker processes get the object, camera and renderer once, then only receive poses
+
+_state = {}
+
+
+def _init_worker(obj, cam, renderer) -> None:
+    if multiprocessing.parent_process() is not None and hasattr(renderer, "workers"):
+        # Frames are already spread over processes; a renderer pool per worker would mean cpu_count ** 2 of them
+        renderer.workers = 1
+    _state.update(obj=obj, cam=cam, renderer=renderer)
+
+
+def _render_frame(job) -> str:
+    pose, path = job
+    obj, cam, renderer = _state["obj"], _state["cam"], _state["renderer"]
+    pose.apply(cam)
+    if hasattr(obj, "drawable_objects"):
+        image = renderer.render_scene(obj, cam)
+    else:
+        image = renderer.render(obj, cam)
+    save_image(path, image)
+    return path
+
+
+def render_sequence(obj, cam, poses: Sequence[CameraPose], pattern: str = "frame_{:04d}.png",
+                    renderer=None, workers: Optional[int] = None, share_geometry: bool = False) -> List[str]:
+    """
+    Renders one frame per pose offscreen and writes it to pattern.format(frame index).
+    obj is an Object3D or a Scene; renderer defaults to a wireframe OffscreenRenderer the size of the camera
+    (any picklable renderer with render/render_scene works, solid.SolidRenderer included). Frames are independent,
+    so they are spread over a process pool of `workers` (default: one per CPU); workers <= 1 renders in this
+    process. Inside the pool, a renderer with its own `workers` setting (SolidRenderer) is switched to 1,
+    so each frame is rasterized in its worker process without nesting another pool.
+    With share_geometry, the meshes are placed in shared memory (see shared.SharedGeometry) so the workers map
+    one copy instead of each unpickling its own. The camera passed in is not modified.
+    Returns the written paths in frame order.
+    """
+    if renderer is None:
+        renderer = OffscreenRenderer(cam.width, cam.height)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    paths = [pattern.format(i) for i in range(len(poses))]
+    for directory in {os.path.dirname(path) for path in paths}:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    jobs = list(zip(poses, paths))
+
+    if workers <= 1 or len(jobs) <= 1:
+        _init_worker(obj, copy.deepcopy(cam), renderer)
+        try:
+            return list(map(_render_frame, jobs))
+        finally:
+            _state.clear()
+
+    with shared_geometry(obj) if share_geometry else nullcontext():
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(obj, cam, renderer)) as pool:
+            return list(pool.map(_render_frame, jobs, chunksize=max(1, len(jobs) // (4 * workers))))
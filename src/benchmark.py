@@ -0,0 +1,241 @@
+import os
+import sys
+import json
+import atexit
+import shutil
+import tempfile
+import math
+import time
+import timeit
+import argparse
+import platform
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from object import Object3D
+from camera import Camera
+from pipeline import Pipeline
+from raster import OffscreenRenderer
+from mesh_io import load_mesh, read_obj
+
+DEFAULT_SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def make_sphere(vertex_count: int, radius: float = 1.0) -> Object3D:
+    """Procedural UV sphere with about vertex_count vertices, grid edges and quad faces."""
+    rows = max(2, int(round(math.sqrt(vertex_count / 2))))
+    cols = max(3, int(round(vertex_count / rows)))
+    theta, phi = np.meshgrid(np.linspace(0.05, np.pi - 0.05, rows),
+                             np.linspace(0, 2 * np.pi, cols, endpoint=False), indexing="ij")
+    vertices = np.column_stack((
+        radius * np.sin(theta).ravel() * np.cos(phi).ravel(),
+        radius * np.cos(theta).ravel(),
+        radius * np.sin(theta).ravel() * np.sin(phi).ravel(),
+        np.ones(rows * cols),
+    ))
+
+    index = np.arange(rows * cols).reshape(rows, cols)
+    nxt = np.roll(index, -1, axis=1)
+    edges = np.concatenate((
+        np.column_stack((index.ravel(), nxt.ravel())),               # around each ring
+        np.column_stack((index[:-1].ravel(), index[1:].ravel())),    # between rings
+    ))
+    faces = np.stack((index[:-1], index[1:], nxt[1:], nxt[:-1]), axis=-1).reshape(-1, 4)
+    return Object3D(vertices, edges, faces=faces)
+
+
+def write_obj(path: str, obj: Object3D) -> None:
+    """Writes the object's local vertices and faces as a plain OBJ file."""
+    faces = obj.get_faces()
+    with open(path, "w") as f:
+        np.savetxt(f, obj.vertices[:, :3], fmt="v %.6f %.6f %.6f")
+        np.savetxt(f, faces + 1, fmt="f" + " %d" * faces.shape[1])
+
+
+def _temporary_obj(obj: Object3D) -> str:
+    directory = tempfile.mkdtemp(prefix="benchmark-")
+    atexit.register(shutil.rmtree, directory, True)
+    path = os.path.join(directory, "sphere.obj")
+    write_obj(path, obj)
+    return path
+
+
+# ------------------------------- #
+
+# Cases: each builds its state once and returns the function being timed
+
+def _case_transform(obj: Object3D, cam: Camera) -> Callable[[], None]:
+    def run():
+        obj.yaw(0.01)
+        obj.get_vertices()
+    return run
+
+
+def _case_view_matrix(obj: Object3D, cam: Camera) -> Callable[[], None]:
+    def run():
+        cam.invalidate()
+        cam.get_view_matrix()
+    return run
+
+
+def _case_projection(obj: Object3D, cam: Camera) -> Callable[[], None]:
+    vertices = obj.get_vertices()
+    return lambda: cam.project_to_clip(vertices)
+
+
+def _case_window_to_viewport(obj: Object3D, cam: Camera) -> Callable[[], None]:
+    ndc = np.random.default_rng(0).uniform(-1, 1, (len(obj.vertices), 2))
+    return lambda: cam.window_to_viewport(ndc[:, 0], ndc[:, 1])
+
+
+def _case_draw(obj: Object3D, cam: Camera) -> Callable[[], None]:
+    # Everything CanvasRenderer.draw does before talking to Tk, while orbiting (re-projects from world space)
+    pipeline = Pipeline(obj)
+
+    def run():
+        cam.orbit(d_theta=0.01)
+        pipeline.coords(cam, all_planes=True)
+    return run
+
+
+def _case_draw_cold(obj: Object3D, cam: Camera) -> Callable[[], None]:
+    # No cached stage at all, as for the first frame of an object
+    return lambda: Pipeline(obj).coords(cam, all_planes=True)
+
+
+def _case_draw_viewport(obj: Object3D, cam: Camera) -> Callable[[], None]:
+    # Only the viewport changes: the cached NDC polylines just go through the 2D mapping again
+    pipeline = Pipeline(obj)
+    pipeline.coords(cam, all_planes=True)
+    width, height = cam.width, cam.height
+
+    def run():
+        cam.set_viewport(0, width, height, 0) if cam.yminv == 0 else cam.set_viewport(0, width, 0, height)
+        pipeline.coords(cam, all_planes=True)
+    return run
+
+
+def _case_load_obj(obj: Object3D, cam: Camera) -> Callable[[], None]:
+    # First open of a mesh: the text is parsed, no .npy sidecar involved
+    path = _temporary_obj(obj)
+    return lambda: read_obj(path)
+
+
+def _case_load_cached(obj: Object3D, cam: Camera) -> Callable[[], None]:
+    # Later opens: the sidecar cache written by the first load_mesh is memory-mapped
+    path = _temporary_obj(obj)
+    load_mesh(path)
+    return lambda: load_mesh(path)
+
+
+def _case_render_offscreen(obj: Object3D, cam: Camera) -> Callable[[], None]:
+    renderer = OffscreenRenderer(cam.width, cam.height)
+
+    def run():
+        cam.orbit(d_theta=0.01)
+        renderer.render(obj, cam)
+    return run
+
+
+CASES: Dict[str, Callable[[Object3D, Camera], Callable[[], None]]] = {
+    "transform": _case_transform,
+    "view_matrix": _case_view_matrix,
+    "projection": _case_projection,
+    "window_to_viewport": _case_window_to_viewport,
+    "draw": _case_draw,
+    "draw_cold": _case_draw_cold,
+    "draw_viewport": _case_draw_viewport,
+    "render_offscreen": _case_render_offscreen,
+    "load_obj": _case_load_obj,
+    "load_cached": _case_load_cached,
+}
+
+
+def time_call(fn: Callable[[], None], repeat: int = 5) -> float:
+    """Best seconds per call over `repeat` rounds, each long enough (timeit.autorange) to be measurable."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_benchmarks(sizes: Sequence[int] = DEFAULT_SIZES, repeat: int = 5,
+                   only: Optional[str] = None, verbose: bool = True) -> Dict[str, float]:
+    """Times every case on every mesh size; returns {"case@size": seconds per call}."""
+    results = {}
+    for size in sizes:
+        obj = make_sphere(size)
+        for name, build in CASES.items():
+            key = f"{name}@{size}"
+            if only and only not in key:
+                continue
+            cam = Camera()
+            cam.orbit(0.3, 0.3)
+            results[key] = time_call(build(obj, cam), repeat)
+            if verbose:
+                print(f"{key:32s} {results[key] * 1e3:12.4f} ms", flush=True)
+    return results
+
+
+# ------------------------------- #
+
+# Baselines
+
+def save_baseline(path: str, results: Dict[str, float]) -> None:
+    data = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> Dict[str, float]:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float = 0.2) -> List[Tuple[str, float, float, float]]:
+    """Cases present in both runs that got slower than baseline * (1 + threshold), as (key, old, new, ratio)."""
+    slower = []
+    for key, new in results.items():
+        old = baseline.get(key)
+        if old and new / old > 1 + threshold:
+            slower.append((key, old, new, new / old))
+    return slower
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks the Object3D/Camera pipeline on procedural meshes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="mesh vertex counts")
+    parser.add_argument("--repeat", type=int, default=5, help="rounds per case (the best one is kept)")
+    parser.add_argument("--only", help="run only cases whose 'name@size' contains this text")
+    parser.add_argument("--save", metavar="JSON", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="JSON", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown reported as a regression (default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.repeat, args.only)
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"Baseline saved to {args.save}")
+
+    if args.compare:
+        slower = compare(results, load_baseline(args.compare), args.threshold)
+        if not slower:
+            print(f"No regressions beyond {args.threshold:.0%}.")
+            return 0
+        print(f"{len(slower)} regression(s) beyond {args.threshold:.0%}:")
+        for key, old, new, ratio in slower:
+            print(f"  {key:32s} {old * 1e3:10.4f} ms -> {new * 1e3:10.4f} ms  ({ratio:.2f}x)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
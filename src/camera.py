@@ -18,8 +18,12 @@ class Camera:
                  target: np.ndarray = np.array([.0, .0, .0]),
                  projection: ProjectionType = ProjectionType.PERSPECTIVE,
                  f: float = np.pi/4, width: int = 800, height: int = 600,
-                 near: float = 0.1, far: float = 1000):
-        """Initializes the Camera with position, rotation (in radians), target, projection type, and other parameters."""
+                 near: float = 0.1, far: float = 1000, dtype=np.float64):
+        """
+        Initializes the Camera with position, rotation (in radians), target, projection type, and other parameters.
+        dtype is the precision of the returned matrices and projected coordinates (built in float64, then cast).
+        """
+        self.dtype = np.dtype(dtype)
         
         self.position = np.array([x, y, z], dtype=float)
         self.rotation = np.array([pitch, yaw, roll], dtype=float) 
@@ -47,6 +51,17 @@ class Camera:
         self.theta = 0.0  # angle around Y axis
         self.phi = 0.0    # angle from XZ plane
 
+        # Cached matrices, rebuilt lazily after invalidate()
+        # version changes on every edit; the per-stage versions only when that stage's inputs change
+        self.version = 0
+        self.view_version = 0        # position, target, rotation
+        self.projection_version = 0  # projection type and parameters (the window, for the orthographic one)
+        self.window_version = 0
+        self.viewport_version = 0
+        self._view_matrix = None
+        self._projection_matrix = None
+        self._view_projection_matrix = None
+
 
     def set_perspective_params(self, fov_degrees, near, far):
         """Define os parâmetros para a projeção perspectiva."""
@@ -54,6 +69,7 @@ class Camera:
         self.near = near
         self.far = far
         self.projection = ProjectionType.PERSPECTIVE
+        self.invalidate(view=False, window=False, viewport=False)
         print(f"Projeção alterada para Perspectiva (FoV={fov_degrees}°, Near={near}, Far={far}).")
 
 
@@ -64,12 +80,37 @@ class Camera:
         self.yminw = bottom
         self.ymaxw = top
         self.projection = ProjectionType.ORTHOGRAPHIC
+        self.invalidate(view=False, viewport=False)
         print(f"Projeção alterada para Paralela (L={left}, R={right}, B={bottom}, T={top}).")
 
 
     
     def reset(self):
-        self.__init__(width=self.width, height=self.height)
+        versions = (self.version, self.view_version, self.projection_version, self.window_version, self.viewport_version)
+        self.__init__(width=self.width, height=self.height, dtype=self.dtype)
+        # Keep the versions monotonic so downstream caches notice the reset
+        self.version, self.view_version, self.projection_version, self.window_version, self.viewport_version = versions
+        self.invalidate()
+
+    def invalidate(self, view: bool = True, projection: bool = True, window: bool = True, viewport: bool = True) -> None:
+        """
+        Drops the cached view/projection matrices and bumps the version counters.
+        Every setter calls this, flagging only what it changed; call it yourself (with no arguments)
+        after mutating camera attributes directly.
+        """
+        self.version += 1
+        if view:
+            self.view_version += 1
+            self._view_matrix = None
+        if projection:
+            self.projection_version += 1
+            self._projection_matrix = None
+        if view or projection:
+            self._view_projection_matrix = None
+        if window:
+            self.window_version += 1
+        if viewport:
+            self.viewport_version += 1
         
     # Getters
      
@@ -86,8 +127,14 @@ class Camera:
     def get_view_matrix(self) -> np.ndarray:
         """
         Returns the camera view matrix by applying translation and rotation. If target is set, it functions as a lookAt.
+        The matrix is cached (read-only) until the camera changes.
         """
-        
+        if self._view_matrix is None:
+            self._view_matrix = self._build_view_matrix().astype(self.dtype)
+            self._view_matrix.flags.writeable = False
+        return self._view_matrix
+
+    def _build_view_matrix(self) -> np.ndarray:
         if self.target is not None:
             forward = self.normalize(self.target - self.position)
         else:
@@ -123,41 +170,59 @@ class Camera:
     
     # Projection methods
     
-    def set_projection(self, projection: ProjectionType) -> None: self.projection = projection
+    def set_projection(self, projection: ProjectionType) -> None:
+        self.projection = projection
+        self.invalidate(view=False, window=False, viewport=False)
 
     def toggle_projection(self) -> None:
         if self.projection == ProjectionType.PERSPECTIVE:
             self.projection = ProjectionType.ORTHOGRAPHIC
         else:
             self.projection = ProjectionType.PERSPECTIVE
+        self.invalidate(view=False, window=False, viewport=False)
 
-    def project_vertex(self, v):
-        """Projects a 3D vertex to 2D screen coordinates using the camera's view and projection matrices."""
-        v_cam = v @ self.get_view_matrix().T
+    def get_projection_matrix(self) -> np.ndarray:
+        """Returns the perspective or orthographic projection matrix for the current projection type (cached, read-only)."""
+        if self._projection_matrix is None:
+            self._projection_matrix = self._build_projection_matrix().astype(self.dtype)
+            self._projection_matrix.flags.writeable = False
+        return self._projection_matrix
+
+    def get_view_projection_matrix(self) -> np.ndarray:
+        """Returns the combined projection @ view matrix (cached, read-only)."""
+        if self._view_projection_matrix is None:
+            # Multiplied in float64 so float32 cameras only round once
+            matrix = self._build_projection_matrix() @ self._build_view_matrix()
+            self._view_projection_matrix = matrix.astype(self.dtype)
+            self._view_projection_matrix.flags.writeable = False
+        return self._view_projection_matrix
 
-        # Projection matrix
+    def _build_projection_matrix(self) -> np.ndarray:
         if self.projection == ProjectionType.PERSPECTIVE:
             f = 1 / np.tan(self.f / 2)
             near, far = self.near, self.far
-            P = np.array([
+            return np.array([
                 [f, 0, 0, 0],
                 [0, f, 0, 0],
                 [0, 0, (far+near)/(near-far), 2*far*near/(near-far)],
                 [0, 0, -1, 0]
             ])
-        else:
-            # Orthographic projection
-            l, r = self.xminw, self.xmaxw
-            b, t = self.yminw, self.ymaxw
-            n, f = self.near, self.far
-            P = np.array([
-                [2/(r-l), 0, 0, -(r+l)/(r-l)],
-                [0, 2/(t-b), 0, -(t+b)/(t-b)],
-                [0, 0, 2/(n-f), -(f+n)/(f-n)],
-                [0, 0, 0, 1]
-            ])
 
-        v_proj = v_cam @ P.T
+        # Orthographic projection
+        l, r = self.xminw, self.xmaxw
+        b, t = self.yminw, self.ymaxw
+        n, f = self.near, self.far
+        return np.array([
+            [2/(r-l), 0, 0, -(r+l)/(r-l)],
+            [0, 2/(t-b), 0, -(t+b)/(t-b)],
+            [0, 0, 2/(n-f), -(f+n)/(f-n)],
+            [0, 0, 0, 1]
+        ])
+
+    def project_vertex(self, v):
+        """Projects a 3D vertex to 2D screen coordinates using the camera's view and projection matrices."""
+        v_cam = v @ self.get_view_matrix().T
+        v_proj = v_cam @ self.get_projection_matrix().T
 
         # Convert to NDC
         v_ndc = v_proj[:3] / -(v_proj[3] if v_proj[3] != 0 else 1e-5)
@@ -167,6 +232,46 @@ class Camera:
 
         return x_pixel, y_pixel
 
+    def project_vertices(self, vertices: np.ndarray) -> np.ndarray:
+        """
+        Projects a whole (N, 4) array of homogeneous vertices to an (N, 2) array of viewport pixels in one pass.
+        Same result as calling project_vertex on every row, without the per-vertex matrix rebuilds.
+        """
+        return self.clip_to_viewport(self.project_to_clip(vertices))
+
+    def project_to_clip(self, vertices: np.ndarray) -> np.ndarray:
+        """Applies the view and projection matrices to (N, 4) vertices, returning (N, 4) clip-space coordinates."""
+        vertices = np.asarray(vertices, dtype=self.dtype)
+        return vertices @ self.get_view_projection_matrix().T
+
+    def project_instances_to_clip(self, vertices: np.ndarray, model_matrices: np.ndarray) -> np.ndarray:
+        """
+        Projects one shared (N, 4) vertex array with a (K, 4, 4) stack of model matrices in a single
+        broadcast matmul, returning (K, N, 4) clip-space coordinates.
+        """
+        mvp = self.get_view_projection_matrix() @ np.asarray(model_matrices, dtype=self.dtype).reshape(-1, 4, 4)
+        return np.asarray(vertices, dtype=self.dtype) @ mvp.transpose(0, 2, 1)
+
+    def project_instances(self, vertices: np.ndarray, model_matrices: np.ndarray) -> np.ndarray:
+        """Projects K instances of (N, 4) vertices to a (K, N, 2) array of viewport pixels."""
+        clip = self.project_instances_to_clip(vertices, model_matrices)
+        return self.clip_to_viewport(clip.reshape(-1, 4)).reshape(clip.shape[0], clip.shape[1], 2)
+
+    def clip_to_viewport(self, v_proj: np.ndarray) -> np.ndarray:
+        """Perspective divide and window-to-viewport mapping of (N, 4) clip-space coordinates to (N, 2) pixels."""
+        return self.ndc_to_viewport(self.perspective_divide(v_proj))
+
+    def perspective_divide(self, v_proj: np.ndarray) -> np.ndarray:
+        """(N, 2) NDC x, y of (N, 4) clip-space coordinates, with the same w == 0 guard as project_vertex."""
+        w = v_proj[:, 3]
+        w = np.where(w != 0, w, 1e-5)
+        return v_proj[:, :2] / -w[:, None]
+
+    def ndc_to_viewport(self, v_ndc: np.ndarray) -> np.ndarray:
+        """Maps (N, 2) NDC coordinates to (N, 2) viewport pixels."""
+        x_pixel, y_pixel = self.window_to_viewport(v_ndc[:, 0], v_ndc[:, 1])
+        return np.column_stack((x_pixel, y_pixel))
+
 
     # ------------------------------- #
 
@@ -177,12 +282,15 @@ class Camera:
         
         self.xminv, self.xmaxv = xminv, xmaxv
         self.yminv, self.ymaxv = yminv, ymaxv
+        self.invalidate(view=False, projection=False, window=False)
 
     def set_window(self, xminw, xmaxw, yminw, ymaxw):
         """Define the window bounds in normalized coordinates."""
         
         self.xminw, self.xmaxw = xminw, xmaxw
         self.yminw, self.ymaxw = yminw, ymaxw
+        # The orthographic matrix is built from the window; the perspective one is not
+        self.invalidate(view=False, projection=self.projection == ProjectionType.ORTHOGRAPHIC, viewport=False)
     
     def window_to_viewport(self, xw, yw):
         """Convert window (NDC) coordinates to viewport pixel coordinates. xw, yw are in the ranges [xminw, xmaxw] and [yminw, ymaxw]."""
@@ -210,6 +318,7 @@ class Camera:
         self.position[0] = self.target[0] + self.radius * math.cos(self.phi) * math.sin(self.theta)
         self.position[1] = self.target[1] + self.radius * math.sin(self.phi)
         self.position[2] = self.target[2] + self.radius * math.cos(self.phi) * math.cos(self.theta)
+        self.invalidate(projection=False, window=False, viewport=False)
 
     def orbit(self, d_theta=0.0, d_phi=0.0, d_radius=0.0):
         """Orbit the camera around the target by changing theta, phi, and radius."""
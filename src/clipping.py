@@ -0,0 +1,223 @@
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+from object import box_corners
+from camera import ProjectionType
+
+# Clip-space planes as (a, b, c, d): a point c = (x, y, z, w) is inside when a*x + b*y + c*z + d*w >= 0.
+NEAR_PLANE = (0.0, 0.0, 1.0, 1.0)
+FAR_PLANE = (0.0, 0.0, -1.0, 1.0)
+
+
+def frustum_planes(cam, all_planes: bool = False) -> np.ndarray:
+    """
+    Returns the clip planes for the camera: the near plane only, or all six.
+    The side planes follow the window bounds, so whatever survives clipping is exactly what maps into the viewport
+    (the camera's NDC is clip / -w, hence the signs).
+    """
+    if not all_planes:
+        return np.array([NEAR_PLANE], dtype=cam.dtype)
+    return np.array([
+        NEAR_PLANE,
+        FAR_PLANE,
+        (-1.0, 0.0, 0.0, -cam.xminw),  # -x/w >= xminw
+        (1.0, 0.0, 0.0, cam.xmaxw),    # -x/w <= xmaxw
+        (0.0, -1.0, 0.0, -cam.yminw),  # -y/w >= yminw
+        (0.0, 1.0, 0.0, cam.ymaxw),    # -y/w <= ymaxw
+    ], dtype=cam.dtype)
+
+
+def inside_mask(clip: np.ndarray, planes: np.ndarray) -> np.ndarray:
+    """(N,) mask of the clip-space points that are inside every plane."""
+    return np.all(clip @ planes.T >= 0, axis=1)
+
+
+def boxes_in_frustum(cam, bounds: np.ndarray, all_planes: bool = True) -> np.ndarray:
+    """
+    (K,) mask of the world-space boxes (K, 2, 3) that may be visible. A box is culled when all of its
+    8 corners are outside the same plane; boxes straddling a frustum corner may be kept (conservative).
+    """
+    bounds = np.asarray(bounds, dtype=float).reshape(-1, 2, 3)
+    clip = box_corners(bounds) @ cam.get_view_projection_matrix().T
+    distances = clip @ frustum_planes(cam, all_planes).T
+    return ~np.any(np.all(distances < 0, axis=1), axis=1)
+
+
+def clip_segments(c0: np.ndarray, c1: np.ndarray, planes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Clips (M, 4) clip-space segments against the planes (homogeneous Liang-Barsky), before any perspective divide.
+    Returns the clipped endpoints of the surviving segments and the (M,) mask of which segments survived.
+    """
+    d0 = c0 @ planes.T
+    d1 = c1 @ planes.T
+    keep = ~np.any((d0 < 0) & (d1 < 0), axis=1)
+
+    d0, d1, c0, c1 = d0[keep], d1[keep], c0[keep], c1[keep]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = d0 / (d0 - d1)
+    t0 = np.max(np.where(d0 < 0, t, 0.0), axis=1, initial=0.0)
+    t1 = np.min(np.where(d1 < 0, t, 1.0), axis=1, initial=1.0)
+
+    # Crossing two planes outside of the frustum's corner still rejects the segment
+    crossing = t0 <= t1
+    keep[keep] = crossing
+    c0, c1, t0, t1 = c0[crossing], c1[crossing], t0[crossing], t1[crossing]
+    d = c1 - c0
+    return c0 + t0[:, None] * d, c0 + t1[:, None] * d, keep
+
+
+def project_edges(cam, vertices: np.ndarray, edges: np.ndarray,
+                  all_planes: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Projects (E, 2) edges to pixel-space segments, clipping them in clip space first.
+    Edges fully outside are dropped; returns the (M, 2) start and end points.
+    """
+    return clip_edges(cam, cam.project_to_clip(vertices), edges, all_planes)
+
+
+def clip_edges(cam, clip: np.ndarray, edges: np.ndarray,
+               all_planes: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Same as project_edges, for vertices already in clip space."""
+    edges = np.asarray(edges).reshape(-1, 2)
+    c0, c1, _ = clip_segments(clip[edges[:, 0]], clip[edges[:, 1]], frustum_planes(cam, all_planes))
+    return cam.clip_to_viewport(c0), cam.clip_to_viewport(c1)
+
+
+def project_strips(cam, vertices: np.ndarray, strips: Sequence[np.ndarray],
+                   all_planes: bool = False, keep: Optional[np.ndarray] = None) -> List[np.ndarray]:
+    """
+    Projects edge strips (see Object3D.get_edge_strips) to pixel-space polylines, clipping in clip space.
+    Runs of edges whose vertices are all inside stay as polylines; edges that need clipping come back
+    as clipped two-point polylines and edges fully outside are dropped.
+    keep optionally masks the edges of the concatenated strips (aligned with Object3D.get_strip_edge_ids).
+    """
+    if len(strips) == 0:
+        return []
+    return clip_strips(cam, cam.project_to_clip(vertices), strips, all_planes, keep)
+
+
+def clip_strips(cam, clip: np.ndarray, strips: Sequence[np.ndarray],
+                all_planes: bool = False, keep: Optional[np.ndarray] = None,
+                pixels: Optional[np.ndarray] = None, ndc: bool = False) -> List[np.ndarray]:
+    """
+    Same as project_strips, for vertices already in clip space.
+    With ndc, the polylines stop at NDC (cam.perspective_divide) instead of viewport pixels.
+    pixels optionally passes the mapped vertices (cam.clip_to_viewport(clip), or the NDC with ndc)
+    when the caller has already computed them.
+    """
+    if len(strips) == 0:
+        return []
+
+    to_screen = cam.perspective_divide if ndc else cam.clip_to_viewport
+    planes = frustum_planes(cam, all_planes)
+    safe = inside_mask(clip, planes)
+    if pixels is None:
+        pixels = to_screen(clip)
+
+    # Fast path: nothing needs clipping or masking
+    if keep is None and safe.all():
+        return [pixels[strip] for strip in strips]
+
+    # Flatten the strips; an "edge" i joins seq[i] and seq[i + 1] inside the same strip
+    seq = np.concatenate(strips)
+    lengths = np.array([len(strip) for strip in strips])
+    valid = np.ones(len(seq) - 1, dtype=bool)
+    valid[np.cumsum(lengths)[:-1] - 1] = False
+    if keep is not None:
+        valid &= keep
+    safe_edge = valid & safe[seq[:-1]] & safe[seq[1:]]
+
+    # Runs of consecutive safe edges stay as polylines
+    padded = np.concatenate(([False], safe_edge, [False])).astype(np.int8)
+    run_starts = np.flatnonzero(np.diff(padded) == 1)
+    run_ends = np.flatnonzero(np.diff(padded) == -1)
+    polylines = [pixels[seq[a:b + 1]] for a, b in zip(run_starts.tolist(), run_ends.tolist())]
+
+    # Everything else is clipped edge by edge
+    unsafe = np.flatnonzero(valid & ~safe_edge)
+    c0, c1, _ = clip_segments(clip[seq[unsafe]], clip[seq[unsafe + 1]], planes)
+    segments = np.stack((to_screen(c0), to_screen(c1)), axis=1)
+    polylines.extend(segments)
+    return polylines
+
+
+def front_facing(cam, vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """
+    (F,) mask of the faces whose counter-clockwise side points at the camera, tested in camera space:
+    towards the eye at the origin for perspective, towards +z for the orthographic projection.
+    """
+    if len(faces) == 0:
+        return np.zeros(0, dtype=bool)
+    eye = np.asarray(vertices, dtype=cam.dtype) @ cam.get_view_matrix().T
+    a, b, c = eye[faces[:, 0], :3], eye[faces[:, 1], :3], eye[faces[:, 2], :3]
+    normal = np.cross(b - a, c - a)
+    if cam.projection == ProjectionType.PERSPECTIVE:
+        return np.einsum("ij,ij->i", normal, -a) > 0
+    return normal[:, 2] > 0
+
+
+def front_edge_mask(cam, obj, vertices: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    (E,) mask of the object's edges that belong to at least one front-facing face.
+    Edges that are not on any face (loose lines) are always kept.
+    vertices overrides the object's world-space vertices (obj.get_vertices()).
+    """
+    edge_ids, face_ids = obj.get_edge_faces()
+    keep = np.ones(len(obj.get_edges()), dtype=bool)
+    keep[edge_ids] = False
+    front = front_facing(cam, obj.get_vertices() if vertices is None else vertices, obj.get_faces())
+    keep[edge_ids[front[face_ids]]] = True
+    return keep
+
+
+def strip_keep_mask(cam, obj, cull_back_faces: bool = False,
+                    vertices: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+    """The keep mask project_strips needs to skip the object's back-face-only edges, or None to keep them all."""
+    if not cull_back_faces or len(obj.get_faces()) == 0:
+        return None
+    ids = obj.get_strip_edge_ids()
+    return (ids >= 0) & front_edge_mask(cam, obj, vertices)[np.maximum(ids, 0)]
+
+
+def project_object_strips(cam, obj, all_planes: bool = False, cull_back_faces: bool = False) -> List[np.ndarray]:
+    """project_strips for an Object3D, optionally dropping edges that only belong to back faces."""
+    keep = strip_keep_mask(cam, obj, cull_back_faces)
+    return project_strips(cam, obj.get_vertices(), obj.get_edge_strips(), all_planes, keep)
+
+
+def project_object_edges(cam, obj, all_planes: bool = False,
+                         cull_back_faces: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """project_edges for an Object3D, optionally dropping edges that only belong to back faces."""
+    edges = obj.get_edges()
+    if cull_back_faces and len(obj.get_faces()):
+        edges = edges[front_edge_mask(cam, obj)]
+    return project_edges(cam, obj.get_vertices(), edges, all_planes)
+
+
+def _visible_instances(cam, instanced, all_planes: bool) -> np.ndarray:
+    matrices = instanced.get_model_matrices()
+    if len(matrices) == 0:
+        return matrices
+    return matrices[boxes_in_frustum(cam, instanced.get_bounds(), all_planes)]
+
+
+def project_instance_edges(cam, instanced, all_planes: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Projects every instance of an InstancedObject in one batch (culled instances skipped) and returns
+    the pixel-space segments of all their edges, like project_edges.
+    """
+    mesh = instanced.mesh
+    matrices = _visible_instances(cam, instanced, all_planes)
+    clip = cam.project_instances_to_clip(mesh.vertices, matrices).reshape(-1, 4)
+    offsets = np.arange(len(matrices)) * len(mesh.vertices)
+    edges = mesh.get_edges()[None, :, :] + offsets[:, None, None]
+    return clip_edges(cam, clip, edges.reshape(-1, 2), all_planes)
+
+
+def project_instance_strips(cam, instanced, all_planes: bool = False) -> List[np.ndarray]:
+    """Same as project_instance_edges, returning pixel-space polylines like project_strips."""
+    mesh = instanced.mesh
+    matrices = _visible_instances(cam, instanced, all_planes)
+    clip = cam.project_instances_to_clip(mesh.vertices, matrices).reshape(-1, 4)
+    n = len(mesh.vertices)
+    strips = [strip + k * n for k in range(len(matrices)) for strip in mesh.get_edge_strips()]
+    return clip_strips(cam, clip, strips, all_planes)
@@ -0,0 +1,88 @@
+import numpy as np
+from typing import List, Optional, Tuple
+from object import Object3D, box_corners
+from mesh_io import unique_edges
+
+
+def simplify_vertex_clustering(vertices: np.ndarray, edges: np.ndarray, resolution: int,
+                               bounds: Optional[np.ndarray] = None,
+                               faces: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simplifies a wireframe by snapping vertices to a uniform grid with `resolution` cells along the
+    longest side of the bounding box. Vertices of a cell merge into their mean; edges and faces are remapped,
+    and collapsed or duplicated edges (and collapsed faces) removed.
+    """
+    xyz = np.asarray(vertices, dtype=float)[:, :3]
+    if bounds is None:
+        bounds = np.array([xyz.min(axis=0), xyz.max(axis=0)])
+    low, high = bounds
+    cell = max(float((high - low).max()) / resolution, 1e-12)
+
+    cells = np.clip(np.floor((xyz - low) / cell).astype(np.int64), 0, resolution)
+    side = resolution + 1
+    keys = cells[:, 0] + side * (cells[:, 1] + side * cells[:, 2])
+    _, cluster = np.unique(keys, return_inverse=True)
+    cluster = cluster.ravel()
+
+    count = np.bincount(cluster)
+    merged = np.ones((len(count), 4))
+    for axis in range(3):
+        merged[:, axis] = np.bincount(cluster, weights=xyz[:, axis]) / count
+
+    if faces is None or len(faces) == 0:
+        faces = np.zeros((0, 3), dtype=np.int32)
+    else:
+        faces = cluster[np.asarray(faces, dtype=np.int64)]
+        distinct = np.all(faces != np.roll(faces, -1, axis=1), axis=1)
+        faces = faces[distinct].astype(np.int32)
+
+    return merged, unique_edges(cluster[np.asarray(edges, dtype=np.int64)], len(merged)), faces
+
+
+class LODChain:
+    """
+    Progressively coarser versions of an Object3D, built once by vertex clustering. select() picks the
+    coarsest level whose grid cells stay under `pixels_per_cell` pixels once the object's box is projected
+    with the camera (window_to_viewport mapping included); level 0 is the object itself.
+    """
+
+    def __init__(self, obj: Object3D, levels: int = 6, coarsest_resolution: int = 8, pixels_per_cell: float = 2.0):
+        self.obj = obj
+        self.pixels_per_cell = pixels_per_cell
+        self.resolutions: List[float] = [np.inf]
+        self.levels: List[Object3D] = [obj]
+        self._synced = {}  # level index -> object version its model matrix was copied from
+
+        # Finest coarse level first, so each level simplifies the previous one
+        vertices, edges, faces = obj.vertices, obj.get_edges(), obj.get_faces()
+        bounds = obj.get_local_bounds()
+        for k in reversed(range(levels - 1)):
+            resolution = coarsest_resolution * 2 ** k
+            vertices, edges, faces = simplify_vertex_clustering(vertices, edges, resolution, bounds, faces)
+            # Stop adding levels that do not reduce the mesh enough to be worth drawing
+            if len(vertices) > 0.8 * len(self.levels[-1].vertices):
+                continue
+            self.resolutions.append(resolution)
+            self.levels.append(Object3D(vertices, edges, faces=faces, dtype=obj.dtype))
+
+    def projected_size(self, cam) -> float:
+        """Largest side, in viewport pixels, of the projected world-space box (inf when it crosses the near plane)."""
+        clip = box_corners(self.obj.get_bounds()) @ cam.get_view_projection_matrix().T
+        if np.any(clip[:, 2] + clip[:, 3] < 0):
+            return np.inf
+        pixels = cam.clip_to_viewport(clip)
+        return float((pixels.max(axis=0) - pixels.min(axis=0)).max())
+
+    def select(self, cam) -> Object3D:
+        """Returns the level to draw for this camera, with the base object's current world transform."""
+        size = self.projected_size(cam)
+        level = 0
+        for i, resolution in enumerate(self.resolutions):
+            if size / resolution <= self.pixels_per_cell:
+                level = i
+
+        chosen = self.levels[level]
+        if chosen is not self.obj and self._synced.get(level) != self.obj.version:
+            chosen.set_model_matrix(self.obj.get_world_matrix())
+            self._synced[level] = self.obj.version
+        return chosen
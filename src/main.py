@@ -7,11 +7,18 @@
 
 # main.py - Versão com Interface Gráfica (GUI)
 
+import sys
 import numpy as np
-import tkinter as tk
-from tkinter import ttk  # Usaremos para um estilo de widget melhor
 from object import Object3D
 from camera import Camera, ProjectionType
+from renderer import CanvasRenderer
+from scene import Scene
+from lod import LODChain
+from profiler import PipelineProfiler
+from scheduler import FrameScheduler
+from worker import ProjectionWorker
+from picking import Picker
+from clipping import frustum_planes, inside_mask, project_edges
 import math
 
 # --- FUNÇÕES HANDLER (A LÓGICA POR TRÁS DOS BOTÕES) ---
@@ -158,21 +165,151 @@ def apply_viewport_mapping():
     except ValueError:
         print("Erro: Entrada de Viewport inválida.")
 
+def toggle_back_face_culling():
+    renderer.cull_back_faces = cull_back_faces_var.get()
+    worker.cull_back_faces = renderer.cull_back_faces
+    draw()
+
+def toggle_profiler():
+    profiler.enabled = show_profiler_var.get()
+    profiler.clear()
+    canvas.itemconfigure(hud_item, text="")
+    draw()
+
+def toggle_memory_tracking():
+    profiler.set_track_memory(track_memory_var.get())
+    profiler.clear()
+    draw()
+
+def export_trace():
+    path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("Chrome trace", "*.json")])
+    if path:
+        profiler.export_chrome_trace(path)
+        print(f"Trace salvo em {path} (abra em chrome://tracing ou ui.perfetto.dev).")
+
 def exit_program():
     print("Encerrando o programa.")
+    worker.close()
     root.destroy()
 
 
 # --- FUNÇÃO DE DESENHO ---
 def draw():
-    canvas.delete("all")
-    verts = obj.get_vertices()
-    projected = [cam.project_vertex(v) for v in verts]
-    for edge in obj.get_edges():
-        p1 = projected[edge[0]]
-        p2 = projected[edge[1]]
-        canvas.create_line(p1[0], p1[1], p2[0], p2[1], fill="white")
-    root.update()
+    # Só marca a cena como suja: o FrameScheduler desenha no máximo uma vez por quadro
+    scheduler.request()
+
+def render_frame():
+    if not profiler.enabled:
+        # Projeção e recorte rodam na thread do worker; poll_worker só troca os buffers e atualiza o canvas
+        worker.submit(scene, cam)
+        if not worker_polling:
+            poll_worker()
+        return
+
+    # Com o profiler ligado desenha na thread do Tk, para medir cada etapa
+    # Reaproveita os itens do canvas (canvas.coords) em vez de apagar e recriar tudo
+    with profiler.frame():
+        renderer.draw_scene(scene, cam)
+    canvas.itemconfigure(hud_item, text=profiler.hud_text())
+    update_overlays()
+
+def update_overlays():
+    # Destaques e overlay de desempenho acompanham a câmera e ficam sempre acima das linhas
+    show_pick(hover_items, hovered)
+    show_pick(selected_items, selected)
+    canvas.tag_raise(hud_item)
+
+def poll_worker():
+    global worker_polling
+    worker_polling = False
+    coords = worker.swap()
+    if coords is not None:
+        renderer.draw_polylines(coords)
+        update_overlays()
+    # Continua verificando enquanto a thread tiver trabalho
+    if worker.pending():
+        worker_polling = True
+        root.after(WORKER_POLL_MS, poll_worker)
+
+# --- MOUSE: ARRASTAR ORBITA A CÂMERA, RODA DÁ ZOOM ---
+def start_drag(event):
+    global last_mouse, press_mouse
+    last_mouse = press_mouse = (event.x, event.y)
+
+def end_drag(event):
+    # Soltar o botão quase no mesmo lugar é um clique: seleciona o que estiver sob o cursor
+    if math.hypot(event.x - press_mouse[0], event.y - press_mouse[1]) <= CLICK_TOLERANCE:
+        select_at(event.x, event.y)
+
+def drag_orbit(event):
+    global last_mouse
+    dx, dy = event.x - last_mouse[0], event.y - last_mouse[1]
+    last_mouse = (event.x, event.y)
+    cam.orbit(d_theta=dx * ORBIT_RADIANS_PER_PIXEL, d_phi=dy * ORBIT_RADIANS_PER_PIXEL)
+    draw()
+
+def wheel_zoom(event):
+    # Windows/macOS: <MouseWheel> com delta; Linux/X11: botões 4 (cima) e 5 (baixo)
+    if event.num == 4 or event.delta > 0:
+        cam.orbit(d_radius=-ZOOM_STEP)
+    elif event.num == 5 or event.delta < 0:
+        cam.orbit(d_radius=ZOOM_STEP)
+    draw()
+
+# --- SELEÇÃO: PASSAR O MOUSE DESTACA, CLICAR SELECIONA ---
+def pick(x, y):
+    """Vértice mais próximo do cursor ou, se não houver, a aresta mais próxima: ("vertex"|"edge", índice)."""
+    hit = picker.nearest_vertex(cam, x, y, PICK_RADIUS)
+    if hit is not None:
+        return "vertex", hit[0]
+    hit = picker.nearest_edge(cam, x, y, PICK_RADIUS)
+    if hit is not None:
+        return "edge", hit[0]
+    return None
+
+def show_pick(items, picked):
+    """Posiciona o destaque (círculo do vértice ou linha da aresta) sobre o elemento escolhido, ou o esconde."""
+    oval, line = items
+    canvas.itemconfigure(oval, state="hidden")
+    canvas.itemconfigure(line, state="hidden")
+    if picked is None:
+        return
+    kind, index = picked
+    vertices = obj.get_vertices()
+    if kind == "vertex":
+        clip = cam.project_to_clip(vertices[[index]])
+        if not inside_mask(clip, frustum_planes(cam, all_planes=True))[0]:
+            return
+        x, y = cam.clip_to_viewport(clip)[0]
+        canvas.coords(oval, x - PICK_MARK, y - PICK_MARK, x + PICK_MARK, y + PICK_MARK)
+        item = oval
+    else:
+        p0, p1 = project_edges(cam, vertices, obj.get_edges()[[index]], all_planes=True)
+        if len(p0) == 0:
+            return
+        canvas.coords(line, *p0[0], *p1[0])
+        item = line
+    canvas.itemconfigure(item, state="normal")
+    canvas.tag_raise(item)
+
+def hover(event):
+    global hovered
+    hovered = pick(event.x, event.y)
+    show_pick(hover_items, hovered)
+
+def select_at(x, y):
+    global selected
+    selected = pick(x, y)
+    show_pick(selected_items, selected)
+    if selected is None:
+        return
+    kind, index = selected
+    if kind == "vertex":
+        x, y, z = obj.get_vertices()[index, :3]
+        print(f"Vértice {index} selecionado: ({x:.3f}, {y:.3f}, {z:.3f})")
+    else:
+        a, b = obj.get_edges()[index]
+        print(f"Aresta {index} selecionada: vértices {a} e {b}")
 
 # --- FUNÇÃO PARA TROCAR DE MENU (FRAME) ---
 def show_frame(frame_to_show):
@@ -180,218 +317,277 @@ def show_frame(frame_to_show):
 
 # --- CONFIGURAÇÃO INICIAL ---
 WIDTH, HEIGHT = 800, 600
-obj = Object3D()
-cam = Camera(width=WIDTH, height=HEIGHT, target=obj.get_position())
-
-# --- CRIAÇÃO DA JANELA PRINCIPAL (ROOT) ---
-root = tk.Tk()
-root.title("Visualizador 3D Interativo")
-
-# --- LAYOUT DA JANELA: Canvas à esquerda, Controles à direita ---
-canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, bg="black")
-canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-controls_container = tk.Frame(root, bd=2, relief=tk.SUNKEN)
-controls_container.pack(side=tk.RIGHT, fill=tk.Y, padx=5, pady=5)
-
-# --- CRIAÇÃO DOS FRAMES (MENUS) ---
-main_menu_frame = tk.Frame(controls_container)
-object_menu_frame = tk.Frame(controls_container)
-camera_menu_frame = tk.Frame(controls_container)
-projection_menu_frame = tk.Frame(controls_container)
-mapping_menu_frame = tk.Frame(controls_container)
-
-for frame in (main_menu_frame, object_menu_frame, camera_menu_frame, projection_menu_frame, mapping_menu_frame):
-    frame.grid(row=0, column=0, sticky='nsew')
-
-
-
-# --- POPULANDO O FRAME DO MENU PRINCIPAL ---
-ttk.Label(main_menu_frame, text="MENU PRINCIPAL", font=("Helvetica", 12, "bold")).pack(pady=10)
-
-# Botões de navegação
-ttk.Button(main_menu_frame, text="1. Manipular Objeto", command=lambda: show_frame(object_menu_frame)).pack(fill=tk.X, padx=5, pady=2)
-ttk.Button(main_menu_frame, text="2. Manipular Câmera", command=lambda: show_frame(camera_menu_frame)).pack(fill=tk.X, padx=5, pady=2)
-ttk.Button(main_menu_frame, text="3. Modificar Projeção", command=lambda: show_frame(projection_menu_frame)).pack(fill=tk.X, padx=5, pady=2)
-ttk.Button(main_menu_frame, text="4. Modificar Mapeamento", command=lambda: show_frame(mapping_menu_frame)).pack(fill=tk.X, padx=5, pady=2)
-
-# Separador e botão de sair
-ttk.Separator(main_menu_frame, orient='horizontal').pack(fill=tk.X, padx=5, pady=20)
-ttk.Button(main_menu_frame, text="Sair do Programa", command=exit_program).pack(fill=tk.X, padx=5, pady=2)
-
-# Rodapé com créditos
-ttk.Label(main_menu_frame, text="By: Abrahão Francis e Marcos Rocha\n2025", font=("Helvetica", 8)).pack(side=tk.BOTTOM, pady=5)
-
-
-# --- POPULANDO O FRAME DE MANIPULAÇÃO DO OBJETO ---
-ttk.Label(object_menu_frame, text="Manipular Objeto", font=("Helvetica", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=10)
-
-# Translação
-ttk.Label(object_menu_frame, text="Translação (X, Y, Z):").grid(row=1, column=0, columnspan=4, sticky='w', padx=5)
-entry_tx = ttk.Entry(object_menu_frame, width=5); entry_tx.grid(row=2, column=0, padx=5)
-entry_ty = ttk.Entry(object_menu_frame, width=5); entry_ty.grid(row=2, column=1, padx=5)
-entry_tz = ttk.Entry(object_menu_frame, width=5); entry_tz.grid(row=2, column=2, padx=5)
-ttk.Button(object_menu_frame, text="Aplicar", command=apply_translation).grid(row=2, column=3, padx=5)
-
-# Escala
-ttk.Label(object_menu_frame, text="Escala (X, Y, Z):").grid(row=3, column=0, columnspan=4, sticky='w', padx=5, pady=(10, 0))
-entry_sx = ttk.Entry(object_menu_frame, width=5); entry_sx.grid(row=4, column=0, padx=5)
-entry_sy = ttk.Entry(object_menu_frame, width=5); entry_sy.grid(row=4, column=1, padx=5)
-entry_sz = ttk.Entry(object_menu_frame, width=5); entry_sz.grid(row=4, column=2, padx=5)
-ttk.Button(object_menu_frame, text="Aplicar", command=apply_scale).grid(row=4, column=3, padx=5)
-
-# Rotações
-ttk.Label(object_menu_frame, text="Rotação X (graus):").grid(row=5, column=0, columnspan=2, sticky='w', padx=5, pady=(10, 0))
-entry_rx = ttk.Entry(object_menu_frame, width=8); entry_rx.grid(row=5, column=2, padx=5)
-ttk.Button(object_menu_frame, text="Aplicar", command=lambda: apply_rotation('x')).grid(row=5, column=3, padx=5)
-
-ttk.Label(object_menu_frame, text="Rotação Y (graus):").grid(row=6, column=0, columnspan=2, sticky='w', padx=5)
-entry_ry = ttk.Entry(object_menu_frame, width=8); entry_ry.grid(row=6, column=2, padx=5)
-ttk.Button(object_menu_frame, text="Aplicar", command=lambda: apply_rotation('y')).grid(row=6, column=3, padx=5)
-
-ttk.Label(object_menu_frame, text="Rotação Z (graus):").grid(row=7, column=0, columnspan=2, sticky='w', padx=5)
-entry_rz = ttk.Entry(object_menu_frame, width=8); entry_rz.grid(row=7, column=2, padx=5)
-ttk.Button(object_menu_frame, text="Aplicar", command=lambda: apply_rotation('z')).grid(row=7, column=3, padx=5)
-
-# Ações Finais
-ttk.Separator(object_menu_frame, orient='horizontal').grid(row=8, column=0, columnspan=4, sticky='ew', pady=15)
-ttk.Button(object_menu_frame, text="Resetar Objeto", command=reset_object).grid(row=9, column=0, columnspan=4, sticky='ew', padx=5)
-ttk.Button(object_menu_frame, text="< Voltar ao Menu Principal", command=lambda: show_frame(main_menu_frame)).grid(row=10, column=0, columnspan=4, sticky='ew', padx=5, pady=(5, 0))
-
-
-
-# --- POPULANDO O FRAME DE MANIPULAÇÃO DA CÂMERA ---
-ttk.Label(camera_menu_frame, text="Manipular Câmera", font=("Helvetica", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=10)
-
-# Translação da Câmera
-ttk.Label(camera_menu_frame, text="Translação (X, Y, Z):").grid(row=1, column=0, columnspan=4, sticky='w', padx=5)
-entry_cam_tx = ttk.Entry(camera_menu_frame, width=5); entry_cam_tx.grid(row=2, column=0, padx=5)
-entry_cam_ty = ttk.Entry(camera_menu_frame, width=5); entry_cam_ty.grid(row=2, column=1, padx=5)
-entry_cam_tz = ttk.Entry(camera_menu_frame, width=5); entry_cam_tz.grid(row=2, column=2, padx=5)
-ttk.Button(camera_menu_frame, text="Aplicar", command=apply_camera_translation).grid(row=2, column=3, padx=5)
-
-# Rotações da Câmera
-ttk.Label(camera_menu_frame, text="Rotação X (graus):").grid(row=3, column=0, columnspan=2, sticky='w', padx=5, pady=(10, 0))
-entry_cam_rx = ttk.Entry(camera_menu_frame, width=8); entry_cam_rx.grid(row=3, column=2, padx=5)
-ttk.Button(camera_menu_frame, text="Aplicar", command=lambda: apply_camera_rotation('x')).grid(row=3, column=3, padx=5)
-
-ttk.Label(camera_menu_frame, text="Rotação Y (graus):").grid(row=4, column=0, columnspan=2, sticky='w', padx=5)
-entry_cam_ry = ttk.Entry(camera_menu_frame, width=8); entry_cam_ry.grid(row=4, column=2, padx=5)
-ttk.Button(camera_menu_frame, text="Aplicar", command=lambda: apply_camera_rotation('y')).grid(row=4, column=3, padx=5)
-
-ttk.Label(camera_menu_frame, text="Rotação Z (graus):").grid(row=5, column=0, columnspan=2, sticky='w', padx=5)
-entry_cam_rz = ttk.Entry(camera_menu_frame, width=8); entry_cam_rz.grid(row=5, column=2, padx=5)
-ttk.Button(camera_menu_frame, text="Aplicar", command=lambda: apply_camera_rotation('z')).grid(row=5, column=3, padx=5)
-
-# Ações Finais
-ttk.Separator(camera_menu_frame, orient='horizontal').grid(row=6, column=0, columnspan=4, sticky='ew', pady=15)
-ttk.Button(camera_menu_frame, text="Resetar Câmera", command=reset_camera).grid(row=7, column=0, columnspan=4, sticky='ew', padx=5)
-ttk.Button(camera_menu_frame, text="< Voltar ao Menu Principal", command=lambda: show_frame(main_menu_frame)).grid(row=8, column=0, columnspan=4, sticky='ew', padx=5, pady=(5, 0))
-
-
-# --- POPULANDO O FRAME DE MODIFICAÇÃO DE PROJEÇÃO ---
-ttk.Label(projection_menu_frame, text="Modificar Projeção", font=("Helvetica", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=10)
-
-# Projeção Perspectiva
-ttk.Label(projection_menu_frame, text="Projeção Perspectiva", font=("Helvetica", 10, "bold")).grid(row=1, column=0, columnspan=4, sticky='w', padx=5, pady=(10,0))
-ttk.Label(projection_menu_frame, text="FOV (graus):").grid(row=2, column=0, sticky='w', padx=5)
-entry_proj_fov = ttk.Entry(projection_menu_frame, width=8); entry_proj_fov.grid(row=2, column=1)
-ttk.Label(projection_menu_frame, text="Near:").grid(row=3, column=0, sticky='w', padx=5)
-entry_proj_near = ttk.Entry(projection_menu_frame, width=8); entry_proj_near.grid(row=3, column=1)
-ttk.Label(projection_menu_frame, text="Far:").grid(row=4, column=0, sticky='w', padx=5)
-entry_proj_far = ttk.Entry(projection_menu_frame, width=8); entry_proj_far.grid(row=4, column=1)
-ttk.Button(projection_menu_frame, text="Aplicar Perspectiva", command=apply_perspective_projection).grid(row=5, column=0, columnspan=4, sticky='ew', padx=5, pady=5)
-
-# --- AVISO DA PROJEÇÃO PERSPECTIVA ADICIONADO ---
-hint_label_perspective = ttk.Label(projection_menu_frame,
-                                   text="Dica: 'Near' deve ser menor que 'Far'. 'FOV' deve estar entre 0 e 180.",
-                                   font=("Helvetica", 8, "italic"),
-                                   wraplength=180,
-                                   justify='center')
-hint_label_perspective.grid(row=6, column=0, columnspan=4, padx=5, pady=5)
-
-
-# Separador 
-ttk.Separator(projection_menu_frame, orient='horizontal').grid(row=7, column=0, columnspan=4, sticky='ew', pady=15)
-
-
-# Projeção Paralela (Ortográfica) 
-ttk.Label(projection_menu_frame, text="Projeção Paralela", font=("Helvetica", 10, "bold")).grid(row=8, column=0, columnspan=4, sticky='w', padx=5)
-ttk.Label(projection_menu_frame, text="Left:").grid(row=9, column=0, sticky='w', padx=5)
-entry_proj_left = ttk.Entry(projection_menu_frame, width=8); entry_proj_left.grid(row=9, column=1)
-ttk.Label(projection_menu_frame, text="Right:").grid(row=10, column=0, sticky='w', padx=5)
-entry_proj_right = ttk.Entry(projection_menu_frame, width=8); entry_proj_right.grid(row=10, column=1)
-ttk.Label(projection_menu_frame, text="Bottom:").grid(row=11, column=0, sticky='w', padx=5)
-entry_proj_bottom = ttk.Entry(projection_menu_frame, width=8); entry_proj_bottom.grid(row=11, column=1)
-ttk.Label(projection_menu_frame, text="Top:").grid(row=12, column=0, sticky='w', padx=5)
-entry_proj_top = ttk.Entry(projection_menu_frame, width=8); entry_proj_top.grid(row=12, column=1)
-ttk.Button(projection_menu_frame, text="Aplicar Paralela", command=apply_orthographic_projection).grid(row=13, column=0, columnspan=4, sticky='ew', padx=5, pady=5)
-
-
-# --- AVISO DA PROJEÇÃO PARALELA ADICIONADO ---
-hint_label_parallel = ttk.Label(projection_menu_frame,
-                                text="Dica: min/max não podem ser iguais. Para ver o objeto, o intervalo deve ser maior que [-0.5, 0.5].",
-                                font=("Helvetica", 8, "italic"),
-                                wraplength=180,
-                                justify='center')
-hint_label_parallel.grid(row=14, column=0, columnspan=4, padx=5, pady=5)
-
-
-# Ação Final 
-ttk.Separator(projection_menu_frame, orient='horizontal').grid(row=15, column=0, columnspan=4, sticky='ew', pady=15)
-ttk.Button(projection_menu_frame, text="< Voltar ao Menu Principal", command=lambda: show_frame(main_menu_frame)).grid(row=16, column=0, columnspan=4, sticky='ew', padx=5, pady=(5,0))
-
-
-
-# --- POPULANDO O FRAME DE MODIFICAÇÃO DE MAPEAMENTO ---
-ttk.Label(mapping_menu_frame, text="Modificar Mapeamento", font=("Helvetica", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=10)
-
-# Window
-ttk.Label(mapping_menu_frame, text="Window", font=("Helvetica", 10, "bold")).grid(row=1, column=0, columnspan=4, sticky='w', padx=5, pady=(10,0))
-ttk.Label(mapping_menu_frame, text="X (min, max):").grid(row=2, column=0, columnspan=2, sticky='w', padx=5)
-entry_map_xminw = ttk.Entry(mapping_menu_frame, width=5); entry_map_xminw.grid(row=2, column=2)
-entry_map_xmaxw = ttk.Entry(mapping_menu_frame, width=5); entry_map_xmaxw.grid(row=2, column=3)
-ttk.Label(mapping_menu_frame, text="Y (min, max):").grid(row=3, column=0, columnspan=2, sticky='w', padx=5)
-entry_map_yminw = ttk.Entry(mapping_menu_frame, width=5); entry_map_yminw.grid(row=3, column=2)
-entry_map_ymaxw = ttk.Entry(mapping_menu_frame, width=5); entry_map_ymaxw.grid(row=3, column=3)
-ttk.Button(mapping_menu_frame, text="Aplicar Window", command=apply_window_mapping).grid(row=4, column=0, columnspan=4, sticky='ew', padx=5, pady=5)
-
-# --- AVISO DA WINDOW ---
-hint_label_window = ttk.Label(mapping_menu_frame, 
-                       text="Dica: Para manter o objeto visível, use um intervalo que contenha [-0.5, 0.5].",
-                       font=("Helvetica", 8, "italic"),
-                       wraplength=180,
-                       justify='center')
-hint_label_window.grid(row=5, column=0, columnspan=4, padx=5, pady=5)
-
-# Separador
-ttk.Separator(mapping_menu_frame, orient='horizontal').grid(row=6, column=0, columnspan=4, sticky='ew', pady=15)
-
-# Viewport
-ttk.Label(mapping_menu_frame, text="Viewport", font=("Helvetica", 10, "bold")).grid(row=7, column=0, columnspan=4, sticky='w', padx=5)
-ttk.Label(mapping_menu_frame, text="X (min, max):").grid(row=8, column=0, columnspan=2, sticky='w', padx=5)
-entry_map_xminv = ttk.Entry(mapping_menu_frame, width=5); entry_map_xminv.grid(row=8, column=2)
-entry_map_xmaxv = ttk.Entry(mapping_menu_frame, width=5); entry_map_xmaxv.grid(row=8, column=3)
-ttk.Label(mapping_menu_frame, text="Y (min, max):").grid(row=9, column=0, columnspan=2, sticky='w', padx=5)
-entry_map_yminv = ttk.Entry(mapping_menu_frame, width=5); entry_map_yminv.grid(row=9, column=2)
-entry_map_ymaxv = ttk.Entry(mapping_menu_frame, width=5); entry_map_ymaxv.grid(row=9, column=3)
-ttk.Button(mapping_menu_frame, text="Aplicar Viewport", command=apply_viewport_mapping).grid(row=10, column=0, columnspan=4, sticky='ew', padx=5, pady=5)
-
-# --- AVISO DA VIEWPORT ---
-hint_label_viewport = ttk.Label(mapping_menu_frame,
-                                text="Dica: A área visível da tela vai de X(0 a 800) e Y(0 a 600).",
-                                font=("Helvetica", 8, "italic"),
-                                wraplength=180,
-                                justify='center')
-hint_label_viewport.grid(row=11, column=0, columnspan=4, padx=5, pady=5)
-
-# Ação Final
-ttk.Separator(mapping_menu_frame, orient='horizontal').grid(row=12, column=0, columnspan=4, sticky='ew', pady=15)
-ttk.Button(mapping_menu_frame, text="< Voltar ao Menu Principal", command=lambda: show_frame(main_menu_frame)).grid(row=13, column=0, columnspan=4, sticky='ew', padx=5, pady=(5,0))
-
-
-
-# --- INICIALIZAÇÃO DO PROGRAMA ---
-show_frame(main_menu_frame)  # Mostra o menu principal para começar
-draw()  # Desenha o estado inicial do objeto
-root.mainloop()  # Inicia o loop da interface gráfica
\ No newline at end of file
+MAX_FPS = 60
+ORBIT_RADIANS_PER_PIXEL = 0.01
+ZOOM_STEP = 0.5
+WORKER_POLL_MS = 5
+PICK_RADIUS = 8       # distância máxima (pixels) do cursor ao vértice/aresta
+PICK_MARK = 4         # raio do círculo que destaca um vértice
+CLICK_TOLERANCE = 3   # movimento máximo (pixels) para um clique não virar arraste
+press_mouse = (0, 0)
+hovered = None
+selected = None
+last_mouse = (0, 0)
+worker_polling = False
+
+# --- INTERFACE: só é montada ao executar main.py diretamente ---
+if __name__ == "__main__":
+    # Tk só é importado ao abrir a interface; render_cli.py usa o pipeline sem ela
+    import tkinter as tk
+    from tkinter import ttk  # Usaremos para um estilo de widget melhor
+    from tkinter import filedialog
+
+    # Uso: python main.py [malha.obj|malha.ply ...] (os menus manipulam a primeira malha)
+    # Sem janela: python render_cli.py malha.obj -o imagem.png (veja --help)
+    scene = Scene([Object3D.from_file(path) for path in sys.argv[1:]] or [Object3D()])
+    obj = scene.objects[0]
+    # Malhas grandes são desenhadas com nível de detalhe conforme o tamanho na tela
+    LOD_MIN_VERTICES = 100_000
+    for mesh in scene.objects:
+        if len(mesh.vertices) > LOD_MIN_VERTICES:
+            scene.set_lod(mesh, LODChain(mesh))
+    cam = Camera(width=WIDTH, height=HEIGHT, target=obj.get_position())
+    # Tempos por etapa do pipeline (desligado até marcar a opção no menu principal; memória também)
+    profiler = PipelineProfiler(enabled=False, track_memory=False)
+
+    # --- CRIAÇÃO DA JANELA PRINCIPAL (ROOT) ---
+    root = tk.Tk()
+    root.title("Visualizador 3D Interativo")
+
+    # --- LAYOUT DA JANELA: Canvas à esquerda, Controles à direita ---
+    canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, bg="black")
+    canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    renderer = CanvasRenderer(canvas, fill="white", profiler=profiler)
+    hud_item = canvas.create_text(8, 8, anchor="nw", fill="yellow", font=("Courier", 9), text="")
+    picker = Picker(obj)
+    hover_items = (canvas.create_oval(0, 0, 0, 0, outline="cyan", width=2, state="hidden"),
+                   canvas.create_line(0, 0, 0, 0, fill="cyan", width=3, state="hidden"))
+    selected_items = (canvas.create_oval(0, 0, 0, 0, outline="orange", width=2, state="hidden"),
+                      canvas.create_line(0, 0, 0, 0, fill="orange", width=3, state="hidden"))
+    scheduler = FrameScheduler(root, render_frame, fps=MAX_FPS)
+    worker = ProjectionWorker(all_planes=renderer.all_planes, cull_back_faces=renderer.cull_back_faces)
+
+    canvas.bind("<ButtonPress-1>", start_drag)
+    canvas.bind("<B1-Motion>", drag_orbit)
+    canvas.bind("<ButtonRelease-1>", end_drag)
+    canvas.bind("<Motion>", hover)
+    canvas.bind("<MouseWheel>", wheel_zoom)
+    canvas.bind("<Button-4>", wheel_zoom)
+    canvas.bind("<Button-5>", wheel_zoom)
+
+    controls_container = tk.Frame(root, bd=2, relief=tk.SUNKEN)
+    controls_container.pack(side=tk.RIGHT, fill=tk.Y, padx=5, pady=5)
+
+    # --- CRIAÇÃO DOS FRAMES (MENUS) ---
+    main_menu_frame = tk.Frame(controls_container)
+    object_menu_frame = tk.Frame(controls_container)
+    camera_menu_frame = tk.Frame(controls_container)
+    projection_menu_frame = tk.Frame(controls_container)
+    mapping_menu_frame = tk.Frame(controls_container)
+
+    for frame in (main_menu_frame, object_menu_frame, camera_menu_frame, projection_menu_frame, mapping_menu_frame):
+        frame.grid(row=0, column=0, sticky='nsew')
+
+
+
+    # --- POPULANDO O FRAME DO MENU PRINCIPAL ---
+    ttk.Label(main_menu_frame, text="MENU PRINCIPAL", font=("Helvetica", 12, "bold")).pack(pady=10)
+
+    # Botões de navegação
+    ttk.Button(main_menu_frame, text="1. Manipular Objeto", command=lambda: show_frame(object_menu_frame)).pack(fill=tk.X, padx=5, pady=2)
+    ttk.Button(main_menu_frame, text="2. Manipular Câmera", command=lambda: show_frame(camera_menu_frame)).pack(fill=tk.X, padx=5, pady=2)
+    ttk.Button(main_menu_frame, text="3. Modificar Projeção", command=lambda: show_frame(projection_menu_frame)).pack(fill=tk.X, padx=5, pady=2)
+    ttk.Button(main_menu_frame, text="4. Modificar Mapeamento", command=lambda: show_frame(mapping_menu_frame)).pack(fill=tk.X, padx=5, pady=2)
+
+    # Back-face culling (só afeta malhas com faces)
+    cull_back_faces_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(main_menu_frame, text="Ocultar arestas traseiras", variable=cull_back_faces_var, command=toggle_back_face_culling).pack(fill=tk.X, padx=5, pady=2)
+
+    # Desempenho: FPS/tempo por etapa na tela e exportação do trace
+    show_profiler_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(main_menu_frame, text="Mostrar desempenho (FPS)", variable=show_profiler_var, command=toggle_profiler).pack(fill=tk.X, padx=5, pady=2)
+    # Memória alocada por etapa (tracemalloc deixa tudo mais lento, por isso é uma opção à parte)
+    track_memory_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(main_menu_frame, text="Medir memória por etapa", variable=track_memory_var, command=toggle_memory_tracking).pack(fill=tk.X, padx=5, pady=2)
+    ttk.Button(main_menu_frame, text="Exportar trace (Chrome)", command=export_trace).pack(fill=tk.X, padx=5, pady=2)
+
+    # Separador e botão de sair
+    ttk.Separator(main_menu_frame, orient='horizontal').pack(fill=tk.X, padx=5, pady=20)
+    ttk.Button(main_menu_frame, text="Sair do Programa", command=exit_program).pack(fill=tk.X, padx=5, pady=2)
+
+    # Rodapé com créditos
+    ttk.Label(main_menu_frame, text="By: Abrahão Francis e Marcos Rocha\n2025", font=("Helvetica", 8)).pack(side=tk.BOTTOM, pady=5)
+
+
+    # --- POPULANDO O FRAME DE MANIPULAÇÃO DO OBJETO ---
+    ttk.Label(object_menu_frame, text="Manipular Objeto", font=("Helvetica", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=10)
+
+    # Translação
+    ttk.Label(object_menu_frame, text="Translação (X, Y, Z):").grid(row=1, column=0, columnspan=4, sticky='w', padx=5)
+    entry_tx = ttk.Entry(object_menu_frame, width=5); entry_tx.grid(row=2, column=0, padx=5)
+    entry_ty = ttk.Entry(object_menu_frame, width=5); entry_ty.grid(row=2, column=1, padx=5)
+    entry_tz = ttk.Entry(object_menu_frame, width=5); entry_tz.grid(row=2, column=2, padx=5)
+    ttk.Button(object_menu_frame, text="Aplicar", command=apply_translation).grid(row=2, column=3, padx=5)
+
+    # Escala
+    ttk.Label(object_menu_frame, text="Escala (X, Y, Z):").grid(row=3, column=0, columnspan=4, sticky='w', padx=5, pady=(10, 0))
+    entry_sx = ttk.Entry(object_menu_frame, width=5); entry_sx.grid(row=4, column=0, padx=5)
+    entry_sy = ttk.Entry(object_menu_frame, width=5); entry_sy.grid(row=4, column=1, padx=5)
+    entry_sz = ttk.Entry(object_menu_frame, width=5); entry_sz.grid(row=4, column=2, padx=5)
+    ttk.Button(object_menu_frame, text="Aplicar", command=apply_scale).grid(row=4, column=3, padx=5)
+
+    # Rotações
+    ttk.Label(object_menu_frame, text="Rotação X (graus):").grid(row=5, column=0, columnspan=2, sticky='w', padx=5, pady=(10, 0))
+    entry_rx = ttk.Entry(object_menu_frame, width=8); entry_rx.grid(row=5, column=2, padx=5)
+    ttk.Button(object_menu_frame, text="Aplicar", command=lambda: apply_rotation('x')).grid(row=5, column=3, padx=5)
+
+    ttk.Label(object_menu_frame, text="Rotação Y (graus):").grid(row=6, column=0, columnspan=2, sticky='w', padx=5)
+    entry_ry = ttk.Entry(object_menu_frame, width=8); entry_ry.grid(row=6, column=2, padx=5)
+    ttk.Button(object_menu_frame, text="Aplicar", command=lambda: apply_rotation('y')).grid(row=6, column=3, padx=5)
+
+    ttk.Label(object_menu_frame, text="Rotação Z (graus):").grid(row=7, column=0, columnspan=2, sticky='w', padx=5)
+    entry_rz = ttk.Entry(object_menu_frame, width=8); entry_rz.grid(row=7, column=2, padx=5)
+    ttk.Button(object_menu_frame, text="Aplicar", command=lambda: apply_rotation('z')).grid(row=7, column=3, padx=5)
+
+    # Ações Finais
+    ttk.Separator(object_menu_frame, orient='horizontal').grid(row=8, column=0, columnspan=4, sticky='ew', pady=15)
+    ttk.Button(object_menu_frame, text="Resetar Objeto", command=reset_object).grid(row=9, column=0, columnspan=4, sticky='ew', padx=5)
+    ttk.Button(object_menu_frame, text="< Voltar ao Menu Principal", command=lambda: show_frame(main_menu_frame)).grid(row=10, column=0, columnspan=4, sticky='ew', padx=5, pady=(5, 0))
+
+
+
+    # --- POPULANDO O FRAME DE MANIPULAÇÃO DA CÂMERA ---
+    ttk.Label(camera_menu_frame, text="Manipular Câmera", font=("Helvetica", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=10)
+
+    # Translação da Câmera
+    ttk.Label(camera_menu_frame, text="Translação (X, Y, Z):").grid(row=1, column=0, columnspan=4, sticky='w', padx=5)
+    entry_cam_tx = ttk.Entry(camera_menu_frame, width=5); entry_cam_tx.grid(row=2, column=0, padx=5)
+    entry_cam_ty = ttk.Entry(camera_menu_frame, width=5); entry_cam_ty.grid(row=2, column=1, padx=5)
+    entry_cam_tz = ttk.Entry(camera_menu_frame, width=5); entry_cam_tz.grid(row=2, column=2, padx=5)
+    ttk.Button(camera_menu_frame, text="Aplicar", command=apply_camera_translation).grid(row=2, column=3, padx=5)
+
+    # Rotações da Câmera
+    ttk.Label(camera_menu_frame, text="Rotação X (graus):").grid(row=3, column=0, columnspan=2, sticky='w', padx=5, pady=(10, 0))
+    entry_cam_rx = ttk.Entry(camera_menu_frame, width=8); entry_cam_rx.grid(row=3, column=2, padx=5)
+    ttk.Button(camera_menu_frame, text="Aplicar", command=lambda: apply_camera_rotation('x')).grid(row=3, column=3, padx=5)
+
+    ttk.Label(camera_menu_frame, text="Rotação Y (graus):").grid(row=4, column=0, columnspan=2, sticky='w', padx=5)
+    entry_cam_ry = ttk.Entry(camera_menu_frame, width=8); entry_cam_ry.grid(row=4, column=2, padx=5)
+    ttk.Button(camera_menu_frame, text="Aplicar", command=lambda: apply_camera_rotation('y')).grid(row=4, column=3, padx=5)
+
+    ttk.Label(camera_menu_frame, text="Rotação Z (graus):").grid(row=5, column=0, columnspan=2, sticky='w', padx=5)
+    entry_cam_rz = ttk.Entry(camera_menu_frame, width=8); entry_cam_rz.grid(row=5, column=2, padx=5)
+    ttk.Button(camera_menu_frame, text="Aplicar", command=lambda: apply_camera_rotation('z')).grid(row=5, column=3, padx=5)
+
+    # Ações Finais
+    ttk.Separator(camera_menu_frame, orient='horizontal').grid(row=6, column=0, columnspan=4, sticky='ew', pady=15)
+    ttk.Button(camera_menu_frame, text="Resetar Câmera", command=reset_camera).grid(row=7, column=0, columnspan=4, sticky='ew', padx=5)
+    ttk.Button(camera_menu_frame, text="< Voltar ao Menu Principal", command=lambda: show_frame(main_menu_frame)).grid(row=8, column=0, columnspan=4, sticky='ew', padx=5, pady=(5, 0))
+
+
+    # --- POPULANDO O FRAME DE MODIFICAÇÃO DE PROJEÇÃO ---
+    ttk.Label(projection_menu_frame, text="Modificar Projeção", font=("Helvetica", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=10)
+
+    # Projeção Perspectiva
+    ttk.Label(projection_menu_frame, text="Projeção Perspectiva", font=("Helvetica", 10, "bold")).grid(row=1, column=0, columnspan=4, sticky='w', padx=5, pady=(10,0))
+    ttk.Label(projection_menu_frame, text="FOV (graus):").grid(row=2, column=0, sticky='w', padx=5)
+    entry_proj_fov = ttk.Entry(projection_menu_frame, width=8); entry_proj_fov.grid(row=2, column=1)
+    ttk.Label(projection_menu_frame, text="Near:").grid(row=3, column=0, sticky='w', padx=5)
+    entry_proj_near = ttk.Entry(projection_menu_frame, width=8); entry_proj_near.grid(row=3, column=1)
+    ttk.Label(projection_menu_frame, text="Far:").grid(row=4, column=0, sticky='w', padx=5)
+    entry_proj_far = ttk.Entry(projection_menu_frame, width=8); entry_proj_far.grid(row=4, column=1)
+    ttk.Button(projection_menu_frame, text="Aplicar Perspectiva", command=apply_perspective_projection).grid(row=5, column=0, columnspan=4, sticky='ew', padx=5, pady=5)
+
+    # --- AVISO DA PROJEÇÃO PERSPECTIVA ADICIONADO ---
+    hint_label_perspective = ttk.Label(projection_menu_frame,
+                                       text="Dica: 'Near' deve ser menor que 'Far'. 'FOV' deve estar entre 0 e 180.",
+                                       font=("Helvetica", 8, "italic"),
+                                       wraplength=180,
+                                       justify='center')
+    hint_label_perspective.grid(row=6, column=0, columnspan=4, padx=5, pady=5)
+
+
+    # Separador 
+    ttk.Separator(projection_menu_frame, orient='horizontal').grid(row=7, column=0, columnspan=4, sticky='ew', pady=15)
+
+
+    # Projeção Paralela (Ortográfica) 
+    ttk.Label(projection_menu_frame, text="Projeção Paralela", font=("Helvetica", 10, "bold")).grid(row=8, column=0, columnspan=4, sticky='w', padx=5)
+    ttk.Label(projection_menu_frame, text="Left:").grid(row=9, column=0, sticky='w', padx=5)
+    entry_proj_left = ttk.Entry(projection_menu_frame, width=8); entry_proj_left.grid(row=9, column=1)
+    ttk.Label(projection_menu_frame, text="Right:").grid(row=10, column=0, sticky='w', padx=5)
+    entry_proj_right = ttk.Entry(projection_menu_frame, width=8); entry_proj_right.grid(row=10, column=1)
+    ttk.Label(projection_menu_frame, text="Bottom:").grid(row=11, column=0, sticky='w', padx=5)
+    entry_proj_bottom = ttk.Entry(projection_menu_frame, width=8); entry_proj_bottom.grid(row=11, column=1)
+    ttk.Label(projection_menu_frame, text="Top:").grid(row=12, column=0, sticky='w', padx=5)
+    entry_proj_top = ttk.Entry(projection_menu_frame, width=8); entry_proj_top.grid(row=12, column=1)
+    ttk.Button(projection_menu_frame, text="Aplicar Paralela", command=apply_orthographic_projection).grid(row=13, column=0, columnspan=4, sticky='ew', padx=5, pady=5)
+
+
+    # --- AVISO DA PROJEÇÃO PARALELA ADICIONADO ---
+    hint_label_parallel = ttk.Label(projection_menu_frame,
+                                    text="Dica: min/max não podem ser iguais. Para ver o objeto, o intervalo deve ser maior que [-0.5, 0.5].",
+                                    font=("Helvetica", 8, "italic"),
+                                    wraplength=180,
+                                    justify='center')
+    hint_label_parallel.grid(row=14, column=0, columnspan=4, padx=5, pady=5)
+
+
+    # Ação Final 
+    ttk.Separator(projection_menu_frame, orient='horizontal').grid(row=15, column=0, columnspan=4, sticky='ew', pady=15)
+    ttk.Button(projection_menu_frame, text="< Voltar ao Menu Principal", command=lambda: show_frame(main_menu_frame)).grid(row=16, column=0, columnspan=4, sticky='ew', padx=5, pady=(5,0))
+
+
+
+    # --- POPULANDO O FRAME DE MODIFICAÇÃO DE MAPEAMENTO ---
+    ttk.Label(mapping_menu_frame, text="Modificar Mapeamento", font=("Helvetica", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=10)
+
+    # Window
+    ttk.Label(mapping_menu_frame, text="Window", font=("Helvetica", 10, "bold")).grid(row=1, column=0, columnspan=4, sticky='w', padx=5, pady=(10,0))
+    ttk.Label(mapping_menu_frame, text="X (min, max):").grid(row=2, column=0, columnspan=2, sticky='w', padx=5)
+    entry_map_xminw = ttk.Entry(mapping_menu_frame, width=5); entry_map_xminw.grid(row=2, column=2)
+    entry_map_xmaxw = ttk.Entry(mapping_menu_frame, width=5); entry_map_xmaxw.grid(row=2, column=3)
+    ttk.Label(mapping_menu_frame, text="Y (min, max):").grid(row=3, column=0, columnspan=2, sticky='w', padx=5)
+    entry_map_yminw = ttk.Entry(mapping_menu_frame, width=5); entry_map_yminw.grid(row=3, column=2)
+    entry_map_ymaxw = ttk.Entry(mapping_menu_frame, width=5); entry_map_ymaxw.grid(row=3, column=3)
+    ttk.Button(mapping_menu_frame, text="Aplicar Window", command=apply_window_mapping).grid(row=4, column=0, columnspan=4, sticky='ew', padx=5, pady=5)
+
+    # --- AVISO DA WINDOW ---
+    hint_label_window = ttk.Label(mapping_menu_frame, 
+                           text="Dica: Para manter o objeto visível, use um intervalo que contenha [-0.5, 0.5].",
+                           font=("Helvetica", 8, "italic"),
+                           wraplength=180,
+                           justify='center')
+    hint_label_window.grid(row=5, column=0, columnspan=4, padx=5, pady=5)
+
+    # Separador
+    ttk.Separator(mapping_menu_frame, orient='horizontal').grid(row=6, column=0, columnspan=4, sticky='ew', pady=15)
+
+    # Viewport
+    ttk.Label(mapping_menu_frame, text="Viewport", font=("Helvetica", 10, "bold")).grid(row=7, column=0, columnspan=4, sticky='w', padx=5)
+    ttk.Label(mapping_menu_frame, text="X (min, max):").grid(row=8, column=0, columnspan=2, sticky='w', padx=5)
+    entry_map_xminv = ttk.Entry(mapping_menu_frame, width=5); entry_map_xminv.grid(row=8, column=2)
+    entry_map_xmaxv = ttk.Entry(mapping_menu_frame, width=5); entry_map_xmaxv.grid(row=8, column=3)
+    ttk.Label(mapping_menu_frame, text="Y (min, max):").grid(row=9, column=0, columnspan=2, sticky='w', padx=5)
+    entry_map_yminv = ttk.Entry(mapping_menu_frame, width=5); entry_map_yminv.grid(row=9, column=2)
+    entry_map_ymaxv = ttk.Entry(mapping_menu_frame, width=5); entry_map_ymaxv.grid(row=9, column=3)
+    ttk.Button(mapping_menu_frame, text="Aplicar Viewport", command=apply_viewport_mapping).grid(row=10, column=0, columnspan=4, sticky='ew', padx=5, pady=5)
+
+    # --- AVISO DA VIEWPORT ---
+    hint_label_viewport = ttk.Label(mapping_menu_frame,
+                                    text="Dica: A área visível da tela vai de X(0 a 800) e Y(0 a 600).",
+                                    font=("Helvetica", 8, "italic"),
+                                    wraplength=180,
+                                    justify='center')
+    hint_label_viewport.grid(row=11, column=0, columnspan=4, padx=5, pady=5)
+
+    # Ação Final
+    ttk.Separator(mapping_menu_frame, orient='horizontal').grid(row=12, column=0, columnspan=4, sticky='ew', pady=15)
+    ttk.Button(mapping_menu_frame, text="< Voltar ao Menu Principal", command=lambda: show_frame(main_menu_frame)).grid(row=13, column=0, columnspan=4, sticky='ew', padx=5, pady=(5,0))
+
+
+
+    # --- INICIALIZAÇÃO DO PROGRAMA ---
+    show_frame(main_menu_frame)  # Mostra o menu principal para começar
+    draw()  # Agenda o desenho do estado inicial do objeto
+    root.mainloop()  # Inicia o loop da interface gráfica
\ No newline at end of file
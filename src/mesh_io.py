@@ -0,0 +1,347 @@
+import os
+import array
+import itertools
+import numpy as np
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+# Sidecar cache: "<mesh>.<name>.npy" next to the mesh file, opened memory-mapped on later runs.
+CACHE_ARRAYS = ("vertices", "edges", "faces")
+
+PLY_TYPES = {
+    "char": "i1", "int8": "i1", "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2", "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4", "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4", "double": "f8", "float64": "f8",
+}
+
+
+class _ArrayBuilder:
+    """Growable (n, columns) NumPy buffer, extended one NumPy batch of rows at a time."""
+
+    def __init__(self, columns: int, dtype, capacity: int = 4096):
+        self._data = np.empty((capacity, columns), dtype=dtype)
+        self._size = 0
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        if needed > len(self._data):
+            capacity = max(needed, 2 * len(self._data))
+            data = np.empty((capacity, self._data.shape[1]), dtype=self._data.dtype)
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+
+    def extend(self, rows: np.ndarray) -> None:
+        self._reserve(len(rows))
+        self._data[self._size:self._size + len(rows)] = rows
+        self._size += len(rows)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def array(self) -> np.ndarray:
+        return self._data[:self._size].copy()
+
+
+def unique_edges(edges: np.ndarray, vertex_count: int) -> np.ndarray:
+    """Drops degenerate and duplicated edges ((a, b) and (b, a) are the same edge)."""
+    edges = np.sort(np.asarray(edges, dtype=np.int64).reshape(-1, 2), axis=1)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    keys = np.unique(edges[:, 0] * vertex_count + edges[:, 1])
+    return np.column_stack((keys // vertex_count, keys % vertex_count)).astype(np.int32)
+
+
+class _TopologyBuilder:
+    """Collects polygon boundary edges and fan-triangulated faces while a file is streamed."""
+
+    def __init__(self):
+        self.edges = _ArrayBuilder(2, np.int64)
+        self.faces = _ArrayBuilder(3, np.int64)
+        self._face_order = _ArrayBuilder(2, np.int64)  # (polygon id, fan index) per face, when ids are given
+
+    def add_polygon(self, indices: np.ndarray, closed: bool = True) -> None:
+        """Adds one polygon (or a polyline when closed=False, which has edges but no face)."""
+        if len(indices) < 2:
+            return
+        pairs = np.empty((len(indices) if closed else len(indices) - 1, 2), dtype=np.int64)
+        pairs[:len(indices) - 1, 0] = indices[:-1]
+        pairs[:len(indices) - 1, 1] = indices[1:]
+        if closed:
+            pairs[-1] = (indices[-1], indices[0])
+        self.edges.extend(pairs)
+        if closed and len(indices) >= 3:
+            self.add_polygons(indices.reshape(1, -1))
+
+    def add_polygons(self, polygons: np.ndarray, edges: bool = False, ids: Optional[np.ndarray] = None) -> None:
+        """
+        Adds (F, k) polygons with the same vertex count at once; edges=True also adds their boundaries.
+        ids optionally numbers the polygons in file order, so groups added by vertex count still come out of
+        arrays() in that order (pass it on every call or on none).
+        """
+        if edges:
+            pairs = np.stack((polygons, np.roll(polygons, -1, axis=1)), axis=2)
+            self.edges.extend(pairs.reshape(-1, 2))
+        for j in range(1, polygons.shape[1] - 1):
+            self.faces.extend(np.stack((polygons[:, 0], polygons[:, j], polygons[:, j + 1]), axis=1))
+            if ids is not None:
+                self._face_order.extend(np.column_stack((ids, np.full(len(ids), j))))
+
+    def add_polylines(self, polylines: np.ndarray) -> None:
+        """Adds the edges of (L, k) open polylines with the same vertex count at once."""
+        pairs = np.stack((polylines[:, :-1], polylines[:, 1:]), axis=2)
+        self.edges.extend(pairs.reshape(-1, 2))
+
+    def arrays(self, vertex_count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Deduplicated int32 edges and int32 triangles."""
+        faces = self.faces.array()
+        if len(self._face_order):
+            order = self._face_order.array()
+            faces = faces[np.lexsort((order[:, 1], order[:, 0]))]
+        return unique_edges(self.edges.array(), max(vertex_count, 1)), faces.astype(np.int32)
+
+
+# ------------------------------- #
+
+# OBJ
+
+def read_obj(path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Streams an OBJ file into (N, 4) homogeneous vertices, (E, 2) edges derived from its faces and lines,
+    and (F, 3) fan-triangulated faces.
+    The line loop only appends to compact typed buffers (array.array, 8 bytes per number): faces and lines
+    are grouped by vertex count and handed to the topology builder in one NumPy batch per group, so no
+    array is allocated per line and no Python object is kept per number.
+    """
+    coords = array.array("d")
+    # (vertex count, is face) -> (raw OBJ indices, vertices read before each line, polygon ids)
+    groups: Dict[Tuple[int, bool], Tuple[array.array, array.array, array.array]] = {}
+    polygon_id = 0
+
+    with open(path, "r") as f:
+        for line in f:
+            if line.startswith("v "):
+                x, y, z = line.split()[1:4]
+                coords.extend((float(x), float(y), float(z)))
+            elif line.startswith("f ") or line.startswith("l "):
+                tokens = line.split()[1:]
+                key = (len(tokens), line[0] == "f")
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = (array.array("q"), array.array("q"), array.array("q"))
+                group[0].extend([int(token.split("/", 1)[0]) for token in tokens])
+                group[1].append(len(coords) // 3)
+                group[2].append(polygon_id)
+                polygon_id += 1
+
+    vertices = np.ones((len(coords) // 3, 4))
+    vertices[:, :3] = np.frombuffer(coords, dtype=float).reshape(-1, 3)
+    del coords
+
+    topology = _TopologyBuilder()
+    for (size, closed), (indices, counts, ids) in groups.items():
+        if size < 2:
+            continue
+        # 1-based indices, or negative ones relative to the vertices read so far
+        raw = np.frombuffer(indices, dtype=np.int64).reshape(-1, size)
+        polygons = np.where(raw > 0, raw - 1, np.frombuffer(counts, dtype=np.int64)[:, None] + raw)
+        if closed:
+            topology.add_polygons(polygons, edges=True, ids=np.frombuffer(ids, dtype=np.int64))
+        else:
+            topology.add_polylines(polygons)
+    return (vertices,) + topology.arrays(len(vertices))
+
+
+# ------------------------------- #
+
+# PLY
+
+def _read_ply_header(f: BinaryIO) -> Tuple[str, List[Tuple[str, int, list]]]:
+    """Returns the PLY format and its elements as (name, count, properties)."""
+    if f.readline().strip() != b"ply":
+        raise ValueError("Not a PLY file")
+
+    fmt, elements = None, []
+    for raw in f:
+        tokens = raw.decode("ascii").split()
+        if not tokens or tokens[0] in ("comment", "obj_info"):
+            continue
+        if tokens[0] == "format":
+            fmt = tokens[1]
+        elif tokens[0] == "element":
+            elements.append((tokens[1], int(tokens[2]), []))
+        elif tokens[0] == "property":
+            if tokens[1] == "list":
+                elements[-1][2].append((tokens[4], PLY_TYPES[tokens[2]], PLY_TYPES[tokens[3]]))
+            else:
+                elements[-1][2].append((tokens[2], PLY_TYPES[tokens[1]]))
+        elif tokens[0] == "end_header":
+            break
+
+    if fmt not in ("ascii", "binary_little_endian", "binary_big_endian"):
+        raise ValueError(f"Unsupported PLY format: {fmt}")
+    return fmt, elements
+
+
+def _face_property(properties: list) -> int:
+    for i, prop in enumerate(properties):
+        if prop[0] in ("vertex_indices", "vertex_index"):
+            return i
+    return -1
+
+
+def _read_ply_ascii(f: BinaryIO, elements) -> Tuple[np.ndarray, _TopologyBuilder]:
+    vertices = np.empty((0, 4))
+    topology = _TopologyBuilder()
+
+    for name, count, properties in elements:
+        lines = itertools.islice(f, count)
+        if name == "vertex":
+            names = [p[0] for p in properties]
+            columns = (names.index("x"), names.index("y"), names.index("z"))
+            xyz = np.loadtxt(lines, usecols=columns, ndmin=2, dtype=float)
+            vertices = np.column_stack((xyz, np.ones(len(xyz))))
+        elif name == "face" and _face_property(properties) >= 0:
+            # Scalar properties before the index list shift where it starts on each line
+            offset = _face_property(properties)
+            for line in lines:
+                values = line.split()
+                n = int(values[offset])
+                indices = np.array(values[offset + 1:offset + 1 + n], dtype=np.int64)
+                topology.add_polygon(indices)
+        else:
+            for _ in lines:
+                pass
+
+    return vertices, topology
+
+
+def _read_ply_binary(f: BinaryIO, elements, byte_order: str) -> Tuple[np.ndarray, _TopologyBuilder]:
+    vertices = np.empty((0, 4))
+    topology = _TopologyBuilder()
+
+    for name, count, properties in elements:
+        has_lists = any(len(p) == 3 for p in properties)
+
+        if not has_lists:
+            dtype = np.dtype([(p[0], byte_order + p[1]) for p in properties])
+            data = np.frombuffer(f.read(count * dtype.itemsize), dtype=dtype, count=count)
+            if name == "vertex":
+                vertices = np.empty((count, 4))
+                vertices[:, 0], vertices[:, 1], vertices[:, 2] = data["x"], data["y"], data["z"]
+                vertices[:, 3] = 1.0
+            continue
+
+        face_prop = _face_property(properties) if name == "face" else -1
+        if count == 0:
+            continue
+
+        # Fast path: every polygon has the same vertex count, so the element is a fixed-size record
+        start = f.tell()
+        list_props = [p for p in properties if len(p) == 3]
+        if len(list_props) == 1:
+            list_index = properties.index(list_props[0])
+            count_type = np.dtype(byte_order + list_props[0][1])
+            f.seek(start + sum(np.dtype(p[1]).itemsize for p in properties[:list_index]))
+            first_n = int(np.frombuffer(f.read(count_type.itemsize), dtype=count_type)[0])
+            f.seek(start)
+
+            fields = []
+            for p in properties:
+                if len(p) == 3:
+                    fields += [(p[0] + "_n", count_type), (p[0], byte_order + p[2], (first_n,))]
+                else:
+                    fields.append((p[0], byte_order + p[1]))
+            dtype = np.dtype(fields)
+            raw = f.read(count * dtype.itemsize)
+            if len(raw) == count * dtype.itemsize:
+                data = np.frombuffer(raw, dtype=dtype, count=count)
+                if np.all(data[list_props[0][0] + "_n"] == first_n):
+                    if face_prop >= 0:
+                        topology.add_polygons(data[properties[face_prop][0]].astype(np.int64), edges=True)
+                    continue
+            f.seek(start)
+
+        # Mixed polygon sizes: read record by record
+        for _ in range(count):
+            for i, p in enumerate(properties):
+                if len(p) == 3:
+                    count_type = np.dtype(byte_order + p[1])
+                    item_type = np.dtype(byte_order + p[2])
+                    n = int(np.frombuffer(f.read(count_type.itemsize), dtype=count_type)[0])
+                    items = np.frombuffer(f.read(n * item_type.itemsize), dtype=item_type)
+                    if i == face_prop:
+                        topology.add_polygon(items.astype(np.int64))
+                else:
+                    f.read(np.dtype(p[1]).itemsize)
+
+    return vertices, topology
+
+
+def read_ply(path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reads an ASCII or binary PLY file into (N, 4) homogeneous vertices, (E, 2) edges derived from its faces,
+    and (F, 3) fan-triangulated faces.
+    """
+    with open(path, "rb") as f:
+        fmt, elements = _read_ply_header(f)
+        if fmt == "ascii":
+            vertices, topology = _read_ply_ascii(f, elements)
+        else:
+            vertices, topology = _read_ply_binary(f, elements, "<" if fmt == "binary_little_endian" else ">")
+
+    return (vertices,) + topology.arrays(len(vertices))
+
+
+# ------------------------------- #
+
+# Binary sidecar cache
+
+def cache_paths(path: str) -> dict:
+    return {name: f"{path}.{name}.npy" for name in CACHE_ARRAYS}
+
+
+def _cache_is_fresh(path: str) -> bool:
+    mesh_mtime = os.path.getmtime(path)
+    return all(os.path.exists(p) and os.path.getmtime(p) >= mesh_mtime for p in cache_paths(path).values())
+
+
+def write_cache(path: str, arrays: dict) -> None:
+    """Writes each array next to the mesh file; a temp file + rename keeps half-written caches from being read."""
+    for name, cache_path in cache_paths(path).items():
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(arrays[name]))
+        os.replace(tmp_path, cache_path)
+
+
+def read_cache(path: str) -> dict:
+    """Opens the cached arrays memory-mapped (read-only), so nothing is parsed or copied up front."""
+    return {name: np.load(cache_path, mmap_mode="r") for name, cache_path in cache_paths(path).items()}
+
+
+def load_mesh(path: str, use_cache: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Loads an OBJ or PLY mesh as (N, 4) float vertices, (E, 2) int32 edges and (F, 3) int32 triangles.
+    With use_cache, the first load writes .npy sidecar files and later loads memory-map them instead of parsing.
+    """
+    if use_cache and _cache_is_fresh(path):
+        arrays = read_cache(path)
+        return arrays["vertices"], arrays["edges"], arrays["faces"]
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".obj":
+        vertices, edges, faces = read_obj(path)
+    elif extension == ".ply":
+        vertices, edges, faces = read_ply(path)
+    else:
+        raise ValueError(f"Unsupported mesh format: {extension}")
+
+    if use_cache:
+        try:
+            write_cache(path, {"vertices": vertices, "edges": edges, "faces": faces})
+        except OSError as e:
+            print(f"Aviso: não foi possível gravar o cache da malha ({e}).")
+        else:
+            arrays = read_cache(path)
+            return arrays["vertices"], arrays["edges"], arrays["faces"]
+
+    return vertices, edges, faces
@@ -1,14 +1,74 @@
 import numpy as np
-from typing import Sequence, List, Optional
+from typing import Sequence, List, Optional, Tuple
+
+
+def build_edge_strips(edges: np.ndarray, vertex_count: int) -> List[np.ndarray]:
+    """
+    Chains (E, 2) edges into polylines so each strip can be drawn with a single multi-point line.
+    Returns a list of vertex-index arrays; every edge is covered by exactly one strip.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if len(edges) == 0:
+        return []
+
+    # Adjacency in CSR form: every edge is listed under both of its endpoints
+    ends = np.concatenate((edges[:, 0], edges[:, 1]))
+    order = np.argsort(ends, kind="stable")
+    neighbours = np.concatenate((edges[:, 1], edges[:, 0]))[order].tolist()
+    edge_ids = np.concatenate((np.arange(len(edges)), np.arange(len(edges))))[order].tolist()
+    degree = np.bincount(ends, minlength=vertex_count)
+    offsets = np.concatenate(([0], np.cumsum(degree)))
+    cursor, stop = offsets[:-1].tolist(), offsets[1:].tolist()
+    used = bytearray(len(edges))
+
+    # Odd-degree vertices first: open chains are then walked from one end to the other
+    starts = np.concatenate((np.flatnonzero(degree % 2 == 1), np.flatnonzero((degree % 2 == 0) & (degree > 0))))
+
+    strips = []
+    for start in starts.tolist():
+        while True:
+            path, v = [start], start
+            while True:
+                c = cursor[v]
+                while c < stop[v] and used[edge_ids[c]]:
+                    c += 1
+                cursor[v] = c
+                if c == stop[v]:
+                    break
+                used[edge_ids[c]] = 1
+                v = neighbours[c]
+                path.append(v)
+            if len(path) == 1:
+                break
+            strips.append(np.array(path, dtype=np.int32))
+    return strips
+
+
+def box_corners(bounds: np.ndarray) -> np.ndarray:
+    """
+    Returns the 8 homogeneous corners (8, 4) of a [[xmin, ymin, zmin], [xmax, ymax, zmax]] box.
+    Also works on stacked (K, 2, 3) boxes, giving (K, 8, 4).
+    """
+    bounds = np.asarray(bounds, dtype=float)
+    index = np.array([[i & 1, (i >> 1) & 1, (i >> 2) & 1] for i in range(8)], dtype=bool)
+    corners = np.ones(bounds.shape[:-2] + (8, 4))
+    corners[..., :3] = np.where(index, bounds[..., 1:2, :], bounds[..., 0:1, :])
+    return corners
+
 
 class Object3D:
     position: np.ndarray
    
     def __init__(self, vertices: Optional[Sequence[Sequence[float]]] = None,
-                 edges: Optional[List[List[int]]] = None,
-                 x: float = 0.0, y: float = 0.0, z: float = 0.0):
+                 edges: Optional[Sequence[Sequence[int]]] = None,
+                 x: float = 0.0, y: float = 0.0, z: float = 0.0,
+                 faces: Optional[Sequence[Sequence[int]]] = None, dtype=np.float64):
         self.position = np.array([x, y, z], dtype=float)
         """ Vertices should be a list of lists or a 2D array with shape (n, 4) where each vertex is [x, y, z, 1.0] """
+
+        # Precision of the stored and world-space vertices (float32 halves memory and bandwidth).
+        # Transforms are still composed in float64 and cast once when applied to the vertices.
+        self.dtype = np.dtype(dtype)
                 
         if vertices is None:
             # Default vertices for a pyramid (use floats)
@@ -18,31 +78,236 @@ class Object3D:
                 [-0.5, -0.25, 0.5, 1.0],   #P2
                 [0.5, -0.25, 0.5, 1.0],    #P3
                 [0.0, 0.25, 0.0, 1.0]      #P4 = topo da pirâmide
-            ], dtype=float)
+            ], dtype=self.dtype)
         else:
-            self.vertices = np.array(vertices, dtype=float)
+            # asarray keeps memory-mapped arrays (see from_file) mapped instead of copying them
+            self.vertices = np.asarray(vertices, dtype=self.dtype)
 
         if edges is None:
-            # Default edges for a pyramid (indices remain ints)
-            self.edges = [[0, 1], [1, 3], [3, 2], [2, 0], # base edges
-                          [0, 4], [1, 4], [2, 4], [3, 4]] # side edges
+            # Default edges for a pyramid
+            edges = [[0, 1], [1, 3], [3, 2], [2, 0], # base edges
+                     [0, 4], [1, 4], [2, 4], [3, 4]] # side edges
+        # Contiguous (E, 2) int32 index array
+        self.edges = np.ascontiguousarray(np.asarray(edges, dtype=np.int32).reshape(-1, 2))
+        self._strips = None
+        self._strip_edge_ids = None
+        self._edge_lookup = None
+
+        # Optional (F, 3) triangles or (F, 4) quads, counter-clockwise seen from outside
+        if faces is None and vertices is None:
+            faces = [[0, 1, 3], [0, 3, 2],  # base
+                     [2, 3, 4], [1, 0, 4], [3, 1, 4], [0, 2, 4]]  # sides
+        if faces is None:
+            self.faces = np.zeros((0, 3), dtype=np.int32)
         else:
-            self.edges = edges
+            faces = np.asarray(faces, dtype=np.int32)
+            self.faces = faces.reshape(-1, faces.shape[-1] if faces.size else 3)
+        self._edge_faces = None
+        self._local_bounds = None
+        self._bounds_cache = None  # (version, world-space bounds)
+
+        # The original vertices are never rewritten: transforms accumulate in the model matrix
+        # and the world-space vertices are computed lazily (see get_vertices).
+        # The model matrix is local to the parent; version changes whenever the world transform does.
+        self.model_matrix = np.identity(4)
+        self.version = 0
+        self.parent: Optional["Object3D"] = None
+        self.children: List["Object3D"] = []
+        self._world_matrix = None  # cleared for the whole subtree when a transform changes
+        self._initial_position = self.position.copy()
+        self._world_cache = None  # (version, world-space vertices)
+        self._shared_geometry = None  # shared.SharedGeometryHandle while the geometry lives in shared memory
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # The world-space vertices are as large as the mesh and cheap to rebuild
+        state["_world_cache"] = None
+        handle = state["_shared_geometry"]
+        if handle is not None:
+            # Shared geometry travels as segment names; the receiving process maps the same memory
+            for info in handle.arrays:
+                del state[info.key]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        handle = state.get("_shared_geometry")
+        if handle is not None:
+            state.update(handle.attach())
+            # The handle keeps the segments open: put it last so teardown releases the views before closing them
+            state["_shared_geometry"] = state.pop("_shared_geometry")
+        self.__dict__.update(state)
+
+    @classmethod
+    def from_file(cls, path: str, use_cache: bool = True, dtype=np.float64) -> "Object3D":
+        """Builds an object from an OBJ or PLY file (see mesh_io.load_mesh for the binary cache)."""
+        from mesh_io import load_mesh
+        vertices, edges, faces = load_mesh(path, use_cache=use_cache)
+        return cls(vertices, edges, faces=faces, dtype=dtype)
 
     def reset(self):
-        """Resets the object to its initial state."""
-        self.__init__()
+        """Resets the object's transform to its initial state (the geometry is kept)."""
+        self.position = self._initial_position.copy()
+        self.set_model_matrix(np.identity(4))
     
     def get_position(self) -> np.ndarray:
         return self.position
     
+    def get_model_matrix(self) -> np.ndarray:
+        return self.model_matrix
+
+    def set_model_matrix(self, matrix: np.ndarray) -> None:
+        """Replaces the accumulated model matrix (local to the parent, if any)."""
+        self.model_matrix = np.array(matrix, dtype=float)
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """Invalidates the world matrix of this node and its subtree; vertices are only touched when read again."""
+        self.version += 1
+        self._world_matrix = None
+        for child in self.children:
+            child._mark_dirty()
+
+    # Hierarchy
+
+    def add_child(self, child: "Object3D") -> "Object3D":
+        """Attaches child below this node; its model matrix becomes relative to this node's world matrix."""
+        node = self
+        while node is not None:
+            if node is child:
+                raise ValueError("Cannot attach an object to itself or to one of its descendants")
+            node = node.parent
+        if child.parent is not None:
+            child.parent.remove_child(child)
+        child.parent = self
+        self.children.append(child)
+        child._mark_dirty()
+        return child
+
+    def remove_child(self, child: "Object3D") -> None:
+        self.children.remove(child)
+        child.parent = None
+        child._mark_dirty()
+
+    def iter_subtree(self):
+        """Yields this node and all of its descendants, depth first."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def get_world_matrix(self) -> np.ndarray:
+        """Parent's world matrix @ local model matrix, cached until this node or an ancestor changes."""
+        matrix = self._world_matrix
+        if matrix is None:
+            if self.parent is None:
+                matrix = self.model_matrix
+            else:
+                matrix = self.parent.get_world_matrix() @ self.model_matrix
+            self._world_matrix = matrix
+        return matrix
+
     def get_vertices(self) -> np.ndarray:
-        return self.vertices
+        """
+        Returns the world-space vertices (world matrix applied to the original vertices).
+        Computed once per transform change and cached (read-only) until the next one.
+        """
+        cache = self._world_cache
+        if cache is not None and cache[0] == self.version:
+            return cache[1]
+        version, matrix = self.version, self.get_world_matrix()
+        world = self.vertices @ matrix.T.astype(self.dtype, copy=False)
+        world.flags.writeable = False
+        self._world_cache = (version, world)
+        return world
     
-    def get_edges(self) -> List[List[int]]:
+    def get_local_bounds(self) -> np.ndarray:
+        """Axis-aligned box of the original vertices as [[xmin, ymin, zmin], [xmax, ymax, zmax]] (computed once)."""
+        if self._local_bounds is None:
+            if len(self.vertices) == 0:
+                self._local_bounds = np.zeros((2, 3))
+            else:
+                self._local_bounds = np.array([self.vertices[:, :3].min(axis=0), self.vertices[:, :3].max(axis=0)])
+        return self._local_bounds
+
+    def get_bounds(self) -> np.ndarray:
+        """
+        World-space axis-aligned box enclosing the object, from the local box's corners and the model matrix.
+        Conservative under rotation, and never touches the vertices after the first call.
+        """
+        cache = self._bounds_cache
+        if cache is not None and cache[0] == self.version:
+            return cache[1]
+        version, matrix = self.version, self.get_world_matrix()
+        corners = box_corners(self.get_local_bounds()) @ matrix.T
+        bounds = np.array([corners[:, :3].min(axis=0), corners[:, :3].max(axis=0)])
+        self._bounds_cache = (version, bounds)
+        return bounds
+
+    def get_edges(self) -> np.ndarray:
         return self.edges
+
+    def get_edge_strips(self) -> List[np.ndarray]:
+        """Returns the edges chained into polylines (built once, the topology never changes)."""
+        if self._strips is None:
+            self._strips = build_edge_strips(self.edges, len(self.vertices))
+        return self._strips
+
+    def get_strip_edge_ids(self) -> np.ndarray:
+        """
+        Edge index of each consecutive pair of the concatenated strips (-1 where one strip ends and the next starts),
+        so per-edge masks can be applied to strips.
+        """
+        if self._strip_edge_ids is None:
+            strips = self.get_edge_strips()
+            if not strips:
+                self._strip_edge_ids = np.zeros(0, dtype=np.int64)
+            else:
+                seq = np.concatenate(strips)
+                ids = self.find_edges(np.stack((seq[:-1], seq[1:]), axis=1))
+                ids[np.cumsum([len(strip) for strip in strips])[:-1] - 1] = -1
+                self._strip_edge_ids = ids
+        return self._strip_edge_ids
+
+    def find_edges(self, pairs: np.ndarray) -> np.ndarray:
+        """Index in self.edges of each (a, b) vertex pair, in either order; -1 for pairs that are not edges."""
+        n = max(len(self.vertices), 1)
+        if self._edge_lookup is None:
+            keys = np.sort(self.edges.astype(np.int64), axis=1)
+            keys = keys[:, 0] * n + keys[:, 1]
+            order = np.argsort(keys)
+            self._edge_lookup = (keys[order], order)
+        sorted_keys, order = self._edge_lookup
+
+        pairs = np.sort(np.asarray(pairs, dtype=np.int64).reshape(-1, 2), axis=1)
+        keys = pairs[:, 0] * n + pairs[:, 1]
+        if len(sorted_keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+        return np.where(sorted_keys[pos] == keys, order[pos], -1)
+
+    def get_faces(self) -> np.ndarray:
+        return self.faces
+
+    def get_edge_faces(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Edge/face incidence as two aligned arrays (edge index, face index), one entry per face side that is an edge.
+        Triangulation diagonals that are not edges are left out. Built once.
+        """
+        if self._edge_faces is None:
+            k = self.faces.shape[1]
+            sides = np.stack((self.faces, np.roll(self.faces, -1, axis=1)), axis=2).reshape(-1, 2)
+            edge_ids = self.find_edges(sides)
+            face_ids = np.repeat(np.arange(len(self.faces)), k)
+            found = edge_ids >= 0
+            self._edge_faces = (edge_ids[found], face_ids[found])
+        return self._edge_faces
     
     # Transformation methods
+
+    def _apply(self, matrix: np.ndarray) -> None:
+        """Composes a transform on top of the model matrix (applied after the previous ones)."""
+        self.set_model_matrix(matrix @ self.model_matrix)
     
     def translate(self, translation_vector: Sequence[float]) -> None:
         """
@@ -55,7 +320,7 @@ class Object3D:
             [0.0, 0.0, 1.0, tz],
             [0.0, 0.0, 0.0, 1.0]
         ], dtype=float)
-        self.vertices = self.vertices @ translation_matrix.T
+        self._apply(translation_matrix)
         self.position += np.array([tx, ty, tz], dtype=float)
     
     def scale(self, scale_factors: Sequence[float]) -> None:
@@ -69,7 +334,7 @@ class Object3D:
             [0.0, 0.0, sz, 0.0],
             [0.0, 0.0, 0.0, 1.0]
         ], dtype=float)
-        self.vertices = self.vertices @ scale_matrix.T
+        self._apply(scale_matrix)
         
     def pitch(self, angle: float) -> None:
         """
@@ -83,7 +348,7 @@ class Object3D:
             [0.0, sin_a, cos_a, 0.0],
             [0.0, 0.0, 0.0, 1.0]
         ], dtype=float)
-        self.vertices = self.vertices @ rotation_matrix.T
+        self._apply(rotation_matrix)
     
     def yaw(self, angle: float) -> None:
         """
@@ -97,7 +362,7 @@ class Object3D:
             [-sin_a, 0.0, cos_a, 0.0],
             [0.0, 0.0, 0.0, 1.0]
         ], dtype=float)
-        self.vertices = self.vertices @ rotation_matrix.T
+        self._apply(rotation_matrix)
         
     def roll(self, angle: float) -> None:
         """
@@ -111,6 +376,41 @@ class Object3D:
             [0.0, 0.0, 1.0, 0.0],
             [0.0, 0.0, 0.0, 1.0]
         ], dtype=float)
-        self.vertices = self.vertices @ rotation_matrix.T
+        self._apply(rotation_matrix)
     
     # ------------------------------- #
+
+
+class InstancedObject:
+    """
+    One shared Object3D mesh drawn K times, each copy with its own model matrix from a (K, 4, 4) stack.
+    The copies use the mesh's original vertices; the mesh's own transform is not applied to them.
+    """
+
+    def __init__(self, mesh: Object3D, model_matrices: Optional[np.ndarray] = None):
+        self.mesh = mesh
+        self.model_matrices = np.zeros((0, 4, 4))
+        self.version = 0
+        if model_matrices is not None:
+            self.set_model_matrices(model_matrices)
+
+    def __len__(self) -> int:
+        return len(self.model_matrices)
+
+    def set_model_matrices(self, model_matrices: np.ndarray) -> None:
+        self.model_matrices = np.array(model_matrices, dtype=float).reshape(-1, 4, 4)
+        self.version += 1
+
+    def add_instance(self, matrix: Optional[np.ndarray] = None) -> int:
+        """Appends an instance (identity by default) and returns its index."""
+        matrix = np.identity(4) if matrix is None else np.asarray(matrix, dtype=float)
+        self.set_model_matrices(np.concatenate((self.model_matrices, matrix.reshape(1, 4, 4))))
+        return len(self.model_matrices) - 1
+
+    def get_model_matrices(self) -> np.ndarray:
+        return self.model_matrices
+
+    def get_bounds(self) -> np.ndarray:
+        """(K, 2, 3) world-space boxes of the instances, from the mesh's local box corners."""
+        corners = box_corners(self.mesh.get_local_bounds()) @ self.model_matrices.transpose(0, 2, 1)
+        return np.stack((corners[..., :3].min(axis=1), corners[..., :3].max(axis=1)), axis=1)
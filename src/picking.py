@@ -0,0 +1,137 @@
+import numpy as np
+from typing import Optional, Tuple
+from clipping import clip_segments, frustum_planes, inside_mask
+
+# Adaptive grid cells aim for about this many items each
+ITEMS_PER_CELL = 8
+
+
+class ScreenGrid:
+    """
+    Uniform grid over a pixel rectangle. Each item is registered in every cell its box [xmin, ymin, xmax, ymax]
+    overlaps, stored CSR-style (item ids sorted by cell, plus each cell's start offset).
+    """
+
+    def __init__(self, boxes: np.ndarray, origin: Tuple[float, float], size: Tuple[float, float],
+                 cell_size: Optional[float] = None):
+        boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+        width, height = max(float(size[0]), 1.0), max(float(size[1]), 1.0)
+        if cell_size is None:
+            cell_size = np.sqrt(width * height * ITEMS_PER_CELL / max(len(boxes), 1))
+            cell_size = float(np.clip(cell_size, 2.0, 64.0))
+        self.cell_size = cell_size
+        self.x0, self.y0 = float(origin[0]), float(origin[1])
+        self.nx = int(np.ceil(width / cell_size)) + 1
+        self.ny = int(np.ceil(height / cell_size)) + 1
+
+        cx0, cy0 = self._cell(boxes[:, 0], boxes[:, 1])
+        cx1, cy1 = self._cell(boxes[:, 2], boxes[:, 3])
+        span_x = cx1 - cx0 + 1
+        counts = span_x * (cy1 - cy0 + 1)
+        item = np.repeat(np.arange(len(boxes)), counts)
+        local = np.arange(len(item)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = (cy0[item] + local // span_x[item]) * self.nx + cx0[item] + local % span_x[item]
+
+        order = np.argsort(cells, kind="stable")
+        self.items = item[order]
+        self.starts = np.searchsorted(cells[order], np.arange(self.nx * self.ny + 1))
+
+    def _cell(self, x, y) -> Tuple[np.ndarray, np.ndarray]:
+        cx = np.clip(np.floor((np.asarray(x) - self.x0) / self.cell_size), 0, self.nx - 1).astype(np.int64)
+        cy = np.clip(np.floor((np.asarray(y) - self.y0) / self.cell_size), 0, self.ny - 1).astype(np.int64)
+        return cx, cy
+
+    def candidates(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Ids of the items registered in the cells touched by the square of half-side radius around (x, y)."""
+        (cx0, cx1), (cy0, cy1) = self._cell([x - radius, x + radius], [y - radius, y + radius])
+        cells = (np.arange(cy0, cy1 + 1)[:, None] * self.nx + np.arange(cx0, cx1 + 1)[None, :]).ravel()
+        starts, ends = self.starts[cells], self.starts[cells + 1]
+        counts = ends - starts
+        index = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+        return np.unique(self.items[index])
+
+
+class ScreenIndex:
+    """
+    Spatial index over one projection of an object: its visible vertices and clipped edges in viewport pixels.
+    Queries only look at the grid cells within max_distance of the point, so their cost does not grow with the mesh.
+    """
+
+    def __init__(self, cam, vertices: np.ndarray, edges: np.ndarray, cell_size: Optional[float] = None):
+        origin = (min(cam.xminv, cam.xmaxv), min(cam.yminv, cam.ymaxv))
+        size = (abs(cam.xmaxv - cam.xminv), abs(cam.ymaxv - cam.yminv))
+        clip = cam.project_to_clip(vertices)
+        planes = frustum_planes(cam, all_planes=True)
+
+        inside = inside_mask(clip, planes)
+        pixels = cam.clip_to_viewport(clip)
+        self.vertex_ids = np.flatnonzero(inside)
+        self.points = pixels[self.vertex_ids]
+        self.vertex_grid = ScreenGrid(np.concatenate((self.points, self.points), axis=1), origin, size, cell_size)
+
+        # Only edges with an endpoint outside the frustum need clipping
+        edges = np.asarray(edges).reshape(-1, 2)
+        safe = inside[edges[:, 0]] & inside[edges[:, 1]]
+        unsafe = np.flatnonzero(~safe)
+        c0, c1, keep = clip_segments(clip[edges[unsafe, 0]], clip[edges[unsafe, 1]], planes)
+        safe = np.flatnonzero(safe)
+        self.edge_ids = np.concatenate((safe, unsafe[keep]))
+        self.p0 = np.concatenate((pixels[edges[safe, 0]], cam.clip_to_viewport(c0)))
+        self.p1 = np.concatenate((pixels[edges[safe, 1]], cam.clip_to_viewport(c1)))
+        boxes = np.concatenate((np.minimum(self.p0, self.p1), np.maximum(self.p0, self.p1)), axis=1)
+        self.edge_grid = ScreenGrid(boxes, origin, size, cell_size)
+
+    def nearest_vertex(self, x: float, y: float, max_distance: float = 10.0) -> Optional[Tuple[int, float]]:
+        """(vertex index, pixel distance) of the visible vertex closest to (x, y), or None beyond max_distance."""
+        candidates = self.vertex_grid.candidates(x, y, max_distance)
+        if len(candidates) == 0:
+            return None
+        distance = np.hypot(self.points[candidates, 0] - x, self.points[candidates, 1] - y)
+        best = int(np.argmin(distance))
+        if distance[best] > max_distance:
+            return None
+        return int(self.vertex_ids[candidates[best]]), float(distance[best])
+
+    def nearest_edge(self, x: float, y: float, max_distance: float = 10.0) -> Optional[Tuple[int, float]]:
+        """(edge index, pixel distance) of the visible edge closest to (x, y), or None beyond max_distance."""
+        candidates = self.edge_grid.candidates(x, y, max_distance)
+        if len(candidates) == 0:
+            return None
+        a, b = self.p0[candidates], self.p1[candidates]
+        d = b - a
+        length2 = np.einsum("ij,ij->i", d, d)
+        point = np.array([x, y], dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.clip(np.einsum("ij,ij->i", point - a, d) / length2, 0.0, 1.0)
+        t = np.where(length2 > 0, t, 0.0)
+        distance = np.linalg.norm(a + t[:, None] * d - point, axis=1)
+        best = int(np.argmin(distance))
+        if distance[best] > max_distance:
+            return None
+        return int(self.edge_ids[candidates[best]]), float(distance[best])
+
+
+class Picker:
+    """
+    Picks vertices and edges of an Object3D under the mouse. The ScreenIndex is rebuilt lazily, only when the
+    object's or the camera's version has changed since the last query (see Object3D.version, Camera.invalidate).
+    """
+
+    def __init__(self, obj, cell_size: Optional[float] = None):
+        self.obj = obj
+        self.cell_size = cell_size
+        self._index: Optional[ScreenIndex] = None
+        self._key = None
+
+    def index(self, cam) -> ScreenIndex:
+        key = (self.obj.version, id(cam), cam.version)
+        if self._index is None or key != self._key:
+            self._index = ScreenIndex(cam, self.obj.get_vertices(), self.obj.get_edges(), self.cell_size)
+            self._key = key
+        return self._index
+
+    def nearest_vertex(self, cam, x: float, y: float, max_distance: float = 10.0) -> Optional[Tuple[int, float]]:
+        return self.index(cam).nearest_vertex(x, y, max_distance)
+
+    def nearest_edge(self, cam, x: float, y: float, max_distance: float = 10.0) -> Optional[Tuple[int, float]]:
+        return self.index(cam).nearest_edge(x, y, max_distance)
@@ -0,0 +1,108 @@
+import numpy as np
+from typing import Callable, List, Optional, Tuple
+from clipping import clip_strips, strip_keep_mask
+
+
+class Pipeline:
+    """
+    Wireframe pipeline of one Object3D with every intermediate array cached: world-space vertices, clip space,
+    NDC, the back-face keep mask, the clipped polylines in NDC and finally the viewport coordinates.
+    Each stage is keyed on the versions of the inputs that produced it (Object3D.version and the camera's
+    view_version, projection_version, window_version and viewport_version), so an edit only recomputes the
+    stages downstream of it: set_viewport costs one 2D affine transform of the clipped polylines, set_window
+    a re-clip of the cached clip-space vertices, and only object or view/projection changes re-project.
+
+    The keys hold versions, not the camera's identity, so use one Pipeline per (object, camera) pair;
+    snapshots of the same camera (copy.deepcopy) keep its versions and reuse the cache.
+    recomputed lists the stages the last polylines()/coords() call had to rebuild.
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.recomputed: List[str] = []
+        self._cache = {}  # stage name -> (key, value)
+
+    def _stage(self, name: str, key, compute: Callable):
+        cache = self._cache.get(name)
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        value = compute()
+        self._cache[name] = (key, value)
+        self.recomputed.append(name)
+        return value
+
+    def clear(self) -> None:
+        self._cache = {}
+
+    # ------------------------------- #
+
+    # Stages; `world` optionally passes a (version, world matrix) snapshot taken by another thread
+
+    def world(self, world: Optional[Tuple[int, np.ndarray]] = None):
+        """(key, world-space vertices)."""
+        if world is None:
+            key = self.obj.version
+            return key, self._stage("world", key, self.obj.get_vertices)
+        key, matrix = world
+        return key, self._stage("world", key, lambda: self.obj.vertices @ matrix.T)
+
+    def clip(self, cam, world: Optional[Tuple[int, np.ndarray]] = None):
+        """(key, clip-space vertices)."""
+        world_key, vertices = self.world(world)
+        key = (world_key, cam.view_version, cam.projection_version)
+        return key, self._stage("clip", key, lambda: cam.project_to_clip(vertices))
+
+    def ndc(self, cam, world: Optional[Tuple[int, np.ndarray]] = None):
+        """(key, NDC x, y of the vertices)."""
+        key, clip = self.clip(cam, world)
+        return key, self._stage("ndc", key, lambda: cam.perspective_divide(clip))
+
+    def keep(self, cam, cull_back_faces: bool, world: Optional[Tuple[int, np.ndarray]] = None):
+        """(key, strip keep mask or None); see clipping.strip_keep_mask."""
+        if not cull_back_faces or len(self.obj.get_faces()) == 0:
+            return None, None
+        world_key, vertices = self.world(world)
+        key = (world_key, cam.view_version, cam.projection_version)
+        return key, self._stage("keep", key, lambda: strip_keep_mask(cam, self.obj, True, vertices))
+
+    def ndc_polylines(self, cam, all_planes: bool = False, cull_back_faces: bool = False,
+                      world: Optional[Tuple[int, np.ndarray]] = None):
+        """(key, (P, 2) NDC points of all clipped polylines, (K,) offsets splitting them into polylines)."""
+        clip_key, clip = self.clip(cam, world)
+        _, ndc = self.ndc(cam, world)
+        keep_key, keep = self.keep(cam, cull_back_faces, world)
+        # The side planes follow the window; the near plane alone does not
+        key = (clip_key, cam.window_version if all_planes else None, all_planes, keep_key)
+
+        def compute():
+            polylines = clip_strips(cam, clip, self.obj.get_edge_strips(), all_planes, keep, ndc, ndc=True)
+            if not polylines:
+                return np.zeros((0, 2), dtype=ndc.dtype), np.zeros(0, dtype=np.int64)
+            offsets = np.cumsum([len(polyline) for polyline in polylines])[:-1]
+            return np.concatenate(polylines), offsets
+
+        return key, self._stage("ndc_polylines", key, compute)
+
+    def polylines(self, cam, all_planes: bool = False, cull_back_faces: bool = False,
+                  world: Optional[Tuple[int, np.ndarray]] = None) -> List[np.ndarray]:
+        """Same polylines as clipping.project_object_strips, in viewport pixels."""
+        self.recomputed = []
+        key, (points, offsets) = self.ndc_polylines(cam, all_planes, cull_back_faces, world)
+        key = (key, cam.window_version, cam.viewport_version)
+        pixels = self._stage("pixels", key, lambda: cam.ndc_to_viewport(points))
+        return np.split(pixels, offsets) if len(pixels) else []
+
+    def coords(self, cam, all_planes: bool = False, cull_back_faces: bool = False,
+               world: Optional[Tuple[int, np.ndarray]] = None) -> List[List[float]]:
+        """polylines() as flat [x0, y0, x1, y1, ...] lists, ready for canvas.coords."""
+        self.recomputed = []
+        key, (points, offsets) = self.ndc_polylines(cam, all_planes, cull_back_faces, world)
+        key = (key, cam.window_version, cam.viewport_version)
+
+        def compute():
+            # Slicing the flat array before tolist() builds each float list once
+            flat = cam.ndc_to_viewport(points).ravel()
+            bounds = [0] + (2 * offsets).tolist() + [len(flat)]
+            return [flat[a:b].tolist() for a, b in zip(bounds[:-1], bounds[1:])] if len(flat) else []
+
+        return self._stage("coords", key, compute)
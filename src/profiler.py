@@ -0,0 +1,177 @@
+import os
+import json
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Deque, Dict, List, NamedTuple
+
+
+class StageSample(NamedTuple):
+    name: str
+    start: float      # seconds since the profiler was created
+    duration: float   # seconds
+    allocated: int    # peak bytes allocated during the stage (0 without track_memory)
+
+
+class FrameSample(NamedTuple):
+    start: float
+    duration: float
+    stages: List[StageSample]
+    counts: Dict[str, int]
+
+
+class PipelineProfiler:
+    """
+    Records the wall time of each pipeline stage for every frame, plus counters (vertices, edges, ...)
+    and, with track_memory, the bytes allocated per stage (tracemalloc peak; set_track_memory switches it
+    at runtime). Only the last max_frames frames are kept. While disabled, frame() and stage() are no-ops.
+
+        with profiler.frame():
+            with profiler.stage("view"):
+                ...
+            profiler.count(vertices=n)
+    """
+
+    def __init__(self, enabled: bool = True, track_memory: bool = False, max_frames: int = 1000):
+        self.enabled = enabled
+        self.track_memory = False
+        self.frames: Deque[FrameSample] = deque(maxlen=max_frames)
+        self._origin = time.perf_counter()
+        self._stages: List[StageSample] = []
+        self._counts: Dict[str, int] = {}
+        self._started_tracing = False
+        self.set_track_memory(track_memory)
+
+    def set_track_memory(self, track_memory: bool) -> None:
+        """
+        Turns the per-stage allocation tracking on or off. tracemalloc slows every allocation down, so it is
+        only stopped again if this profiler started it.
+        """
+        self.track_memory = track_memory
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        elif not track_memory and self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    @contextmanager
+    def _frame(self):
+        self._stages, self._counts = [], {}
+        start = self._now()
+        try:
+            yield
+        finally:
+            self.frames.append(FrameSample(start, self._now() - start, self._stages, self._counts))
+            self._stages, self._counts = [], {}
+
+    def frame(self):
+        """Context manager around one redraw; stages and counts recorded inside belong to this frame."""
+        return self._frame() if self.enabled else nullcontext()
+
+    @contextmanager
+    def _stage(self, name: str):
+        tracing = self.track_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = self._now()
+        try:
+            yield
+        finally:
+            duration = self._now() - start
+            allocated = tracemalloc.get_traced_memory()[1] - base if tracing else 0
+            self._stages.append(StageSample(name, start, duration, allocated))
+
+    def stage(self, name: str):
+        """Context manager timing one stage of the current frame; repeated names add up in the summaries."""
+        return self._stage(name) if self.enabled else nullcontext()
+
+    def count(self, **counts: int) -> None:
+        """Adds to the current frame's counters, e.g. count(vertices=n, edges=m)."""
+        if self.enabled:
+            for key, value in counts.items():
+                self._counts[key] = self._counts.get(key, 0) + int(value)
+
+    def clear(self) -> None:
+        self.frames.clear()
+
+    # ------------------------------- #
+
+    # Summaries
+
+    def frame_time(self, frames: int = 30) -> float:
+        """Mean duration in seconds of the last `frames` frames (0 when nothing was recorded)."""
+        recent = list(self.frames)[-frames:]
+        return sum(f.duration for f in recent) / len(recent) if recent else 0.0
+
+    def fps(self, frames: int = 30) -> float:
+        """Frames per second the pipeline could sustain at the recent mean frame time."""
+        frame_time = self.frame_time(frames)
+        return 1.0 / frame_time if frame_time > 0 else 0.0
+
+    def stage_times(self, frames: int = 30) -> Dict[str, float]:
+        """Mean seconds per frame spent in each stage over the last `frames` frames, in first-seen order."""
+        recent = list(self.frames)[-frames:]
+        totals: Dict[str, float] = {}
+        for frame in recent:
+            for stage in frame.stages:
+                totals[stage.name] = totals.get(stage.name, 0.0) + stage.duration
+        return {name: total / len(recent) for name, total in totals.items()}
+
+    def stage_allocations(self, frames: int = 30) -> Dict[str, float]:
+        """Mean bytes per frame allocated in each stage over the last `frames` frames (0 without track_memory)."""
+        recent = list(self.frames)[-frames:]
+        totals: Dict[str, float] = {}
+        for frame in recent:
+            for stage in frame.stages:
+                totals[stage.name] = totals.get(stage.name, 0.0) + stage.allocated
+        return {name: total / len(recent) for name, total in totals.items()}
+
+    def hud_text(self, frames: int = 30) -> str:
+        """Short multi-line report for an on-screen overlay."""
+        if not self.frames:
+            return ""
+        lines = [f"{self.frame_time(frames) * 1e3:6.2f} ms  {self.fps(frames):6.1f} FPS"]
+        times = self.stage_times(frames)
+        if self.track_memory:
+            allocations = self.stage_allocations(frames)
+            lines += [f"{name:<10s} {seconds * 1e3:6.2f} ms {allocations[name] / 2 ** 20:7.2f} MB"
+                      for name, seconds in times.items()]
+        else:
+            lines += [f"{name:<10s} {seconds * 1e3:6.2f} ms" for name, seconds in times.items()]
+        counts = self.frames[-1].counts
+        if counts:
+            lines.append("  ".join(f"{key}={value}" for key, value in counts.items()))
+        return "\n".join(lines)
+
+    # ------------------------------- #
+
+    # Chrome trace export (chrome://tracing, Perfetto)
+
+    def chrome_trace(self) -> dict:
+        """The recorded frames as Chrome trace-event JSON: one complete ("X") event per frame and stage."""
+        pid = os.getpid()
+        events = []
+        for index, frame in enumerate(self.frames):
+            events.append({"name": "frame", "cat": "frame", "ph": "X", "pid": pid, "tid": 0,
+                           "ts": frame.start * 1e6, "dur": frame.duration * 1e6,
+                           "args": dict(frame.counts, index=index)})
+            for stage in frame.stages:
+                event = {"name": stage.name, "cat": "pipeline", "ph": "X", "pid": pid, "tid": 0,
+                         "ts": stage.start * 1e6, "dur": stage.duration * 1e6}
+                if self.track_memory:
+                    event["args"] = {"allocated_bytes": stage.allocated}
+                events.append(event)
+            if frame.counts:
+                events.append({"name": "counts", "ph": "C", "pid": pid, "tid": 0,
+                               "ts": frame.start * 1e6, "args": frame.counts})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
@@ -0,0 +1,184 @@
+import zlib
+import struct
+import numpy as np
+from typing import Sequence, Tuple
+from clipping import project_object_edges, project_instance_edges
+
+# Upper bound on line samples generated at once, keeps temporary arrays small for huge meshes
+MAX_SAMPLES_PER_BATCH = 1 << 22
+
+
+def clip_segments_to_rect(p0: np.ndarray, p1: np.ndarray, xmin: float, xmax: float,
+                          ymin: float, ymax: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Clips (M, 2) segments to a rectangle with a vectorized Liang-Barsky test.
+    Returns the clipped endpoints of the segments that are at least partly inside.
+    """
+    p0 = np.asarray(p0, dtype=float)
+    p1 = np.asarray(p1, dtype=float)
+    finite = np.isfinite(p0).all(axis=1) & np.isfinite(p1).all(axis=1)
+    p0, p1 = p0[finite], p1[finite]
+
+    d = p1 - p0
+    t0 = np.zeros(len(p0))
+    t1 = np.ones(len(p0))
+    keep = np.ones(len(p0), dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for p, q in ((-d[:, 0], p0[:, 0] - xmin), (d[:, 0], xmax - p0[:, 0]),
+                     (-d[:, 1], p0[:, 1] - ymin), (d[:, 1], ymax - p0[:, 1])):
+            parallel = p == 0
+            keep &= ~(parallel & (q < 0))
+            r = q / p
+            entering = p < 0
+            t0 = np.where(~parallel & entering, np.maximum(t0, r), t0)
+            t1 = np.where(~parallel & ~entering, np.minimum(t1, r), t1)
+    keep &= t0 <= t1
+
+    p0, p1, d, t0, t1 = p0[keep], p1[keep], d[keep], t0[keep], t1[keep]
+    return p0 + t0[:, None] * d, p0 + t1[:, None] * d
+
+
+def rasterize_lines(coverage: np.ndarray, p0: np.ndarray, p1: np.ndarray, antialias: bool = False) -> None:
+    """
+    Rasterizes (M, 2) pixel-space segments into a (H, W) float coverage buffer in [0, 1].
+    All segments are sampled at once (one sample per pixel along the major axis);
+    with antialias the coverage is split between the two nearest pixels on the minor axis.
+    """
+    height, width = coverage.shape
+    p0, p1 = clip_segments_to_rect(p0, p1, 0, width - 1, 0, height - 1)
+    if len(p0) == 0:
+        return
+
+    d = p1 - p0
+    steps = np.ceil(np.abs(d).max(axis=1)).astype(np.int64) + 1
+    ends = np.cumsum(steps)
+
+    # Split into batches of whole segments with a bounded number of samples
+    start = 0
+    while start < len(p0):
+        limit = (ends[start - 1] if start else 0) + MAX_SAMPLES_PER_BATCH
+        stop = max(start + 1, int(np.searchsorted(ends, limit, side="right")))
+        _rasterize_batch(coverage, p0[start:stop], d[start:stop], steps[start:stop], antialias)
+        start = stop
+
+
+def _rasterize_batch(coverage, p0, d, steps, antialias) -> None:
+    height, width = coverage.shape
+    segment = np.repeat(np.arange(len(p0)), steps)
+    first = np.concatenate(([0], np.cumsum(steps)[:-1]))
+    index = np.arange(len(segment)) - np.repeat(first, steps)
+    t = index / np.maximum(steps - 1, 1)[segment]
+    points = p0[segment] + t[:, None] * d[segment]
+
+    if not antialias:
+        xs = np.clip(np.rint(points[:, 0]).astype(np.int64), 0, width - 1)
+        ys = np.clip(np.rint(points[:, 1]).astype(np.int64), 0, height - 1)
+        coverage[ys, xs] = 1.0
+        return
+
+    # Major axis snaps to the sample's pixel, the minor axis is shared between two pixels
+    x_major = (np.abs(d[:, 0]) >= np.abs(d[:, 1]))[segment]
+    major = np.where(x_major, points[:, 0], points[:, 1])
+    minor = np.where(x_major, points[:, 1], points[:, 0])
+    base = np.floor(minor)
+    frac = minor - base
+    major = np.rint(major).astype(np.int64)
+    for offset, weight in ((0, 1.0 - frac), (1, frac)):
+        m = base.astype(np.int64) + offset
+        xs = np.where(x_major, major, m)
+        ys = np.where(x_major, m, major)
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        np.maximum.at(coverage, (ys[inside], xs[inside]), weight[inside])
+
+
+def composite(coverage: np.ndarray, background: Sequence[int], color: Sequence[int]) -> np.ndarray:
+    """Blends a line color over the background using the coverage buffer; returns an (H, W, 3) uint8 image."""
+    background = np.asarray(background, dtype=np.float32)
+    color = np.asarray(color, dtype=np.float32)
+    alpha = coverage[..., None].astype(np.float32)
+    return np.rint(background * (1 - alpha) + color * alpha).astype(np.uint8)
+
+
+# ------------------------------- #
+
+# Image files
+
+def save_ppm(path: str, image: np.ndarray) -> None:
+    """Writes an (H, W, 3) uint8 image as binary PPM (P6)."""
+    height, width = image.shape[:2]
+    with open(path, "wb") as f:
+        f.write(b"P6\n%d %d\n255\n" % (width, height))
+        f.write(np.ascontiguousarray(image, dtype=np.uint8).tobytes())
+
+
+def save_png(path: str, image: np.ndarray) -> None:
+    """Writes an (H, W, 3) uint8 image as an 8-bit RGB PNG, using only zlib."""
+    height, width = image.shape[:2]
+    # Every scanline starts with filter type 0 (None)
+    rows = np.zeros((height, 1 + width * 3), dtype=np.uint8)
+    rows[:, 1:] = np.asarray(image, dtype=np.uint8).reshape(height, width * 3)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        f.write(chunk(b"IEND", b""))
+
+
+def save_image(path: str, image: np.ndarray) -> None:
+    """Writes PNG or PPM depending on the file extension."""
+    if path.lower().endswith(".png"):
+        save_png(path, image)
+    elif path.lower().endswith((".ppm", ".pnm")):
+        save_ppm(path, image)
+    else:
+        raise ValueError(f"Unsupported image format: {path}")
+
+
+# ------------------------------- #
+
+class OffscreenRenderer:
+    """Draws an Object3D wireframe into a NumPy image, without Tk or a display server."""
+
+    def __init__(self, width: int = 800, height: int = 600,
+                 background: Sequence[int] = (0, 0, 0), color: Sequence[int] = (255, 255, 255),
+                 antialias: bool = False, all_planes: bool = True, cull_back_faces: bool = False):
+        self.width = width
+        self.height = height
+        self.background = background
+        self.color = color
+        self.antialias = antialias
+        self.all_planes = all_planes
+        self.cull_back_faces = cull_back_faces
+
+    def render_segments(self, p0: np.ndarray, p1: np.ndarray) -> np.ndarray:
+        """Rasterizes (M, 2) pixel-space segments into an (H, W, 3) uint8 image."""
+        coverage = np.zeros((self.height, self.width), dtype=np.float32)
+        rasterize_lines(coverage, p0, p1, self.antialias)
+        return composite(coverage, self.background, self.color)
+
+    def render(self, obj, cam) -> np.ndarray:
+        """Runs the Camera pipeline on the object and returns the wireframe image."""
+        p0, p1 = project_object_edges(cam, obj, self.all_planes, self.cull_back_faces)
+        return self.render_segments(p0, p1)
+
+    def render_scene(self, scene, cam) -> np.ndarray:
+        """Renders every object of the scene that survives frustum culling, at its LOD level."""
+        segments = [project_object_edges(cam, obj, self.all_planes, self.cull_back_faces)
+                    for obj in scene.drawable_objects(cam, self.all_planes)]
+        if not segments:
+            return self.render_segments(np.zeros((0, 2)), np.zeros((0, 2)))
+        return self.render_segments(np.concatenate([s[0] for s in segments]), np.concatenate([s[1] for s in segments]))
+
+    def render_instances(self, instanced, cam) -> np.ndarray:
+        """Renders every visible copy of an InstancedObject, projected in one batched pass."""
+        p0, p1 = project_instance_edges(cam, instanced, self.all_planes)
+        return self.render_segments(p0, p1)
+
+    def render_to_file(self, obj, cam, path: str) -> np.ndarray:
+        image = self.render(obj, cam)
+        save_image(path, image)
+        return image
@@ -0,0 +1,160 @@
+import sys
+import math
+import argparse
+import numpy as np
+from typing import Optional, Sequence
+from object import Object3D
+from camera import Camera, ProjectionType
+from scene import Scene
+from clipping import project_object_edges
+from raster import OffscreenRenderer, save_image
+
+# Headless entry point: never imports tkinter (nor main.py), so scripts and batch jobs skip the GUI entirely
+
+IMAGE_EXTENSIONS = (".png", ".ppm", ".pnm")
+COORDINATE_EXTENSIONS = (".npy", ".csv", ".txt")
+
+
+def build_camera(args: argparse.Namespace) -> Camera:
+    """
+    Camera from the parsed options. Built through the constructor and setters that do not print.
+    The camera looks at --target, unless --rotation gives a pitch or yaw: it then looks along those angles
+    (Camera with no target). Roll applies either way.
+    """
+    width, height = args.size
+    projection = ProjectionType.ORTHOGRAPHIC if args.projection == "orthographic" else ProjectionType.PERSPECTIVE
+    pitch, yaw, roll = (math.radians(angle) for angle in args.rotation)
+    target = np.array(args.target if args.target is not None else (0.0, 0.0, 0.0), dtype=float)
+    cam = Camera(*args.position, pitch=pitch, yaw=yaw, roll=roll, target=target,
+                 projection=projection, f=math.radians(args.fov), width=width, height=height,
+                 near=args.near, far=args.far, dtype=args.dtype)
+    if pitch or yaw:
+        cam.target = None
+        cam.invalidate()
+
+    # Orbit angles place the camera around the target, like Camera.orbit
+    if args.orbit is not None or args.radius is not None:
+        theta, phi = args.orbit if args.orbit is not None else (0.0, 0.0)
+        cam.theta, cam.phi = math.radians(theta), math.radians(phi)
+        if args.radius is not None:
+            cam.radius = args.radius
+        cam.update()
+
+    # The orthographic projection is built from the window
+    window = args.ortho if args.ortho is not None else args.window
+    if window is not None:
+        cam.set_window(*window)
+    if args.viewport is not None:
+        cam.set_viewport(*args.viewport)
+    return cam
+
+
+def projected_coordinates(scene: Scene, cam: Camera, segments: bool = False,
+                          all_planes: bool = True, cull_back_faces: bool = False) -> np.ndarray:
+    """
+    (N, 2) viewport pixels of every vertex of the scene's objects (no clipping, so points behind the camera
+    come out mirrored), or with segments, the (M, 4) x0, y0, x1, y1 of the edges after clipping and culling.
+    """
+    if not segments:
+        vertices = [cam.project_vertices(obj.get_vertices()) for obj in scene.nodes()]
+        return np.concatenate(vertices) if vertices else np.zeros((0, 2))
+    edges = [np.concatenate(project_object_edges(cam, obj, all_planes, cull_back_faces), axis=1)
+             for obj in scene.drawable_objects(cam, all_planes)]
+    return np.concatenate(edges) if edges else np.zeros((0, 4))
+
+
+def save_coordinates(path: str, coords: np.ndarray) -> None:
+    """.npy keeps the array as is; anything else (or - for stdout) is text, one row per line."""
+    if path.lower().endswith(".npy"):
+        np.save(path, coords)
+    elif path == "-":
+        np.savetxt(sys.stdout, coords, fmt="%.6f")
+    else:
+        np.savetxt(path, coords, fmt="%.6f", delimiter="," if path.lower().endswith(".csv") else " ")
+
+
+def render_image(scene: Scene, cam: Camera, args: argparse.Namespace) -> np.ndarray:
+    if args.solid:
+        # Imported here: only solid renders need the tile rasterizer and its process pool
+        from solid import SolidRenderer
+        with SolidRenderer(cam.width, cam.height, workers=args.workers) as renderer:
+            return renderer.render_scene(scene, cam)
+    renderer = OffscreenRenderer(cam.width, cam.height, antialias=args.antialias,
+                                 all_planes=not args.near_only, cull_back_faces=args.cull_back_faces)
+    return renderer.render_scene(scene, cam)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Renders meshes with the Object3D/Camera pipeline without opening a window.")
+    parser.add_argument("meshes", nargs="+", metavar="MESH", help="OBJ or PLY files")
+    parser.add_argument("-o", "--output", required=True,
+                        help="image (.png, .ppm) or projected coordinates (.npy, .csv, .txt, - for stdout)")
+    parser.add_argument("--segments", action="store_true",
+                        help="write the clipped edges (x0 y0 x1 y1) instead of one x, y per vertex")
+
+    camera = parser.add_argument_group("camera")
+    camera.add_argument("--size", type=int, nargs=2, default=(800, 600), metavar=("W", "H"), help="image size")
+    camera.add_argument("--position", type=float, nargs=3, default=(0.0, 0.0, 5.0), metavar=("X", "Y", "Z"))
+    camera.add_argument("--target", type=float, nargs=3, metavar=("X", "Y", "Z"),
+                        help="point the camera looks at (default: the origin)")
+    camera.add_argument("--rotation", type=float, nargs=3, default=(0.0, 0.0, 0.0), metavar=("PITCH", "YAW", "ROLL"),
+                        help="degrees; a pitch or yaw aims the camera by angle (yaw 0 looks down +z) "
+                             "instead of at a target")
+    camera.add_argument("--orbit", type=float, nargs=2, metavar=("THETA", "PHI"),
+                        help="orbit angles around the target in degrees (overrides --position)")
+    camera.add_argument("--radius", type=float, help="orbit distance to the target")
+    camera.add_argument("--dtype", choices=("float64", "float32"), default="float64", help="pipeline precision")
+
+    projection = parser.add_argument_group("projection")
+    projection.add_argument("--projection", choices=("perspective", "orthographic"), default="perspective")
+    projection.add_argument("--fov", type=float, default=45.0, help="perspective field of view in degrees")
+    projection.add_argument("--near", type=float, default=0.1)
+    projection.add_argument("--far", type=float, default=1000.0)
+    projection.add_argument("--ortho", type=float, nargs=4, metavar=("LEFT", "RIGHT", "BOTTOM", "TOP"),
+                            help="orthographic bounds (implies --projection orthographic)")
+
+    mapping = parser.add_argument_group("mapping")
+    mapping.add_argument("--window", type=float, nargs=4, metavar=("XMIN", "XMAX", "YMIN", "YMAX"))
+    mapping.add_argument("--viewport", type=float, nargs=4, metavar=("XMIN", "XMAX", "YMIN", "YMAX"))
+
+    drawing = parser.add_argument_group("drawing")
+    drawing.add_argument("--solid", action="store_true", help="flat-shaded faces instead of the wireframe")
+    drawing.add_argument("--workers", type=int, help="processes for --solid (default: one per CPU)")
+    drawing.add_argument("--antialias", action="store_true")
+    drawing.add_argument("--cull-back-faces", action="store_true", help="skip edges that only belong to back faces")
+    drawing.add_argument("--near-only", action="store_true", help="clip against the near plane only")
+    args = parser.parse_args(argv)
+
+    output = args.output.lower()
+    if output != "-" and not output.endswith(IMAGE_EXTENSIONS + COORDINATE_EXTENSIONS):
+        parser.error(f"unsupported output {args.output!r}: use an image ({', '.join(IMAGE_EXTENSIONS)}) "
+                     f"or coordinates ({', '.join(COORDINATE_EXTENSIONS)}, - for stdout)")
+    if args.rotation[0] or args.rotation[1]:
+        # Without a target there is nothing to look at or orbit around
+        for option, value in (("--target", args.target), ("--orbit", args.orbit), ("--radius", args.radius)):
+            if value is not None:
+                parser.error(f"a --rotation pitch/yaw aims the camera by angle and cannot be combined with {option}")
+
+    if args.ortho is not None:
+        args.projection = "orthographic"
+        if args.window is not None:
+            parser.error("--ortho and --window both set the window bounds")
+
+    try:
+        scene = Scene([Object3D.from_file(path, dtype=args.dtype) for path in args.meshes])
+    except (OSError, ValueError) as error:
+        print(f"Error loading mesh: {error}", file=sys.stderr)
+        return 1
+    cam = build_camera(args)
+
+    if output.endswith(IMAGE_EXTENSIONS):
+        save_image(args.output, render_image(scene, cam, args))
+    else:
+        coords = projected_coordinates(scene, cam, args.segments, not args.near_only, args.cull_back_faces)
+        save_coordinates(args.output, coords)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
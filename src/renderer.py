@@ -0,0 +1,110 @@
+from typing import Dict, List, Sequence
+from clipping import clip_strips, project_instance_strips, strip_keep_mask
+from pipeline import Pipeline
+
+
+class CanvasRenderer:
+    """
+    Retained-mode wireframe renderer for a Tk canvas. It owns the line items it created and,
+    between frames, moves them with canvas.coords instead of deleting and recreating them.
+    Items are only created or deleted when the number of polylines changes.
+    With all_planes, edges are clipped to the whole view frustum instead of only the near plane;
+    with cull_back_faces, edges that only belong to faces turned away from the camera are skipped.
+    Each object's intermediate arrays are cached in a pipeline.Pipeline, so a frame only recomputes the stages
+    downstream of what changed (a viewport edit is just a 2D mapping). With an enabled profiler
+    (profiler.PipelineProfiler), draw_scene recomputes and times every pipeline stage separately.
+    """
+
+    def __init__(self, canvas, fill: str = "white", width: float = 1, all_planes: bool = True,
+                 cull_back_faces: bool = False, profiler=None):
+        self.canvas = canvas
+        self.fill = fill
+        self.width = width
+        self.all_planes = all_planes
+        self.cull_back_faces = cull_back_faces
+        self.profiler = profiler
+        self.items: List[int] = []
+        self._pipelines: Dict[int, Pipeline] = {}
+
+    def draw_polylines(self, polylines: Sequence[Sequence[float]]) -> None:
+        """Draws flat [x0, y0, x1, y1, ...] coordinate lists, reusing the existing items in order."""
+        items = self.items
+        for item, coords in zip(items, polylines):
+            self.canvas.coords(item, coords)
+
+        if len(polylines) > len(items):
+            for coords in polylines[len(items):]:
+                items.append(self.canvas.create_line(coords, fill=self.fill, width=self.width))
+        elif len(polylines) < len(items):
+            for item in items[len(polylines):]:
+                self.canvas.delete(item)
+            del items[len(polylines):]
+
+    def pipeline(self, obj) -> Pipeline:
+        """The cached pipeline of the object (a new one if the id was reused by another object)."""
+        pipeline = self._pipelines.get(id(obj))
+        if pipeline is None or pipeline.obj is not obj:
+            pipeline = self._pipelines[id(obj)] = Pipeline(obj)
+        return pipeline
+
+    def _prune_pipelines(self, objects: Sequence) -> None:
+        if len(self._pipelines) > 4 * max(len(objects), 1):
+            live = {id(obj) for obj in objects}
+            self._pipelines = {key: value for key, value in self._pipelines.items() if key in live}
+
+    def draw(self, obj, cam) -> None:
+        """Projects and clips the object with the camera and draws one line item per polyline."""
+        self.draw_polylines(self.pipeline(obj).coords(cam, self.all_planes, self.cull_back_faces))
+
+    def draw_scene(self, scene, cam) -> None:
+        """Draws every object of the scene that survives frustum culling (at its LOD level) into the same set of items."""
+        if self.profiler is not None and self.profiler.enabled:
+            self._draw_scene_profiled(scene, cam)
+            return
+        objects = scene.drawable_objects(cam, self.all_planes)
+        coords = []
+        for obj in objects:
+            coords.extend(self.pipeline(obj).coords(cam, self.all_planes, self.cull_back_faces))
+        self._prune_pipelines(objects)
+        self.draw_polylines(coords)
+
+    def _draw_scene_profiled(self, scene, cam) -> None:
+        # Same result as draw_scene, with the fused matrix products split so each stage can be timed
+        profiler = self.profiler
+        with profiler.stage("culling"):
+            objects = scene.drawable_objects(cam, self.all_planes)
+
+        coords = []
+        for obj in objects:
+            with profiler.stage("model"):
+                vertices = obj.get_vertices()
+            with profiler.stage("view"):
+                eye = vertices @ cam.get_view_matrix().T
+            with profiler.stage("projection"):
+                clip = eye @ cam.get_projection_matrix().T
+            with profiler.stage("divide"):
+                ndc = cam.perspective_divide(clip)
+            with profiler.stage("viewport"):
+                pixels = cam.ndc_to_viewport(ndc)
+            with profiler.stage("clipping"):
+                keep = strip_keep_mask(cam, obj, self.cull_back_faces)
+                polylines = clip_strips(cam, clip, obj.get_edge_strips(), self.all_planes, keep, pixels)
+            with profiler.stage("coords"):
+                coords.extend(polyline.ravel().tolist() for polyline in polylines)
+            profiler.count(vertices=len(vertices), edges=len(obj.get_edges()))
+
+        with profiler.stage("canvas"):
+            self.draw_polylines(coords)
+        profiler.count(objects=len(objects), polylines=len(coords))
+
+    def draw_instances(self, instanced, cam) -> None:
+        """Draws every visible copy of an InstancedObject, projected in one batched pass."""
+        polylines = project_instance_strips(cam, instanced, self.all_planes)
+        self.draw_polylines([polyline.ravel().tolist() for polyline in polylines])
+
+    def clear(self) -> None:
+        """Deletes every item owned by the renderer and drops the cached pipelines."""
+        for item in self.items:
+            self.canvas.delete(item)
+        self.items = []
+        self._pipelines = {}
@@ -0,0 +1,70 @@
+import numpy as np
+from typing import Iterator, List, Optional, Sequence
+from object import Object3D
+from clipping import boxes_in_frustum
+
+
+class Scene:
+    """
+    Holds many Object3D instances. Each object keeps a world-space bounding box that follows its model
+    matrix (Object3D.get_bounds), so objects entirely outside the camera frustum are skipped
+    without touching their vertices. Objects are the roots of their hierarchies: iterating the scene
+    visits their children too (see Object3D.add_child).
+    """
+
+    def __init__(self, objects: Optional[Sequence[Object3D]] = None):
+        self.objects: List[Object3D] = list(objects) if objects is not None else []
+        # LOD chains, matched to their object by identity (chain.obj is obj): unlike id() keys, this survives
+        # pickling the scene into worker processes, and a recycled id never picks another object's chain
+        self.lods: List = []
+
+    def set_lod(self, obj: Object3D, chain) -> None:
+        """Draws obj through a level-of-detail chain built from it (see lod.LODChain); None removes it."""
+        if chain is not None and chain.obj is not obj:
+            raise ValueError("The LOD chain was built from another object")
+        self.lods = [lod for lod in self.lods if lod.obj is not obj]
+        if chain is not None:
+            self.lods.append(chain)
+
+    def get_lod(self, obj: Object3D):
+        """obj's LOD chain, or None."""
+        return next((chain for chain in self.lods if chain.obj is obj), None)
+
+    def add(self, obj: Object3D) -> Object3D:
+        self.objects.append(obj)
+        return obj
+
+    def remove(self, obj: Object3D) -> None:
+        self.objects.remove(obj)
+
+    def nodes(self) -> List[Object3D]:
+        """Every object of the scene, children included, depth first."""
+        return [node for obj in self.objects for node in obj.iter_subtree()]
+
+    def __iter__(self) -> Iterator[Object3D]:
+        return iter(self.nodes())
+
+    def __len__(self) -> int:
+        return len(self.nodes())
+
+    def get_bounds(self, nodes: Optional[Sequence[Object3D]] = None) -> np.ndarray:
+        """(K, 2, 3) stack of the objects' world-space boxes."""
+        nodes = self.nodes() if nodes is None else nodes
+        if not nodes:
+            return np.zeros((0, 2, 3))
+        return np.stack([obj.get_bounds() for obj in nodes])
+
+    def visible_objects(self, cam, all_planes: bool = True) -> List[Object3D]:
+        """Objects whose bounding box is not entirely outside the camera frustum (one batched test for all)."""
+        nodes = self.nodes()
+        if not nodes:
+            return []
+        visible = boxes_in_frustum(cam, self.get_bounds(nodes), all_planes)
+        return [obj for obj, keep in zip(nodes, visible.tolist()) if keep]
+
+    def drawable_objects(self, cam, all_planes: bool = True) -> List[Object3D]:
+        """The visible objects, each replaced by the level its LOD chain selects for this camera."""
+        # id() is only a lookup key for this call, while every chain's object is alive
+        chains = {id(chain.obj): chain for chain in self.lods}
+        return [chains[id(obj)].select(cam) if id(obj) in chains else obj
+                for obj in self.visible_objects(cam, all_planes)]
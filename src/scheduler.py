@@ -0,0 +1,54 @@
+import time
+from typing import Callable, Optional
+
+
+class FrameScheduler:
+    """
+    Coalesces redraw requests on a Tk root. request() only marks the view dirty; the render callback runs
+    later from the event loop (after_idle, or after() when the FPS cap says it is too soon), at most once
+    per frame no matter how many requests arrived in between. Requests made while rendering schedule one
+    more frame. fps=None removes the cap.
+    """
+
+    def __init__(self, root, render: Callable[[], None], fps: Optional[float] = 60.0):
+        self.root = root
+        self.render = render
+        self.fps = fps
+        self.dirty = False
+        self._pending = None       # Tk after id of the scheduled frame
+        self._last_frame = -float("inf")
+
+    @property
+    def interval(self) -> float:
+        """Minimum seconds between two frames."""
+        return 1.0 / self.fps if self.fps else 0.0
+
+    def request(self) -> None:
+        """Marks the view dirty and makes sure one frame is scheduled."""
+        self.dirty = True
+        if self._pending is not None:
+            return
+        wait = self.interval - (time.perf_counter() - self._last_frame)
+        if wait > 0:
+            self._pending = self.root.after(max(1, int(wait * 1000)), self._run)
+        else:
+            self._pending = self.root.after_idle(self._run)
+
+    def _run(self) -> None:
+        self._pending = None
+        if not self.dirty:
+            return
+        self.dirty = False
+        self._last_frame = time.perf_counter()
+        self.render()
+
+    def flush(self) -> None:
+        """Renders right away if a frame is pending (e.g. before taking a screenshot)."""
+        self.cancel()
+        self._run()
+
+    def cancel(self) -> None:
+        """Drops the scheduled frame, if any; the view stays dirty."""
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
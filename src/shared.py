@@ -0,0 +1,151 @@
+import numpy as np
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+# Object3D arrays placed in shared memory
+GEOMETRY_ARRAYS = ("vertices", "edges", "faces")
+
+
+class SharedArray(NamedTuple):
+    """Picklable description of one array stored in a named shared-memory segment."""
+    key: str
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+def _view(segment: shared_memory.SharedMemory, shape, dtype) -> np.ndarray:
+    """Read-only NumPy view of a segment's buffer; the segment must stay open while the view is in use."""
+    count = int(np.prod(shape))
+    array = np.frombuffer(segment.buf, dtype=dtype, count=count).reshape(shape)
+    array.flags.writeable = False
+    return array
+
+
+class SharedGeometryHandle:
+    """
+    What crosses process boundaries instead of the arrays: segment names, shapes and dtypes.
+    In each process it also holds the SharedMemory objects its views were made from, so they stay open as long
+    as the object that owns the handle (and the views) is alive.
+    """
+
+    def __init__(self, arrays: Tuple[SharedArray, ...]):
+        self.arrays = tuple(arrays)
+        self.segments: List[shared_memory.SharedMemory] = []
+
+    def __getstate__(self) -> dict:
+        return {"arrays": self.arrays}
+
+    def __setstate__(self, state: dict) -> None:
+        self.arrays = state["arrays"]
+        self.segments = []
+
+    def attach(self) -> Dict[str, np.ndarray]:
+        """Opens every segment in this process and returns zero-copy views keyed by attribute name."""
+        views = {}
+        for info in self.arrays:
+            segment = shared_memory.SharedMemory(name=info.name)
+            self.segments.append(segment)
+            views[info.key] = _view(segment, info.shape, info.dtype)
+        return views
+
+    def close(self) -> None:
+        """
+        Closes the segments whose views have all been released. A segment with a view still in use cannot be
+        closed yet; it stays open and referenced here.
+        """
+        still_open = []
+        for segment in self.segments:
+            try:
+                segment.close()
+            except BufferError:
+                still_open.append(segment)
+        self.segments = still_open
+
+
+class SharedGeometry:
+    """
+    Copies an Object3D's vertices, edges and faces into named shared-memory segments and points the object
+    at read-only views of them. While shared, pickling the object (e.g. to ProcessPoolExecutor workers) sends
+    only the segment names, and the receiving process maps the same memory instead of getting a copy.
+
+    The creating process owns the segments: unlink() (or leaving the `with` block) gives the object private
+    copies of its arrays, closes the segments and removes their names so no new process can attach.
+    Processes that already attached keep their mapping until their own handle is closed or collected.
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.handle = SharedGeometryHandle(())
+        infos, views = [], {}
+        try:
+            for key in GEOMETRY_ARRAYS:
+                array = np.ascontiguousarray(getattr(obj, key))
+                # Segments cannot be empty
+                segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self.handle.segments.append(segment)
+                view = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+                view[...] = array
+                view.flags.writeable = False
+                infos.append(SharedArray(key, segment.name, array.shape, array.dtype.str))
+                views[key] = view
+        except BaseException:
+            views.clear()
+            self.unlink()
+            raise
+        self.handle.arrays = tuple(infos)
+        for key, view in views.items():
+            setattr(obj, key, view)
+        obj._shared_geometry = self.handle
+
+    def __enter__(self) -> "SharedGeometry":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.unlink()
+
+    def unlink(self) -> None:
+        """Moves the object back to private arrays (it pickles normally again), then closes and unlinks the segments."""
+        if getattr(self.obj, "_shared_geometry", None) is self.handle:
+            for key in GEOMETRY_ARRAYS:
+                setattr(self.obj, key, np.array(getattr(self.obj, key)))
+            self.obj._shared_geometry = None
+        segments = list(self.handle.segments)
+        # The views are released now; one still held elsewhere keeps its segment open (see SharedGeometryHandle.close)
+        self.handle.close()
+        for segment in segments:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self.obj, key).nbytes for key in GEOMETRY_ARRAYS)
+
+
+def scene_meshes(target) -> List:
+    """Every Object3D reachable from an Object3D or a Scene: hierarchy nodes and their LOD levels."""
+    nodes = target.nodes() if hasattr(target, "nodes") else list(target.iter_subtree())
+    meshes, seen = [], set()
+    for node in nodes:
+        chain = target.get_lod(node) if hasattr(target, "get_lod") else None
+        for mesh in [node] + (chain.levels if chain is not None else []):
+            if id(mesh) not in seen:
+                seen.add(id(mesh))
+                meshes.append(mesh)
+    return meshes
+
+
+@contextmanager
+def shared_geometry(target) -> Iterator[List[SharedGeometry]]:
+    """Shares the geometry of every mesh of an Object3D or Scene for the duration of the block."""
+    shared: List[SharedGeometry] = []
+    try:
+        for mesh in scene_meshes(target):
+            shared.append(SharedGeometry(mesh))
+        yield shared
+    finally:
+        for geometry in shared:
+            geometry.unlink()
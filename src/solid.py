@@ -0,0 +1,234 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Sequence, Tuple
+from camera import ProjectionType
+from clipping import NEAR_PLANE, frustum_planes
+from raster import save_image
+
+# Upper bound on candidate fragments generated at once per tile
+MAX_FRAGMENTS = 1 << 20
+
+
+def triangulate(faces: np.ndarray) -> np.ndarray:
+    """Splits (F, k) polygons into (F * (k - 2), 3) fan triangles."""
+    faces = np.asarray(faces).reshape(len(faces), -1)
+    if faces.shape[1] == 3:
+        return faces
+    return np.concatenate([faces[:, [0, j, j + 1]] for j in range(1, faces.shape[1] - 1)])
+
+
+def bin_triangles(bbox: np.ndarray, tile_size: int, tiles_x: int, tiles_y: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assigns triangles to every tile their (T, 4) [xmin, ymin, xmax, ymax] pixel box overlaps.
+    Returns aligned (tile index, triangle index) arrays sorted by tile.
+    """
+    tx0 = np.clip(bbox[:, 0] // tile_size, 0, tiles_x - 1).astype(np.int64)
+    ty0 = np.clip(bbox[:, 1] // tile_size, 0, tiles_y - 1).astype(np.int64)
+    tx1 = np.clip(bbox[:, 2] // tile_size, 0, tiles_x - 1).astype(np.int64)
+    ty1 = np.clip(bbox[:, 3] // tile_size, 0, tiles_y - 1).astype(np.int64)
+    nx = tx1 - tx0 + 1
+    counts = nx * (ty1 - ty0 + 1)
+
+    triangle = np.repeat(np.arange(len(bbox)), counts)
+    first = np.cumsum(counts) - counts
+    local = np.arange(len(triangle)) - np.repeat(first, counts)
+    tx = tx0[triangle] + local % nx[triangle]
+    ty = ty0[triangle] + local // nx[triangle]
+    tile = ty * tiles_x + tx
+
+    order = np.argsort(tile, kind="stable")
+    return tile[order], triangle[order]
+
+
+def rasterize_tile(x0: int, y0: int, width: int, height: int,
+                   screen: np.ndarray, depth: np.ndarray, colors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Z-buffered rasterization of (T, 3, 2) screen triangles into one tile whose top-left pixel is (x0, y0).
+    Every pixel of each triangle's box (clipped to the tile) becomes a candidate fragment, all tested at once;
+    depth is NDC z (smaller is closer), interpolated linearly in screen space. Returns the tile's
+    (height, width, 3) float colors and (height, width) depth, +inf where nothing was drawn.
+    """
+    color_buffer = np.zeros((height * width, 3), dtype=np.float32)
+    depth_buffer = np.full(height * width, np.inf)
+
+    # Pixel centers sit on integer coordinates, as in the line rasterizer
+    xmin = np.maximum(np.ceil(screen[:, :, 0].min(axis=1)), x0).astype(np.int64)
+    xmax = np.minimum(np.floor(screen[:, :, 0].max(axis=1)), x0 + width - 1).astype(np.int64)
+    ymin = np.maximum(np.ceil(screen[:, :, 1].min(axis=1)), y0).astype(np.int64)
+    ymax = np.minimum(np.floor(screen[:, :, 1].max(axis=1)), y0 + height - 1).astype(np.int64)
+    box_width = np.maximum(xmax - xmin + 1, 0)
+    counts = box_width * np.maximum(ymax - ymin + 1, 0)
+    ends = np.cumsum(counts)
+
+    start = 0
+    while start < len(screen):
+        limit = (ends[start - 1] if start else 0) + MAX_FRAGMENTS
+        stop = max(start + 1, int(np.searchsorted(ends, limit, side="right")))
+        chunk = slice(start, stop)
+        start = stop
+
+        triangle = np.repeat(np.arange(chunk.start, chunk.stop), counts[chunk])
+        if len(triangle) == 0:
+            continue
+        first = np.repeat(np.concatenate(([0], np.cumsum(counts[chunk])[:-1])), counts[chunk])
+        local = np.arange(len(triangle)) - first
+        fx = xmin[triangle] + local % box_width[triangle]
+        fy = ymin[triangle] + local // box_width[triangle]
+
+        a, b, c = screen[triangle, 0], screen[triangle, 1], screen[triangle, 2]
+        area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            w0 = ((b[:, 0] - fx) * (c[:, 1] - fy) - (b[:, 1] - fy) * (c[:, 0] - fx)) / area
+            w1 = ((c[:, 0] - fx) * (a[:, 1] - fy) - (c[:, 1] - fy) * (a[:, 0] - fx)) / area
+        w2 = 1.0 - w0 - w1
+        inside = (w0 >= 0) & (w1 >= 0) & (w2 >= 0) & (np.abs(area) > 1e-12)
+
+        if not inside.any():
+            continue
+        triangle, w0, w1, w2 = triangle[inside], w0[inside], w1[inside], w2[inside]
+        pixel = (fy[inside] - y0) * width + (fx[inside] - x0)
+        z = w0 * depth[triangle, 0] + w1 * depth[triangle, 1] + w2 * depth[triangle, 2]
+
+        # Nearest fragment per pixel: sort by (pixel, z) and keep the first of each pixel
+        order = np.lexsort((z, pixel))
+        pixel, z, triangle = pixel[order], z[order], triangle[order]
+        nearest = np.concatenate(([True], pixel[1:] != pixel[:-1]))
+        pixel, z, triangle = pixel[nearest], z[nearest], triangle[nearest]
+
+        closer = z < depth_buffer[pixel]
+        depth_buffer[pixel[closer]] = z[closer]
+        color_buffer[pixel[closer]] = colors[triangle[closer]]
+
+    return color_buffer.reshape(height, width, 3), depth_buffer.reshape(height, width)
+
+
+def _rasterize_tile_job(job):
+    return job[0], job[1], rasterize_tile(*job)
+
+
+class SolidRenderer:
+    """
+    Flat-shaded, z-buffered triangle renderer fed by the Camera pipeline. The screen is split into tiles,
+    triangles are binned per tile, and tiles are rasterized in parallel on a process pool
+    (workers <= 1 rasterizes in this process). Use as a context manager, or call close(), to stop the pool.
+    The pool is not pickled: a copy sent to another process starts its own lazily, unless its workers setting
+    says otherwise (batch.render_sequence sets it to 1 in its worker processes).
+    """
+
+    def __init__(self, width: int = 800, height: int = 600,
+                 background: Sequence[int] = (0, 0, 0), color: Sequence[int] = (200, 200, 200),
+                 tile_size: int = 64, workers: Optional[int] = None, ambient: float = 0.2):
+        self.width = width
+        self.height = height
+        self.background = background
+        self.color = color
+        self.tile_size = tile_size
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.ambient = ambient
+        self._pool = None
+
+    def __enter__(self) -> "SolidRenderer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._pool = None
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _triangles(self, obj, cam) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Screen-space triangles, their NDC depths and flat-shaded colors, with near/frustum rejection."""
+        faces = obj.get_faces()
+        if len(faces) == 0:
+            return np.zeros((0, 3, 2)), np.zeros((0, 3)), np.zeros((0, 3))
+        triangles = triangulate(faces)
+
+        vertices = obj.get_vertices()
+        clip = cam.project_to_clip(vertices)[triangles]  # (T, 3, 4)
+
+        # Triangles crossing the near plane are dropped rather than clipped; so are those fully outside one plane
+        distances = clip @ frustum_planes(cam, all_planes=True).T
+        keep = np.all(clip @ np.array(NEAR_PLANE) >= 0, axis=1) & ~np.any(np.all(distances < 0, axis=1), axis=1)
+        triangles, clip = triangles[keep], clip[keep]
+
+        screen = cam.clip_to_viewport(clip.reshape(-1, 4)).reshape(-1, 3, 2)
+        depth = clip[..., 2] / clip[..., 3]
+
+        # Two-sided headlight shading in camera space
+        eye = (vertices @ cam.get_view_matrix().T)[triangles][..., :3]
+        normal = np.cross(eye[:, 1] - eye[:, 0], eye[:, 2] - eye[:, 0])
+        normal /= np.maximum(np.linalg.norm(normal, axis=1, keepdims=True), 1e-12)
+        if cam.projection == ProjectionType.PERSPECTIVE:
+            view = -eye.mean(axis=1)
+            view /= np.maximum(np.linalg.norm(view, axis=1, keepdims=True), 1e-12)
+        else:
+            view = np.array([0.0, 0.0, 1.0])
+        intensity = self.ambient + (1 - self.ambient) * np.abs(np.sum(normal * view, axis=-1))
+        colors = intensity[:, None] * np.asarray(self.color, dtype=float)
+        return screen, depth, colors
+
+    def render_triangles(self, screen: np.ndarray, depth: np.ndarray, colors: np.ndarray) -> np.ndarray:
+        """Bins and rasterizes (T, 3, 2) screen triangles into an (H, W, 3) uint8 image."""
+        size = self.tile_size
+        tiles_x = -(-self.width // size)
+        tiles_y = -(-self.height // size)
+        image = np.empty((self.height, self.width, 3), dtype=np.float32)
+        image[:] = np.asarray(self.background, dtype=np.float32)
+
+        if len(screen):
+            bbox = np.concatenate((screen.min(axis=1), screen.max(axis=1)), axis=1)
+            onscreen = (bbox[:, 2] >= 0) & (bbox[:, 0] <= self.width - 1) & (bbox[:, 3] >= 0) & (bbox[:, 1] <= self.height - 1)
+            screen, depth, colors, bbox = screen[onscreen], depth[onscreen], colors[onscreen], bbox[onscreen]
+
+            tiles, triangles = bin_triangles(bbox, size, tiles_x, tiles_y)
+            bounds = np.flatnonzero(np.diff(tiles)) + 1
+            jobs = []
+            starts = np.concatenate(([0], bounds)).tolist() if len(tiles) else []
+            for start, stop in zip(starts, starts[1:] + [len(tiles)]):
+                tile = int(tiles[start])
+                x0, y0 = (tile % tiles_x) * size, (tile // tiles_x) * size
+                group = triangles[start:stop]
+                jobs.append((x0, y0, min(size, self.width - x0), min(size, self.height - y0),
+                             screen[group], depth[group], colors[group]))
+
+            if self.workers > 1 and len(jobs) > 1:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                results = self._pool.map(_rasterize_tile_job, jobs, chunksize=max(1, len(jobs) // (4 * self.workers)))
+            else:
+                results = map(_rasterize_tile_job, jobs)
+
+            for x0, y0, (color_tile, depth_tile) in results:
+                h, w = depth_tile.shape
+                drawn = np.isfinite(depth_tile)
+                image[y0:y0 + h, x0:x0 + w][drawn] = color_tile[drawn]
+
+        return np.rint(np.clip(image, 0, 255)).astype(np.uint8)
+
+    def render(self, obj, cam) -> np.ndarray:
+        """Runs the model -> view -> projection -> window/viewport pipeline and returns the shaded image."""
+        return self.render_triangles(*self._triangles(obj, cam))
+
+    def render_scene(self, scene, cam) -> np.ndarray:
+        """Renders every visible object of the scene into one depth-tested image."""
+        parts = [self._triangles(obj, cam) for obj in scene.drawable_objects(cam)]
+        if not parts:
+            return self.render_triangles(np.zeros((0, 3, 2)), np.zeros((0, 3)), np.zeros((0, 3)))
+        return self.render_triangles(*(np.concatenate(arrays) for arrays in zip(*parts)))
+
+    def render_to_file(self, obj, cam, path: str) -> np.ndarray:
+        image = self.render(obj, cam)
+        save_image(path, image)
+        return image
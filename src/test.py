@@ -2,6 +2,7 @@ import numpy as np
 import tkinter as tk
 from object import Object3D
 from camera import Camera
+from renderer import CanvasRenderer
 import math
 
 if __name__ == "__main__":
@@ -15,14 +16,10 @@ if __name__ == "__main__":
     obj = Object3D()
     cam = Camera(width=WIDTH, height=HEIGHT, target=obj.get_position())
 
+    renderer = CanvasRenderer(canvas, fill="red")
+
     def draw():
-        canvas.delete("all")
-        verts = obj.get_vertices()
-        projected = [cam.project_vertex(v) for v in verts]
-        for edge in obj.get_edges():
-            p1 = projected[edge[0]]
-            p2 = projected[edge[1]]
-            canvas.create_line(p1[0], p1[1], p2[0], p2[1], fill="red")
+        renderer.draw(obj, cam)
 
     # Botões
     btns = tk.Frame(root)
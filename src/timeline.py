@@ -0,0 +1,175 @@
+import numpy as np
+from typing import List, NamedTuple, Optional, Sequence
+
+
+class Keyframe(NamedTuple):
+    """
+    Camera state at a given time: position, look-at target and roll (radians). Keys made with orbit()
+    also carry the orbit parameters, which the timeline then interpolates instead of the position.
+    """
+    time: float
+    position: np.ndarray
+    target: np.ndarray
+    roll: float = 0.0
+    radius: Optional[float] = None
+    theta: Optional[float] = None
+    phi: Optional[float] = None
+
+    @classmethod
+    def orbit(cls, time: float, radius: float, theta: float, phi: float,
+              target: Sequence[float] = (0.0, 0.0, 0.0), roll: float = 0.0) -> "Keyframe":
+        """Key placed on the orbit around target, with the same spherical convention as Camera.update."""
+        target = np.array(target, dtype=float)
+        return cls(time, target + orbit_offsets(radius, theta, phi), target, roll, radius, theta, phi)
+
+    @classmethod
+    def from_camera(cls, time: float, cam) -> "Keyframe":
+        """
+        Snapshot of a Camera's current position, target and roll. A camera aimed by its pitch/yaw (no target)
+        gets a target one unit along its forward axis.
+        """
+        position = np.array(cam.position, dtype=float)
+        if cam.target is not None:
+            target = np.array(cam.target, dtype=float)
+        else:
+            target = position - np.asarray(cam.get_view_matrix(), dtype=float)[2, :3]
+        return cls(time, position, target, float(cam.rotation[2]))
+
+
+def orbit_offsets(radius, theta, phi) -> np.ndarray:
+    """Offsets from the target of orbit positions, (..., 3) for array arguments."""
+    radius, theta, phi = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (radius, theta, phi)))
+    return np.stack((radius * np.cos(phi) * np.sin(theta),
+                     radius * np.sin(phi),
+                     radius * np.cos(phi) * np.cos(theta)), axis=-1)
+
+
+# ------------------------------- #
+
+# Vectorized camera bases
+
+def _normalize(v: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(v, axis=-1, keepdims=True)
+    return v / np.where(norm == 0, 1, norm)
+
+
+def look_at_rotations(positions: np.ndarray, targets: np.ndarray, rolls: np.ndarray) -> np.ndarray:
+    """(F, 3, 3) rotation part of the view matrices, rows (right, up, -forward), as in Camera.get_view_matrix."""
+    forward = _normalize(np.asarray(targets, dtype=float) - np.asarray(positions, dtype=float))
+    right = _normalize(np.cross(forward, np.array([0.0, 1.0, 0.0])))
+    up = np.cross(right, forward)
+
+    rolls = np.asarray(rolls, dtype=float)[:, None]
+    rolled = rolls[:, 0] != 0
+    up = np.where(rolled[:, None], np.cos(rolls) * up + np.sin(rolls) * right, up)
+    right = np.where(rolled[:, None], np.cross(forward, up), right)
+    return np.stack((right, up, -forward), axis=1)
+
+
+def view_matrices(rotations: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """(F, 4, 4) view matrices from (F, 3, 3) rotations and (F, 3) camera positions."""
+    matrices = np.zeros((len(rotations), 4, 4))
+    matrices[:, :3, :3] = rotations
+    matrices[:, :3, 3] = -np.einsum("fij,fj->fi", rotations, positions)
+    matrices[:, 3, 3] = 1
+    return matrices
+
+
+def look_at_matrices(positions: np.ndarray, targets: np.ndarray, rolls: np.ndarray) -> np.ndarray:
+    """(F, 4, 4) view matrices for many cameras at once, identical to Camera.get_view_matrix for each."""
+    positions = np.asarray(positions, dtype=float)
+    return view_matrices(look_at_rotations(positions, targets, rolls), positions)
+
+
+# ------------------------------- #
+
+# Splines
+
+def catmull_rom(points: np.ndarray, segment: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """
+    Evaluates the Catmull-Rom spline through (K, D) points on segment[i] (between points i and i + 1)
+    at local parameters u in [0, 1]; end points are repeated for the outer tangents.
+    """
+    last = len(points) - 1
+    p0 = points[np.clip(segment - 1, 0, last)]
+    p1 = points[np.clip(segment, 0, last)]
+    p2 = points[np.clip(segment + 1, 0, last)]
+    p3 = points[np.clip(segment + 2, 0, last)]
+    u = u[:, None]
+    return 0.5 * (2 * p1 + (p2 - p0) * u + (2 * p0 - 5 * p1 + 4 * p2 - p3) * u ** 2
+                  + (3 * p1 - p0 - 3 * p2 + p3) * u ** 3)
+
+
+# ------------------------------- #
+
+class CameraTimeline:
+    """
+    Keyframed camera path. Positions and targets follow Catmull-Rom splines through the keys (orbit parameters
+    are splined instead when every key has them, so the camera moves on arcs) and the roll is interpolated
+    linearly; every frame looks at its interpolated target, between keys too.
+    evaluate() returns the view matrices of any number of frames in one vectorized call.
+    """
+
+    def __init__(self, keyframes: Optional[Sequence[Keyframe]] = None):
+        self.keyframes: List[Keyframe] = []
+        for key in keyframes or []:
+            self.add(key)
+
+    def add(self, key: Keyframe) -> Keyframe:
+        self.keyframes.append(key)
+        self.keyframes.sort(key=lambda k: k.time)
+        return key
+
+    def __len__(self) -> int:
+        return len(self.keyframes)
+
+    @property
+    def duration(self) -> float:
+        return self.keyframes[-1].time - self.keyframes[0].time if self.keyframes else 0.0
+
+    def frame_times(self, frames: int) -> np.ndarray:
+        """Evenly spaced times from the first key to the last, both included."""
+        return np.linspace(self.keyframes[0].time, self.keyframes[-1].time, frames)
+
+    def _segments(self, times: np.ndarray):
+        key_times = np.array([k.time for k in self.keyframes], dtype=float)
+        times = np.clip(np.asarray(times, dtype=float).ravel(), key_times[0], key_times[-1])
+        segment = np.clip(np.searchsorted(key_times, times, side="right") - 1, 0, max(len(key_times) - 2, 0))
+        if len(key_times) == 1:
+            return segment, np.zeros(len(times))
+        span = key_times[segment + 1] - key_times[segment]
+        u = np.where(span > 0, (times - key_times[segment]) / np.where(span > 0, span, 1), 0.0)
+        return segment, u
+
+    def evaluate_targets(self, times) -> np.ndarray:
+        """(F, 3) look-at targets at the given times."""
+        segment, u = self._segments(times)
+        return catmull_rom(np.array([k.target for k in self.keyframes], dtype=float), segment, u)
+
+    def evaluate_rolls(self, times) -> np.ndarray:
+        """(F,) rolls at the given times."""
+        segment, u = self._segments(times)
+        rolls = np.array([k.roll for k in self.keyframes], dtype=float)
+        following = rolls[np.minimum(segment + 1, len(rolls) - 1)]
+        return rolls[segment] + (following - rolls[segment]) * u
+
+    def evaluate_positions(self, times) -> np.ndarray:
+        """(F, 3) camera positions at the given times."""
+        segment, u = self._segments(times)
+        keys = self.keyframes
+        if all(k.radius is not None for k in keys):
+            orbit = catmull_rom(np.array([(k.radius, k.theta, k.phi) for k in keys]), segment, u)
+            return self.evaluate_targets(times) + orbit_offsets(orbit[:, 0], orbit[:, 1], orbit[:, 2])
+        return catmull_rom(np.array([k.position for k in keys], dtype=float), segment, u)
+
+    def evaluate(self, times) -> np.ndarray:
+        """(F, 4, 4) view matrices at the given times (clamped to the keyed range)."""
+        if not self.keyframes:
+            raise ValueError("CameraTimeline has no keyframes")
+        # Slerping the keys' orientations would aim frames between keys off the target
+        return look_at_matrices(self.evaluate_positions(times), self.evaluate_targets(times),
+                                self.evaluate_rolls(times))
+
+    def evaluate_frames(self, frames: int) -> np.ndarray:
+        """(frames, 4, 4) view matrices spread evenly over the timeline."""
+        return self.evaluate(self.frame_times(frames))
@@ -0,0 +1,124 @@
+import copy
+import threading
+import traceback
+from typing import List, Optional, Tuple
+from pipeline import Pipeline
+
+
+class ProjectionWorker:
+    """
+    Projects and clips a Scene on a background thread, so the Tk thread only pushes coordinates to the canvas.
+
+    submit(scene, cam) runs on the Tk thread: it picks the drawable objects (culling, LOD) and snapshots the
+    camera and each object's world matrix, so the worker never reads state the UI may be changing. Only the
+    newest job is kept; a job superseded by a newer submit() is cancelled between objects and between the
+    pipeline stages of each object, and its result dropped. Finished frames land in a back buffer and swap() hands them to the Tk thread.
+    """
+
+    def __init__(self, all_planes: bool = True, cull_back_faces: bool = False):
+        self.all_planes = all_planes
+        self.cull_back_faces = cull_back_faces
+        self._condition = threading.Condition()
+        self._generation = 0                   # id of the newest submitted job
+        self._job = None                       # (generation, camera, [(obj, version, world matrix)])
+        self._front: Optional[List[List[float]]] = None
+        self._back: Optional[List[List[float]]] = None
+        self._ready = False                    # back buffer holds a frame the Tk thread has not taken yet
+        self._busy = False
+        self._closed = False
+        self._pipelines = {}                   # id(obj) -> Pipeline, worker thread only
+        self._thread = threading.Thread(target=self._run, name="projection-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, scene, cam) -> int:
+        """Queues a projection of the scene for the camera's current state, replacing any queued one."""
+        objects = scene.drawable_objects(cam, self.all_planes)
+        items = [(obj, obj.version, obj.get_world_matrix().astype(obj.dtype)) for obj in objects]
+        snapshot = copy.deepcopy(cam)
+        with self._condition:
+            self._generation += 1
+            self._job = (self._generation, snapshot, items)
+            self._condition.notify()
+            return self._generation
+
+    def pending(self) -> bool:
+        """True while a job is queued or running, or a finished frame waits for swap()."""
+        with self._condition:
+            return self._job is not None or self._busy or self._ready
+
+    def swap(self) -> Optional[List[List[float]]]:
+        """Takes the newest finished frame (flat coordinate lists), or None when nothing new is ready."""
+        with self._condition:
+            if not self._ready:
+                return None
+            self._front, self._back = self._back, self._front
+            self._ready = False
+            return self._front
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._generation += 1
+            self._condition.notify()
+        self._thread.join()
+
+    # ------------------------------- #
+
+    # Worker thread
+
+    def _cancelled(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._job is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                generation, cam, items = self._job
+                self._job = None
+                self._busy = True
+            coords = None
+            try:
+                coords = self._project(generation, cam, items)
+            except Exception:
+                # Keep the thread alive; the next submit() gets a fresh try
+                traceback.print_exc()
+            finally:
+                with self._condition:
+                    self._busy = False
+                    if coords is not None and not self._cancelled(generation):
+                        self._back = coords
+                        self._ready = True
+
+    def _pipeline(self, obj) -> Pipeline:
+        pipeline = self._pipelines.get(id(obj))
+        if pipeline is None or pipeline.obj is not obj:
+            pipeline = self._pipelines[id(obj)] = Pipeline(obj)
+        return pipeline
+
+    def _project(self, generation: int, cam, items: List[Tuple]) -> Optional[List[List[float]]]:
+        coords = []
+        for obj, version, matrix in items:
+            # The camera snapshot keeps the live camera's versions, so unchanged stages are reused across jobs
+            pipeline = self._pipeline(obj)
+            world = (version, matrix)
+            # Each stage is cached, so running them one at a time lets a large mesh be abandoned between
+            # them without any extra work; coords() then only reads the cache and maps the polylines
+            stages = (lambda: pipeline.world(world),
+                      lambda: pipeline.clip(cam, world),
+                      lambda: pipeline.ndc(cam, world),
+                      lambda: pipeline.keep(cam, self.cull_back_faces, world),
+                      lambda: pipeline.ndc_polylines(cam, self.all_planes, self.cull_back_faces, world))
+            for stage in stages:
+                if self._cancelled(generation):
+                    return None
+                stage()
+            if self._cancelled(generation):
+                return None
+            coords.extend(pipeline.coords(cam, self.all_planes, self.cull_back_faces, world))
+        if len(self._pipelines) > 4 * max(len(items), 1):
+            live = {id(obj) for obj, _, _ in items}
+            self._pipelines = {key: value for key, value in self._pipelines.items() if key in live}
+        return coords
@@ -0,0 +1,73 @@
+import subprocess
+import sys
+import textwrap
+from conftest import SRC
+
+# A nested tile pool used to hang render_sequence; run it in a child process so a hang fails instead of blocking
+TIMEOUT = 120
+
+SCRIPT = textwrap.dedent("""
+    import sys
+    import numpy as np
+    from batch import render_sequence, turntable_poses
+    from benchmark import make_sphere
+    from camera import Camera
+    from solid import SolidRenderer
+
+    if __name__ == "__main__":
+        out = sys.argv[1]
+        obj = make_sphere(2000)
+        cam = Camera(width=160, height=120)
+        poses = turntable_poses(4, radius=4.0)
+        with SolidRenderer(160, 120, tile_size=32, workers=2) as renderer:
+            parallel = render_sequence(obj, cam, poses, out + "/par_{:02d}.ppm", renderer=renderer, workers=2)
+            serial = render_sequence(obj, cam, poses, out + "/ser_{:02d}.ppm", renderer=renderer, workers=1)
+        for a, b in zip(parallel, serial):
+            with open(a, "rb") as fa, open(b, "rb") as fb:
+                assert fa.read() == fb.read(), (a, b)
+        print(len(parallel))
+""")
+
+
+def test_solid_renderer_with_batch_workers(tmp_path):
+    result = subprocess.run([sys.executable, "-c", SCRIPT, str(tmp_path)], cwd=SRC, capture_output=True,
+                            text=True, timeout=TIMEOUT)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split()[-1] == "4"
+
+
+LOD_SCRIPT = textwrap.dedent("""
+    import sys
+    import multiprocessing
+    from batch import render_sequence, turntable_poses
+    from benchmark import make_sphere
+    from camera import Camera
+    from lod import LODChain
+    from scene import Scene
+
+    if __name__ == "__main__":
+        # spawn pickles the scene into the workers, like the default start method on Windows and macOS
+        multiprocessing.set_start_method("spawn")
+        out = sys.argv[1]
+        sphere = make_sphere(20000)
+        scene = Scene([sphere])
+        scene.set_lod(sphere, LODChain(sphere))
+        cam = Camera(width=160, height=120)
+        poses = turntable_poses(4, radius=10.0)
+        parallel = render_sequence(scene, cam, poses, out + "/par_{:02d}.ppm", workers=2)
+        serial = render_sequence(scene, cam, poses, out + "/ser_{:02d}.ppm", workers=1)
+        full = render_sequence(Scene([sphere]), cam, poses, out + "/full_{:02d}.ppm", workers=1)
+        for a, b, c in zip(parallel, serial, full):
+            with open(a, "rb") as fa, open(b, "rb") as fb, open(c, "rb") as fc:
+                parallel_image, serial_image = fa.read(), fb.read()
+                assert parallel_image == serial_image, (a, b)
+                assert serial_image != fc.read(), "the LOD chain did not pick a coarser level"
+        print(len(parallel))
+""")
+
+
+def test_scene_lod_survives_spawn_workers(tmp_path):
+    result = subprocess.run([sys.executable, "-c", LOD_SCRIPT, str(tmp_path)], cwd=SRC, capture_output=True,
+                            text=True, timeout=TIMEOUT)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split()[-1] == "4"
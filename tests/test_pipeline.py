@@ -0,0 +1,65 @@
+import pytest
+from benchmark import make_sphere
+from camera import Camera, ProjectionType
+from clipping import project_object_strips
+from pipeline import Pipeline
+
+ORBIT_STAGES = ["clip", "ndc", "ndc_polylines", "coords"]
+
+
+def warm_pipeline(projection: ProjectionType = ProjectionType.PERSPECTIVE, cull_back_faces: bool = False):
+    """A sphere, a camera and a Pipeline whose stages are all cached."""
+    obj = make_sphere(2000)
+    cam = Camera(z=4.0, projection=projection)
+    pipeline = Pipeline(obj)
+    pipeline.coords(cam, True, cull_back_faces)
+    return obj, cam, pipeline
+
+
+def test_unchanged_inputs_recompute_nothing():
+    obj, cam, pipeline = warm_pipeline()
+    pipeline.coords(cam, True)
+    assert pipeline.recomputed == []
+
+
+def test_set_viewport_only_remaps():
+    obj, cam, pipeline = warm_pipeline()
+    cam.set_viewport(10, 400, 20, 300)
+    pipeline.coords(cam, True)
+    assert pipeline.recomputed == ["coords"]
+
+
+def test_set_window_perspective_reclips():
+    obj, cam, pipeline = warm_pipeline()
+    cam.set_window(-0.5, 0.5, -0.5, 0.5)
+    pipeline.coords(cam, True)
+    assert pipeline.recomputed == ["ndc_polylines", "coords"]
+
+
+def test_set_window_orthographic_reprojects():
+    # The orthographic projection is built from the window
+    obj, cam, pipeline = warm_pipeline(ProjectionType.ORTHOGRAPHIC)
+    cam.set_window(-0.5, 0.5, -0.5, 0.5)
+    pipeline.coords(cam, True)
+    assert pipeline.recomputed == ORBIT_STAGES
+
+
+@pytest.mark.parametrize("cull_back_faces", [False, True])
+def test_orbit_recomputes_from_clip(cull_back_faces):
+    obj, cam, pipeline = warm_pipeline(cull_back_faces=cull_back_faces)
+    cam.orbit(0.3, 0.1)
+    pipeline.coords(cam, True, cull_back_faces)
+    expected = ORBIT_STAGES[:2] + ["keep"] + ORBIT_STAGES[2:] if cull_back_faces else ORBIT_STAGES
+    assert pipeline.recomputed == expected
+
+
+def test_object_transform_recomputes_everything():
+    obj, cam, pipeline = warm_pipeline()
+    obj.translate([0.2, 0.0, 0.0])
+    coords = pipeline.coords(cam, True)
+    assert pipeline.recomputed[0] == "world"
+    assert pipeline.recomputed[1:] == ORBIT_STAGES
+    expected = [polyline.ravel().tolist() for polyline in project_object_strips(cam, obj, True)]
+    assert len(coords) == len(expected)
+    for polyline, reference in zip(coords, expected):
+        assert polyline == pytest.approx(reference)
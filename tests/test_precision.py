@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from benchmark import make_sphere
+from camera import Camera
+from clipping import clip_strips, project_object_edges
+from object import Object3D
+from pipeline import Pipeline
+
+# float32 may differ from float64 by this much, in viewport pixels
+MAX_PIXEL_ERROR = 1e-2
+# Clipped endpoints divide two nearly equal plane distances (t = d0 / (d0 - d1)), which loses a few more bits
+MAX_CLIPPED_ERROR = 5e-2
+
+
+def make_pair(orthographic: bool):
+    """The same sphere and camera in float64 and float32."""
+    pairs = []
+    for dtype in (np.float64, np.float32):
+        obj = make_sphere(20_000)
+        obj = Object3D(obj.vertices, obj.get_edges(), faces=obj.get_faces(), dtype=dtype)
+        obj.translate([0.3, -0.2, 0.1])
+        obj.yaw(0.4)
+        cam = Camera(z=3.0, dtype=dtype)
+        cam.orbit(0.5, 0.3)
+        if orthographic:
+            cam.set_orthographic_params(-1.5, 1.5, -1.2, 1.2)
+        pairs.append((obj, cam))
+    return pairs
+
+
+@pytest.mark.parametrize("orthographic", [False, True])
+def test_projected_vertices_match(orthographic):
+    (obj64, cam64), (obj32, cam32) = make_pair(orthographic)
+    pixels64 = cam64.project_vertices(obj64.get_vertices())
+    pixels32 = cam32.project_vertices(obj32.get_vertices())
+    assert pixels32.dtype == np.float32
+    assert np.abs(pixels32 - pixels64).max() < MAX_PIXEL_ERROR
+
+
+@pytest.mark.parametrize("orthographic", [False, True])
+def test_clipped_segments_match(orthographic):
+    (obj64, cam64), (obj32, cam32) = make_pair(orthographic)
+    # Zoomed in, so plenty of edges cross the frustum and get clipped
+    for cam in (cam64, cam32):
+        cam.set_window(-0.4, 0.4, -0.3, 0.3)
+    p0_64, p1_64 = project_object_edges(cam64, obj64, all_planes=True)
+    p0_32, p1_32 = project_object_edges(cam32, obj32, all_planes=True)
+    assert p0_32.dtype == np.float32
+    assert len(p0_32) == len(p0_64)
+    assert np.abs(p0_32 - p0_64).max() < MAX_CLIPPED_ERROR
+    assert np.abs(p1_32 - p1_64).max() < MAX_CLIPPED_ERROR
+
+
+def test_dtype_holds_through_the_pipeline():
+    (obj64, cam64), (obj32, cam32) = make_pair(False)
+    clip = cam32.project_to_clip(obj32.get_vertices())
+    assert clip.dtype == np.float32
+
+    polylines = clip_strips(cam32, clip, obj32.get_edge_strips(), all_planes=True)
+    assert polylines and all(polyline.dtype == np.float32 for polyline in polylines)
+    ndc = clip_strips(cam32, clip, obj32.get_edge_strips(), all_planes=True, ndc=True)
+    assert all(polyline.dtype == np.float32 for polyline in ndc)
+
+    pipeline32, pipeline64 = Pipeline(obj32), Pipeline(obj64)
+    lines32 = pipeline32.polylines(cam32, all_planes=True)
+    lines64 = pipeline64.polylines(cam64, all_planes=True)
+    assert pipeline32.world()[1].dtype == np.float32
+    assert pipeline32.clip(cam32)[1].dtype == np.float32
+    assert all(line.dtype == np.float32 for line in lines32)
+    assert len(lines32) == len(lines64)
+    assert max(np.abs(a - b).max() for a, b in zip(lines32, lines64)) < MAX_CLIPPED_ERROR
@@ -0,0 +1,19 @@
+import tracemalloc
+import numpy as np
+from profiler import PipelineProfiler
+
+
+def test_memory_tracking_toggle():
+    profiler = PipelineProfiler()
+    profiler.set_track_memory(True)
+    try:
+        with profiler.frame():
+            with profiler.stage("clip"):
+                data = np.ones(2 ** 20)
+        assert profiler.stage_allocations()["clip"] >= data.nbytes
+        assert "MB" in profiler.hud_text()
+        assert profiler.chrome_trace()["traceEvents"][1]["args"]["allocated_bytes"] >= data.nbytes
+    finally:
+        profiler.set_track_memory(False)
+    assert not tracemalloc.is_tracing()
+    assert "MB" not in profiler.hud_text()
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import numpy as np
+import pytest
+from conftest import SRC
+from benchmark import make_sphere, write_obj
+from render_cli import main
+
+
+@pytest.fixture
+def mesh(tmp_path):
+    path = str(tmp_path / "sphere.obj")
+    write_obj(path, make_sphere(500))
+    return path
+
+
+def test_unknown_output_extension_is_an_error(mesh, tmp_path):
+    output = tmp_path / "frame.jpg"
+    with pytest.raises(SystemExit) as error:
+        main([mesh, "-o", str(output)])
+    assert error.value.code == 2
+    assert not output.exists()
+
+
+def test_yaw_aims_the_camera(mesh, tmp_path):
+    # The default camera looks from +z at the origin, which is a yaw of 180 degrees
+    looking, turned = str(tmp_path / "looking.npy"), str(tmp_path / "turned.npy")
+    assert main([mesh, "-o", looking]) == 0
+    assert main([mesh, "-o", turned, "--rotation", "0", "180", "0"]) == 0
+    assert np.allclose(np.load(looking), np.load(turned))
+
+
+def test_pitch_and_yaw_need_no_target(mesh, tmp_path):
+    with pytest.raises(SystemExit):
+        main([mesh, "-o", str(tmp_path / "out.npy"), "--rotation", "10", "0", "0", "--target", "0", "0", "0"])
+
+
+def test_cli_does_not_import_tkinter(mesh, tmp_path):
+    code = ("import sys, render_cli; "
+            "render_cli.main(sys.argv[1:]); "
+            "assert 'tkinter' not in sys.modules")
+    result = subprocess.run([sys.executable, "-c", code, mesh, "-o", str(tmp_path / "out.png")], cwd=SRC,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,28 @@
+import pickle
+import numpy as np
+from benchmark import make_sphere
+from shared import SharedGeometry
+
+
+def test_pickle_maps_the_same_memory():
+    obj = make_sphere(5000)
+    vertices = obj.vertices.copy()
+    with SharedGeometry(obj) as shared:
+        payload = pickle.dumps(obj)
+        assert len(payload) < shared.nbytes // 10
+        copy = pickle.loads(payload)
+        assert np.array_equal(copy.vertices, vertices)
+        assert not copy.vertices.flags.writeable
+        del copy
+    assert obj._shared_geometry is None
+    assert shared.handle.segments == []
+
+
+def test_unlink_gives_back_private_arrays():
+    obj = make_sphere(500)
+    edges = obj.edges.copy()
+    shared = SharedGeometry(obj)
+    shared.unlink()
+    assert obj.edges.flags.writeable
+    assert np.array_equal(obj.edges, edges)
+    assert len(pickle.dumps(obj)) > obj.vertices.nbytes
@@ -0,0 +1,38 @@
+import numpy as np
+from camera import Camera
+from timeline import CameraTimeline, Keyframe
+
+
+def forward_error(views: np.ndarray, positions: np.ndarray, targets: np.ndarray) -> float:
+    """Largest angle (degrees) between the view matrices' forward axis (-z row) and the direction to the target."""
+    forward = -views[:, 2, :3]
+    direction = targets - positions
+    direction /= np.linalg.norm(direction, axis=1, keepdims=True)
+    return float(np.degrees(np.arccos(np.clip(np.sum(forward * direction, axis=1), -1, 1))).max())
+
+
+def test_frames_look_at_the_target_between_keys():
+    timeline = CameraTimeline([
+        Keyframe(0.0, np.array([0.0, 1.0, 6.0]), np.array([0.0, 0.0, 0.0]), roll=0.0),
+        Keyframe(1.0, np.array([5.0, 2.0, 1.0]), np.array([1.0, 0.5, 0.0]), roll=0.3),
+        Keyframe(2.0, np.array([-2.0, 3.0, -5.0]), np.array([-1.0, 0.0, 1.0]), roll=-0.2),
+    ])
+    times = np.linspace(0.0, 2.0, 41)
+    views = timeline.evaluate(times)
+    assert forward_error(views, timeline.evaluate_positions(times), timeline.evaluate_targets(times)) < 1e-4
+
+
+def test_orbit_frames_look_at_the_target_between_keys():
+    timeline = CameraTimeline([Keyframe.orbit(0.0, 5.0, 0.0, 0.2), Keyframe.orbit(1.0, 4.0, 1.5, 0.6),
+                               Keyframe.orbit(2.0, 6.0, 3.0, -0.3, target=(1.0, 0.0, 0.0))])
+    times = np.linspace(0.0, 2.0, 41)
+    views = timeline.evaluate(times)
+    assert forward_error(views, timeline.evaluate_positions(times), timeline.evaluate_targets(times)) < 1e-4
+
+
+def test_keys_match_the_camera_view_matrix():
+    cameras = [Camera(1.0, 2.0, 5.0, roll=0.4), Camera(-3.0, 1.0, 2.0, target=np.array([0.5, 0.0, -1.0]))]
+    timeline = CameraTimeline([Keyframe.from_camera(float(i), cam) for i, cam in enumerate(cameras)])
+    views = timeline.evaluate([0.0, 1.0])
+    for view, cam in zip(views, cameras):
+        np.testing.assert_allclose(view, cam.get_view_matrix(), atol=1e-12)
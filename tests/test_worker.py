@@ -0,0 +1,33 @@
+from benchmark import make_sphere
+from camera import Camera
+from worker import ProjectionWorker
+
+
+class CancelAfter(ProjectionWorker):
+    """Reports the job as superseded after `checks` cancellation checks."""
+
+    def __init__(self, checks: int):
+        super().__init__()
+        self.checks = checks
+
+    def _cancelled(self, generation: int) -> bool:
+        self.checks -= 1
+        return self.checks < 0
+
+
+def test_projection_is_cancelled_between_stages():
+    obj, cam = make_sphere(2000), Camera()
+    items = [(obj, obj.version, obj.get_world_matrix())]
+    worker = CancelAfter(checks=2)
+    try:
+        assert worker._project(1, cam, items) is None
+        # Cancelled inside the only object, after the world and clip stages
+        assert set(worker._pipeline(obj)._cache) == {"world", "clip"}
+
+        worker.checks = 100
+        coords = worker._project(1, cam, items)
+        assert coords == worker._pipeline(obj).coords(cam, worker.all_planes, worker.cull_back_faces)
+        assert len(coords) > 0
+    finally:
+        worker.close()
+